@@ -0,0 +1,159 @@
+# mdp/compiled_mdp.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+
+from mdp.value_iteration import MDP, State, Action
+
+"""
+Compiled (array) form of an MDP and a vectorised VALUE-ITERATION.
+
+compile_mdp() calls actions_fn / transition_fn / reward_fn once per
+(s, a) and stores:
+    index[s]          state -> row number
+    P[a]              |S| x |S| sparse matrix, P[a][i, j] = P(s_j | s_i, a)
+    R[a, i]           expected immediate reward sum_j P(s_j|s_i,a) R(s_i,a,s_j)
+    available[a, i]   whether a is an action of s_i
+A Bellman backup for all states is then a few sparse matrix-vector
+products: Q[a] = R[a] + gamma * P[a] @ U.
+
+Results match value_iteration / extract_policy (up to floating-point
+summation order), including ties: extract_policy_vectorized picks the
+first maximising action in actions_fn(s) order.
+"""
+
+@dataclass
+class CompiledMDP:
+    states: List[State]
+    index: Dict[State, int]
+    actions: List[Action]
+    P: List[sparse.csr_matrix]
+    R: np.ndarray          # (|A|, |S|)
+    available: np.ndarray  # (|A|, |S|) bool
+    rank: np.ndarray       # (|A|, |S|) position of a in actions_fn(s); |A| if unavailable
+    terminal: np.ndarray   # (|S|,) bool, states without actions
+    gamma: float
+
+    @property
+    def n_states(self) -> int:
+        return len(self.states)
+
+    def to_utilities(self, U: np.ndarray) -> Dict[State, float]:
+        return dict(zip(self.states, U.tolist()))
+
+    def from_utilities(self, U: Dict[State, float]) -> np.ndarray:
+        return np.array([U.get(s, 0.0) for s in self.states], dtype=np.float64)
+
+    def to_policy(self, best: np.ndarray) -> Dict[State, Action]:
+        """Action-index array (-1 for terminals) -> policy dict."""
+        return {s: self.actions[a] for s, a in zip(self.states, best.tolist()) if a >= 0}
+
+
+MDPLike = Union[MDP, CompiledMDP]
+
+def compile_mdp(mdp: MDP) -> CompiledMDP:
+    states = list(mdp.states)
+    index = {s: i for i, s in enumerate(states)}
+    n = len(states)
+
+    actions: List[Action] = []
+    a_index: Dict[Action, int] = {}
+    rows: List[List[int]] = []
+    cols: List[List[int]] = []
+    probs: List[List[float]] = []
+    R: List[np.ndarray] = []
+    available: List[np.ndarray] = []
+    rank: List[np.ndarray] = []
+
+    for i, s in enumerate(states):
+        for pos, a in enumerate(mdp.actions_fn(s)):
+            k = a_index.get(a)
+            if k is None:
+                k = a_index[a] = len(actions)
+                actions.append(a)
+                rows.append([]); cols.append([]); probs.append([])
+                R.append(np.zeros(n)); available.append(np.zeros(n, dtype=bool))
+                rank.append(np.full(n, np.iinfo(np.int32).max, dtype=np.int32))
+            available[k][i] = True
+            rank[k][i] = pos
+            r_exp = 0.0
+            for s2, p in mdp.transition_fn(s, a):
+                r_exp += p * mdp.reward_fn(s, a, s2)
+                j = index.get(s2)
+                if j is not None:  # unknown successors contribute U = 0, like U.get(s2, 0.0)
+                    rows[k].append(i); cols[k].append(j); probs[k].append(p)
+            R[k][i] = r_exp
+
+    P = [sparse.csr_matrix((probs[k], (rows[k], cols[k])), shape=(n, n)) for k in range(len(actions))]
+    if actions:
+        R_arr, avail_arr, rank_arr = np.vstack(R), np.vstack(available), np.vstack(rank)
+    else:
+        R_arr, avail_arr, rank_arr = np.zeros((0, n)), np.zeros((0, n), dtype=bool), np.zeros((0, n), dtype=np.int32)
+    return CompiledMDP(states=states, index=index, actions=actions, P=P, R=R_arr,
+                       available=avail_arr, rank=rank_arr, terminal=~avail_arr.any(axis=0),
+                       gamma=mdp.gamma)
+
+def _compiled(mdp: MDPLike) -> CompiledMDP:
+    return mdp if isinstance(mdp, CompiledMDP) else compile_mdp(mdp)
+
+
+# ==========================
+# Vectorised Bellman backup
+# ==========================
+def q_values(cmdp: CompiledMDP, U: np.ndarray) -> np.ndarray:
+    """(|A|, |S|) matrix of Q(s, a); -inf where a is not available in s."""
+    Q = np.empty((len(cmdp.actions), cmdp.n_states))
+    for k, P_a in enumerate(cmdp.P):
+        Q[k] = cmdp.R[k] + cmdp.gamma * (P_a @ U)
+    Q[~cmdp.available] = -np.inf
+    return Q
+
+def bellman_backup(cmdp: CompiledMDP, U: np.ndarray) -> np.ndarray:
+    """max_a Q(s, a) for every state; terminals keep their current utility."""
+    if not cmdp.actions:
+        return U.copy()
+    return np.where(cmdp.terminal, U, q_values(cmdp, U).max(axis=0))
+
+def greedy_actions(cmdp: CompiledMDP, U: np.ndarray) -> np.ndarray:
+    """
+    argmax_a Q(s, a) as action indices (-1 for terminals). Exact ties go to
+    the action listed first by actions_fn(s), as in extract_policy.
+    """
+    n = cmdp.n_states
+    if not cmdp.actions:
+        return np.full(n, -1, dtype=np.int64)
+    Q = q_values(cmdp, U)
+    best = Q.max(axis=0)
+    tied = (Q == best) & cmdp.available
+    first = np.where(tied, cmdp.rank, np.iinfo(np.int32).max).argmin(axis=0)
+    return np.where(cmdp.terminal, -1, first)
+
+def solve_value_iteration(cmdp: CompiledMDP, eps: float) -> Tuple[np.ndarray, int]:
+    """Array-level VALUE-ITERATION; returns (U, number of sweeps)."""
+    threshold = eps * (1.0 - cmdp.gamma) / cmdp.gamma if cmdp.gamma < 1.0 else eps
+    active = ~cmdp.terminal
+    U = np.zeros(cmdp.n_states)
+    sweeps = 0
+    while True:
+        U_prime = bellman_backup(cmdp, U)
+        sweeps += 1
+        delta = float(np.abs(U_prime - U)[active].max(initial=0.0))
+        U = U_prime
+        if delta <= threshold:
+            return U, sweeps
+
+
+# ==========================
+# Drop-in replacements for value_iteration / extract_policy
+# ==========================
+def value_iteration_vectorized(mdp: MDPLike, eps: float) -> Dict[State, float]:
+    cmdp = _compiled(mdp)
+    U, _ = solve_value_iteration(cmdp, eps)
+    return cmdp.to_utilities(U)
+
+def extract_policy_vectorized(mdp: MDPLike, U: Dict[State, float]) -> Dict[State, Action]:
+    cmdp = _compiled(mdp)
+    return cmdp.to_policy(greedy_actions(cmdp, cmdp.from_utilities(U)))
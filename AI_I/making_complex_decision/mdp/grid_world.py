@@ -0,0 +1,131 @@
+# mdp/grid_world.py
+from __future__ import annotations
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from mdp.compiled_mdp import CompiledMDP
+from mdp.value_iteration import MDP, State, Action
+
+"""
+The book's stochastic grid world (Fig. 17.1) and scalable versions of it.
+
+Coordinates are (x, y) with (1, 1) bottom left, as in pretty_print_grid.
+The intended move happens with probability 1 - noise, each perpendicular
+move with noise / 2; bumping into a wall or the edge means staying put.
+R(s, a, s') is the reward for entering s': the terminal's value when s' is
+terminal, otherwise step_reward. Terminals have no actions.
+
+compile_grid_world() builds the same model straight into a CompiledMDP
+with NumPy, for worlds too large to enumerate through Python callables.
+"""
+
+MOVES: Dict[Action, Tuple[int, int]] = {'U': (0, 1), 'D': (0, -1), 'L': (-1, 0), 'R': (1, 0)}
+PERPENDICULAR: Dict[Action, Tuple[Action, Action]] = {
+    'U': ('L', 'R'), 'D': ('L', 'R'), 'L': ('U', 'D'), 'R': ('U', 'D'),
+}
+
+def build_grid_world(cols: int,
+                     rows: int,
+                     walls: Iterable[State],
+                     terminals: Dict[State, float],
+                     step_reward: float = -0.04,
+                     noise: float = 0.2,
+                     gamma: float = 1.0) -> MDP:
+    wall_set: Set[State] = set(walls)
+    states: List[State] = [(x, y) for y in range(1, rows + 1) for x in range(1, cols + 1)
+                           if (x, y) not in wall_set]
+
+    def move(s: State, a: Action) -> State:
+        dx, dy = MOVES[a]
+        s2 = (s[0] + dx, s[1] + dy)
+        if not (1 <= s2[0] <= cols and 1 <= s2[1] <= rows) or s2 in wall_set:
+            return s
+        return s2
+
+    def actions_fn(s: State) -> Iterable[Action]:
+        return () if s in terminals else ('U', 'D', 'L', 'R')
+
+    def transition_fn(s: State, a: Action) -> List[Tuple[State, float]]:
+        side1, side2 = PERPENDICULAR[a]
+        return [(move(s, a), 1.0 - noise), (move(s, side1), noise / 2), (move(s, side2), noise / 2)]
+
+    def reward_fn(s: State, a: Action, s2: State) -> float:
+        return terminals.get(s2, step_reward)
+
+    return MDP(states=states, actions_fn=actions_fn, transition_fn=transition_fn,
+               reward_fn=reward_fn, gamma=gamma)
+
+def book_grid_world(gamma: float = 1.0) -> Tuple[MDP, Set[State], Dict[State, float]]:
+    """4x3 world: wall at (2,2), +1 at (4,3), -1 at (4,2)."""
+    walls = {(2, 2)}
+    terminals = {(4, 3): 1.0, (4, 2): -1.0}
+    return build_grid_world(4, 3, walls, terminals, gamma=gamma), walls, terminals
+
+def large_grid_world(cols: int, rows: int, wall_every: int = 7,
+                     gamma: float = 0.95) -> Tuple[MDP, Set[State], Dict[State, float]]:
+    """
+    Scalable benchmark world: a regular pattern of wall posts, a +1 terminal
+    in the top-right corner and a -1 terminal just below it.
+    """
+    walls = {(x, y) for x in range(2, cols, wall_every) for y in range(2, rows, wall_every)}
+    terminals = {(cols, rows): 1.0, (cols, max(1, rows - 1)): -1.0}
+    walls -= set(terminals)
+    return build_grid_world(cols, rows, walls, terminals, gamma=gamma), walls, terminals
+
+def compile_grid_world(cols: int,
+                       rows: int,
+                       walls: Iterable[State],
+                       terminals: Dict[State, float],
+                       step_reward: float = -0.04,
+                       noise: float = 0.2,
+                       gamma: float = 1.0) -> CompiledMDP:
+    """Vectorised equivalent of compile_mdp(build_grid_world(...)) (same state order)."""
+    blocked = np.zeros((rows, cols), dtype=bool)          # [y - 1, x - 1]
+    for x, y in walls:
+        blocked[y - 1, x - 1] = True
+    free = ~blocked
+    ids = np.full((rows, cols), -1, dtype=np.int64)
+    ids[free] = np.arange(int(free.sum()))
+    n = int(free.sum())
+    ys, xs = np.nonzero(free)                             # row-major == state order
+
+    reward_at = np.full((rows, cols), step_reward)        # reward for entering a cell
+    is_terminal = np.zeros((rows, cols), dtype=bool)
+    for (x, y), r in terminals.items():
+        reward_at[y - 1, x - 1] = r
+        is_terminal[y - 1, x - 1] = True
+    terminal = is_terminal[ys, xs]
+
+    def target(a: Action) -> Tuple[np.ndarray, np.ndarray]:
+        dx, dy = MOVES[a]
+        ty, tx = ys + dy, xs + dx
+        ok = (tx >= 0) & (tx < cols) & (ty >= 0) & (ty < rows)
+        ok[ok] = free[ty[ok], tx[ok]]
+        ty, tx = np.where(ok, ty, ys), np.where(ok, tx, xs)  # bump -> stay
+        return ids[ty, tx], reward_at[ty, tx]
+
+    actions = ['U', 'D', 'L', 'R']
+    moved = {a: target(a) for a in actions}
+    live = np.nonzero(~terminal)[0]
+    P, R = [], np.zeros((len(actions), n))
+    for k, a in enumerate(actions):
+        side1, side2 = PERPENDICULAR[a]
+        outcomes = ((a, 1.0 - noise), (side1, noise / 2), (side2, noise / 2))
+        row_parts, col_parts, data_parts = [], [], []
+        for d, p in outcomes:
+            to, rew = moved[d]
+            row_parts.append(live)
+            col_parts.append(to[live])
+            data_parts.append(np.full(live.size, p))
+            R[k] += p * rew
+        P.append(sparse.csr_matrix((np.concatenate(data_parts),
+                                    (np.concatenate(row_parts), np.concatenate(col_parts))), shape=(n, n)))
+    R[:, terminal] = 0.0
+
+    available = np.repeat(~terminal[None, :], len(actions), axis=0)
+    rank = np.where(available, np.arange(len(actions))[:, None], np.iinfo(np.int32).max).astype(np.int32)
+    states = list(zip((xs + 1).tolist(), (ys + 1).tolist()))
+    return CompiledMDP(states=states, index={s: i for i, s in enumerate(states)}, actions=actions,
+                       P=P, R=R, available=available, rank=rank, terminal=terminal, gamma=gamma)
@@ -0,0 +1,179 @@
+# mdp/policy_iteration.py
+from __future__ import annotations
+from typing import Dict, Optional, Tuple
+import time
+import warnings
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from mdp.compiled_mdp import (CompiledMDP, MDPLike, _compiled, greedy_actions,
+                              q_values, solve_value_iteration)
+from mdp.value_iteration import State, Action
+
+"""
+POLICY-ITERATION and modified policy iteration over a CompiledMDP.
+
+policy_iteration():
+    repeat
+        U ← POLICY-EVALUATION(π, U, mdp)      exact: (I − γ P_π) U = R_π
+        π ← greedy(U), keeping π(s) unless another action is strictly better
+    until π is unchanged
+Each evaluation is one sparse linear solve, so a handful of iterations
+replace the thousands of sweeps value_iteration needs for γ ≥ 0.99.
+
+modified_policy_iteration() evaluates π with k sweeps of
+U ← R_π + γ P_π U instead of the solve, and stops on the same
+Bellman-error test as value_iteration (δ ≤ ε(1−γ)/γ).
+
+Terminals keep U = 0, as in value_iteration. Under γ = 1 a policy that
+never reaches a terminal has no finite utility; policy_iteration then
+falls back to k iterative sweeps for that step and keeps improving.
+
+Both return (U, policy) dicts; the policy is extract_policy(mdp, U).
+"""
+
+def policy_matrices(cmdp: CompiledMDP, best: np.ndarray) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """(P_π, R_π) for an action-index policy (-1 = terminal, row of zeros)."""
+    n = cmdp.n_states
+    P_pi = sparse.csr_matrix((n, n))
+    R_pi = np.zeros(n)
+    for k, P_a in enumerate(cmdp.P):
+        chosen = best == k
+        if chosen.any():
+            P_pi = P_pi + sparse.diags(chosen.astype(np.float64)) @ P_a
+            R_pi[chosen] = cmdp.R[k, chosen]
+    return P_pi.tocsr(), R_pi
+
+def policy_evaluation(cmdp: CompiledMDP, best: np.ndarray) -> Optional[np.ndarray]:
+    """Exact U_π by sparse solve; None when the system is singular (γ = 1, improper π)."""
+    P_pi, R_pi = policy_matrices(cmdp, best)
+    A = sparse.identity(cmdp.n_states, format="csc") - cmdp.gamma * P_pi.tocsc()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        U = spsolve(A, R_pi)
+    return U if np.all(np.isfinite(U)) else None
+
+def iterative_policy_evaluation(cmdp: CompiledMDP, best: np.ndarray, U: np.ndarray, k: int) -> np.ndarray:
+    """k sweeps of U ← R_π + γ P_π U starting from U."""
+    P_pi, R_pi = policy_matrices(cmdp, best)
+    for _ in range(k):
+        U = R_pi + cmdp.gamma * (P_pi @ U)
+    return U
+
+def _improve(cmdp: CompiledMDP, U: np.ndarray, best: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Greedy policy w.r.t. U that only switches action on a strict improvement; also returns max_a Q."""
+    Q = q_values(cmdp, U)
+    q_max = Q.max(axis=0)
+    live = ~cmdp.terminal
+    idx = np.nonzero(live)[0]
+    q_old = Q[best[idx], idx]
+    tol = 1e-12 * (1.0 + np.abs(q_max[idx]))
+    switch = q_max[idx] > q_old + tol
+    new = best.copy()
+    new[idx[switch]] = greedy_actions(cmdp, U)[idx[switch]]
+    return new, np.where(live, q_max, U)
+
+
+# ==========================
+# Array-level solvers
+# ==========================
+def solve_policy_iteration(cmdp: CompiledMDP, k_fallback: int = 20,
+                           best: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """Returns (U, policy indices, improvement iterations, fallback evaluation sweeps)."""
+    U = np.zeros(cmdp.n_states)
+    if best is None:
+        best = greedy_actions(cmdp, U)
+    iterations = sweeps = 0
+    while True:
+        iterations += 1
+        U_exact = policy_evaluation(cmdp, best)
+        if U_exact is None:
+            U = iterative_policy_evaluation(cmdp, best, U, k_fallback)
+            sweeps += k_fallback
+        else:
+            U = U_exact
+        new, _ = _improve(cmdp, U, best)
+        if U_exact is not None and np.array_equal(new, best):
+            return U, best, iterations, sweeps
+        best = new
+
+def solve_modified_policy_iteration(cmdp: CompiledMDP, eps: float,
+                                    k: int = 20) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """Returns (U, policy indices, improvement iterations, evaluation sweeps)."""
+    threshold = eps * (1.0 - cmdp.gamma) / cmdp.gamma if cmdp.gamma < 1.0 else eps
+    active = ~cmdp.terminal
+    U = np.zeros(cmdp.n_states)
+    best = greedy_actions(cmdp, U)
+    iterations = sweeps = 0
+    while True:
+        iterations += 1
+        best, U_backup = _improve(cmdp, U, best)
+        delta = float(np.abs(U_backup - U)[active].max(initial=0.0))
+        if delta <= threshold:
+            return U_backup, best, iterations, sweeps
+        U = iterative_policy_evaluation(cmdp, best, U_backup, k)
+        sweeps += k
+
+
+# ==========================
+# Same inputs/outputs as value_iteration + extract_policy
+# ==========================
+def policy_iteration(mdp: MDPLike) -> Tuple[Dict[State, float], Dict[State, Action]]:
+    cmdp = _compiled(mdp)
+    U, _, _, _ = solve_policy_iteration(cmdp)
+    return cmdp.to_utilities(U), cmdp.to_policy(greedy_actions(cmdp, U))
+
+def modified_policy_iteration(mdp: MDPLike, eps: float,
+                              k: int = 20) -> Tuple[Dict[State, float], Dict[State, Action]]:
+    cmdp = _compiled(mdp)
+    U, _, _, _ = solve_modified_policy_iteration(cmdp, eps, k)
+    return cmdp.to_utilities(U), cmdp.to_policy(greedy_actions(cmdp, U))
+
+
+# ==========================
+# Benchmark: VI vs PI vs MPI across gammas
+# ==========================
+def run_policy_iteration_benchmark(size: int = 100, gammas=(0.9, 0.99, 0.999),
+                                   eps: float = 1e-4, k: int = 20,
+                                   reference_size: int = 15) -> None:
+    """
+    Wall-clock time and iteration/sweep counts on large_grid_world(size, size).
+    'sweeps' = full Bellman sweeps for VI, evaluation sweeps for PI/MPI.
+    The dict-based value_iteration is timed on a reference_size world only.
+    """
+    from mdp.grid_world import compile_grid_world, large_grid_world
+    from mdp.value_iteration import value_iteration
+
+    print(f"\nPolicy iteration benchmark: {size}x{size} grid world, eps={eps}, k={k}")
+    print(f"{'gamma':>7} {'solver':<22} {'time (s)':>9} {'iters':>7} {'sweeps':>7} {'max|dU|':>9}")
+    for gamma in gammas:
+        mdp, walls, terminals = large_grid_world(reference_size, reference_size, gamma=gamma)
+        t0 = time.perf_counter()
+        value_iteration(mdp, eps)
+        t_ref = time.perf_counter() - t0
+        print(f"{gamma:>7} {f'value_iteration {reference_size}x{reference_size}':<22} {t_ref:>9.3f}")
+
+        _, walls, terminals = large_grid_world(size, size, gamma=gamma)
+        cmdp = compile_grid_world(size, size, walls, terminals, gamma=gamma)
+        t0 = time.perf_counter()
+        U_pi, _, iters, sweeps = solve_policy_iteration(cmdp)
+        t = time.perf_counter() - t0
+        rows = [("policy_iteration", t, iters, sweeps, U_pi)]
+
+        t0 = time.perf_counter()
+        U_vi, vi_sweeps = solve_value_iteration(cmdp, eps)
+        rows.append(("value_iteration (vec)", time.perf_counter() - t0, "", vi_sweeps, U_vi))
+
+        t0 = time.perf_counter()
+        U_mpi, _, iters, sweeps = solve_modified_policy_iteration(cmdp, eps, k)
+        rows.append((f"modified PI (k={k})", time.perf_counter() - t0, iters, sweeps, U_mpi))
+
+        for name, t, iters, sweeps, U in rows:
+            err = float(np.abs(U - U_pi).max())
+            print(f"{gamma:>7} {name:<22} {t:>9.3f} {iters!s:>7} {sweeps!s:>7} {err:>9.2e}")
+
+
+if __name__ == "__main__":
+    run_policy_iteration_benchmark()
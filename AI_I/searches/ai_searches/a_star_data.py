@@ -1,11 +1,13 @@
 from __future__ import annotations
 from typing import Iterable, List, Tuple
 
-from ai_searches.a_star import Problem, a_star_search, print_solution, Node
+from ai_searches.a_star import a_star_search, print_solution, Node
+from ai_searches.grid_problem import UnitGridProblem
+from ai_searches.heuristics import manhattan
 
 Coord = Tuple[int, int]
 
-class GridProblem(Problem):
+class GridProblem(UnitGridProblem):
     """
     4 adjacent squares + wall
     State: (row, col)
@@ -48,10 +50,6 @@ class GridProblem(Problem):
     def action_cost(self, state: Coord, action: str, state2: Coord) -> float:
         return 1.0
 
-# -------- Heuristic: Manhattan distance (admissible & consistent in 4-neighbor grids) --------
-def manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
 # -------- Demo used by main --------
 def run_a_star_demo() -> None:
     walls = [(1, 1), (1, 2), (2, 1)]  # blocked cells
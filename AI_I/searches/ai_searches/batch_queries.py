@@ -0,0 +1,259 @@
+# ai_searches/batch_queries.py
+from __future__ import annotations
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import heapq
+import math
+import time
+
+import numpy as np
+
+from ai_searches.csr_graph import CSRGraph
+from ai_searches.mmap_graph import MmapGraph
+from ai_searches.search_core import Problem
+
+"""
+Many-to-many batch queries: thousands of (start, goal) pairs over one map.
+
+Everything per-map is done once and shared by every query:
+  * intern_problem explores a Problem (GridProblem, SimpleGraphProblem, ...)
+    once into a CSRGraph: one id per state plus the neighbour arrays;
+  * a BatchSearcher runs on the graph's scratch buffers (csr_graph._Buffers:
+    dist / parent edge / closed mark, allocated once) and, after each query,
+    only the entries that query touched are reset;
+  * without a heuristic, queries that share a start are answered by one
+    Dijkstra run that stops when all of that start's goals are settled;
+  * with workers > 1, the queries are grouped by start and split into chunks
+    over a process pool. Each worker builds its searcher once, from the CSR
+    arrays or by re-opening the graph file of an MmapGraph.
+
+Results come back as a BatchResult of flat NumPy arrays (cost, expanded,
+pushed, seconds per query; every path concatenated into one id array with
+offsets) instead of thousands of Node chains.
+"""
+
+INF = float("inf")
+
+# ==========================
+# Shared preprocessing
+# ==========================
+def intern_problem(problem: Problem, roots: Iterable[Any] = ()) -> CSRGraph:
+    """
+    Explore every state reachable from problem.initial and roots, giving each
+    an id (the label is the state itself), and store the moves as CSR arrays.
+    """
+    index: Dict[Any, int] = {}
+    src, dst, w = array('q'), array('q'), array('d')
+    queue = deque()
+    for s in [problem.initial, *roots]:
+        if s not in index:
+            index[s] = len(index)
+            queue.append(s)
+    while queue:
+        s = queue.popleft()
+        u = index[s]
+        for _, s2, step in problem.successors(s):
+            v = index.get(s2)
+            if v is None:
+                v = index[s2] = len(index)
+                queue.append(s2)
+            src.append(u)
+            dst.append(v)
+            w.append(step)
+    return CSRGraph.from_arrays(list(index), np.frombuffer(src, dtype=np.int64),
+                                np.frombuffer(dst, dtype=np.int64), np.frombuffer(w, dtype=np.float64))
+
+# ==========================
+# Results
+# ==========================
+@dataclass
+class BatchResult:
+    starts: np.ndarray        # int64 ids, one per query
+    goals: np.ndarray
+    cost: np.ndarray          # float64, inf when the goal is unreachable
+    expanded: np.ndarray      # int64; shared by the queries of one Dijkstra run
+    pushed: np.ndarray        # int64 heap pushes
+    seconds: np.ndarray       # float64 wall time; a shared run's time is split evenly
+    path_offsets: np.ndarray  # int64[q + 1]: path i is path_nodes[off[i]:off[i+1]]
+    path_nodes: np.ndarray    # int64 ids of all paths, concatenated
+    labels: Sequence[Any]
+
+    def __len__(self) -> int:
+        return len(self.cost)
+
+    def path(self, i: int) -> List[Any]:
+        """Label path of query i ([] when unreachable)."""
+        lo, hi = self.path_offsets[i], self.path_offsets[i + 1]
+        return [self.labels[v] for v in self.path_nodes[lo:hi].tolist()]
+
+    def stats(self) -> Dict[str, float]:
+        found = np.isfinite(self.cost)
+        return {"queries": len(self), "found": int(found.sum()),
+                "mean_cost": float(self.cost[found].mean()) if found.any() else INF,
+                "mean_expanded": float(self.expanded.mean()) if len(self) else 0.0,
+                "total_seconds": float(self.seconds.sum())}
+
+# ==========================
+# Searcher with reusable buffers
+# ==========================
+class BatchSearcher:
+    """
+    Dijkstra / A* over a CSRGraph with buffers reused across queries.
+    coords ((n, 2) array) enables A* with h = h_scale * manhattan or
+    euclidean distance between node coordinates (h_scale must keep it
+    admissible, e.g. the smallest cost per unit of distance).
+    """
+    def __init__(self, graph: CSRGraph, coords: Optional[np.ndarray] = None,
+                 metric: str = "manhattan", h_scale: float = 1.0):
+        if metric not in ("manhattan", "euclidean"):
+            raise ValueError(f"unknown metric {metric!r}")
+        self.graph = graph
+        self.indptr, self.indices, self.weights = graph._views()
+        self.buffers = graph._buffers()
+        self.metric, self.h_scale = metric, h_scale
+        if coords is not None:
+            coords = np.asarray(coords, dtype=np.float64)
+            self.cx, self.cy = coords[:, 0].tolist(), coords[:, 1].tolist()
+        else:
+            self.cx = self.cy = None
+
+    def _heuristic(self, t: int):
+        if self.cx is None:
+            return None
+        cx, cy, k = self.cx, self.cy, self.h_scale
+        gx, gy = cx[t], cy[t]
+        if self.metric == "manhattan":
+            return lambda v: k * (abs(cx[v] - gx) + abs(cy[v] - gy))
+        return lambda v: k * math.hypot(cx[v] - gx, cy[v] - gy)
+
+    def search(self, s: int, targets: Sequence[int]) -> Tuple[Dict[int, Tuple[float, List[int]]], int, int]:
+        """
+        One run from s until every target is settled (A* needs exactly one
+        target). Returns ({target: (cost, path ids)}, expanded, pushed).
+        """
+        h = self._heuristic(targets[0]) if len(targets) == 1 else None
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        buffers = self.buffers
+        dist, parent_edge, closed, touched = buffers.dist, buffers.parent_edge, buffers.mark, buffers.touched
+        pending = set(targets)
+        found: Dict[int, Tuple[float, List[int]]] = {}
+        dist[s] = 0.0
+        touched.append(s)
+        heap = [(h(s) if h else 0.0, 0.0, s)]
+        expanded = pushed = 0
+        try:
+            while heap and pending:
+                _, g, u = heapq.heappop(heap)
+                if closed[u] or g > dist[u]:
+                    continue
+                closed[u] = 1
+                if u in pending:
+                    pending.discard(u)
+                    found[u] = (g, self.graph._path_ids(parent_edge, u)[0])
+                    if not pending:
+                        break
+                expanded += 1
+                for e in range(indptr[u], indptr[u + 1]):
+                    v = indices[e]
+                    g2 = g + weights[e]
+                    if g2 < dist[v]:
+                        if dist[v] == INF:
+                            touched.append(v)
+                        dist[v] = g2
+                        parent_edge[v] = e
+                        closed[v] = 0      # re-open: only matters for an inconsistent h
+                        heapq.heappush(heap, (g2 + h(v) if h else g2, g2, v))
+                        pushed += 1
+            return found, expanded, pushed
+        finally:
+            buffers.reset()
+
+    def run(self, starts: np.ndarray, goals: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Answer queries (starts[i], goals[i]). Returns the per-query arrays
+        (cost, expanded, pushed, seconds, path lengths) and the concatenated paths.
+        """
+        q = len(starts)
+        cost = np.full(q, INF)
+        expanded = np.zeros(q, dtype=np.int64)
+        pushed = np.zeros(q, dtype=np.int64)
+        seconds = np.zeros(q)
+        paths: List[List[int]] = [[] for _ in range(q)]
+
+        if self.cx is None:
+            groups: Dict[int, List[int]] = {}
+            for i, s in enumerate(starts.tolist()):
+                groups.setdefault(s, []).append(i)
+            runs = [(s, queries) for s, queries in groups.items()]
+        else:
+            runs = [(int(starts[i]), [i]) for i in range(q)]
+
+        for s, queries in runs:
+            t0 = time.perf_counter()
+            found, n_expanded, n_pushed = self.search(s, [int(goals[i]) for i in queries])
+            secs = (time.perf_counter() - t0) / len(queries)
+            for i in queries:
+                hit = found.get(int(goals[i]))
+                if hit is not None:
+                    cost[i], paths[i] = hit
+                expanded[i], pushed[i], seconds[i] = n_expanded, n_pushed, secs
+        lengths = np.array([len(p) for p in paths], dtype=np.int64)
+        nodes = np.fromiter((v for p in paths for v in p), dtype=np.int64, count=int(lengths.sum()))
+        return cost, expanded, pushed, seconds, lengths, nodes
+
+# ==========================
+# Process pool
+# ==========================
+_WORKER: Optional[BatchSearcher] = None
+
+def _init_worker(spec: Tuple[Any, ...], coords: Optional[np.ndarray], metric: str, h_scale: float) -> None:
+    global _WORKER
+    if spec[0] == "file":
+        graph = MmapGraph.open(spec[1])
+    else:
+        _, indptr, indices, weights = spec
+        graph = CSRGraph(range(len(indptr) - 1), indptr, indices, weights)
+    _WORKER = BatchSearcher(graph, coords, metric, h_scale)
+
+def _run_chunk(starts: np.ndarray, goals: np.ndarray) -> Tuple[np.ndarray, ...]:
+    return _WORKER.run(starts, goals)
+
+def run_batch(graph: CSRGraph, pairs: Sequence[Tuple[Any, Any]],
+              coords: Optional[np.ndarray] = None, metric: str = "manhattan", h_scale: float = 1.0,
+              workers: int = 1, chunk_size: int = 256) -> BatchResult:
+    """
+    Answer every (start label, goal label) pair. coords enables A* (see
+    BatchSearcher); without it, queries sharing a start share one Dijkstra.
+    workers > 1 spreads chunks of start-grouped queries over processes.
+    """
+    starts = np.array([graph.id_of(a) for a, _ in pairs], dtype=np.int64)
+    goals = np.array([graph.id_of(b) for _, b in pairs], dtype=np.int64)
+    order = np.argsort(starts, kind="stable")   # same-start queries land in one chunk
+    chunks = [order[i:i + chunk_size] for i in range(0, len(order), chunk_size)]
+
+    if workers <= 1 or len(chunks) <= 1:
+        searcher = BatchSearcher(graph, coords, metric, h_scale)
+        parts = [searcher.run(starts[c], goals[c]) for c in chunks]
+    else:
+        spec = (("file", graph.path) if isinstance(graph, MmapGraph)
+                else ("arrays", graph.indptr, graph.indices, graph.weights))
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(spec, coords, metric, h_scale)) as pool:
+            parts = list(pool.map(_run_chunk, [starts[c] for c in chunks], [goals[c] for c in chunks]))
+
+    q = len(pairs)
+    cost, expanded, pushed, seconds = np.full(q, INF), np.zeros(q, np.int64), np.zeros(q, np.int64), np.zeros(q)
+    lengths = np.zeros(q, dtype=np.int64)
+    for c, (c_cost, c_exp, c_push, c_sec, c_len, _) in zip(chunks, parts):
+        cost[c], expanded[c], pushed[c], seconds[c], lengths[c] = c_cost, c_exp, c_push, c_sec, c_len
+    offsets = np.zeros(q + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    nodes = np.empty(int(offsets[-1]), dtype=np.int64)
+    for c, (*_, c_len, c_nodes) in zip(chunks, parts):
+        c_off = np.concatenate([[0], np.cumsum(c_len)])
+        for k, i in enumerate(c.tolist()):
+            nodes[offsets[i]:offsets[i + 1]] = c_nodes[c_off[k]:c_off[k + 1]]
+    return BatchResult(starts, goals, cost, expanded, pushed, seconds, offsets, nodes, graph.labels)
@@ -0,0 +1,22 @@
+# ai_searches/batch_queries_data.py
+from __future__ import annotations
+
+import numpy as np
+
+from ai_searches.a_star_data import GridProblem
+from ai_searches.batch_queries import intern_problem, run_batch
+
+# ---------- Demo runner used by main ----------
+def run_batch_queries_demo() -> None:
+    walls = [(1, 1), (1, 2), (2, 1)]
+    problem = GridProblem(grid_rows=4, grid_cols=4, walls=walls, start=(0, 0), goal=(3, 3))
+    graph = intern_problem(problem)            # once per map: states -> ids, moves -> CSR arrays
+    coords = np.asarray(graph.labels, dtype=np.float64)
+    pairs = [((0, 0), (3, 3)), ((0, 0), (2, 2)), ((3, 0), (0, 3)), ((2, 2), (2, 2))]
+
+    print(f"\n== Batch queries on 4x4 grid ({graph.n_nodes} cells) ==")
+    for label, kwargs in (("Dijkstra, shared per start", {}), ("A*, manhattan", {"coords": coords})):
+        result = run_batch(graph, pairs, **kwargs)
+        print(label)
+        for i, (a, b) in enumerate(pairs):
+            print(f"  {a} -> {b}: cost={result.cost[i]:g} expanded={result.expanded[i]} path={result.path(i)}")
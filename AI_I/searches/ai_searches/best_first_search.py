@@ -1,7 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional
-import heapq
+from typing import Any, Callable, Dict, Optional, Union
+
+from ai_searches.frontiers import BucketQueue, IndexedHeap, make_frontier
+from ai_searches.node_pool import PoolNode, pooled_best_first_search
+from ai_searches.search_core import Node, Problem, expand
+from ai_searches.search_stats import SearchStats, instrumented
 
 """
 Best-First Search expands the node with the smallest value of f(n),
@@ -12,69 +15,38 @@ f(n) can be g(n) + h(n) : real cost so far + estimated remaining cost. Type is i
 """
 
 
-# ==========================
-# Core search data structures
-# ==========================
-@dataclass(order=True)
-class PrioritizedItem:
-    priority: float
-    count: int
-    node: "Node"
-
-@dataclass
-class Node:
-    state: Any
-    parent: Optional["Node"] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0
-
-    def path(self) -> List["Node"]:
-        n, acc = self, []
-        while n:
-            acc.append(n)
-            n = n.parent
-        return list(reversed(acc))
-
-# ==========================
-# Problem Interface
-# ==========================
-class Problem:
-    def __init__(self, initial: Any, goal: Any):
-        self.initial = initial
-        self.goal = goal
-
-    def is_goal(self, state: Any) -> bool:
-        return state == self.goal
-
-    def actions(self, state: Any) -> Iterable[Any]:
-        raise NotImplementedError
-
-    def result(self, state: Any, action: Any) -> Any:
-        raise NotImplementedError
-
-    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
-        return 1.0  # default unit cost
-
 # ==========================
 # Generic BEST-FIRST-SEARCH
 # ==========================
-def expand(problem: Problem, node: Node) -> Iterable[Node]:
-    s = node.state
-    for action in problem.actions(s):
-        s2 = problem.result(s, action)
-        cost = node.path_cost + problem.action_cost(s, action, s2)
-        yield Node(state=s2, parent=node, action=action, path_cost=cost)
+@instrumented(heuristics=("f",))
+def best_first_search(problem: Problem,
+                      f: Callable[[Node], float],
+                      node_store: bool = False,
+                      frontier: Optional[Union[IndexedHeap, BucketQueue]] = None,
+                      stats: Optional[SearchStats] = None) -> Optional[Union[Node, PoolNode]]:
+    """
+    The frontier keeps one entry per state: a cheaper path to a queued
+    state updates that entry in place (decrease-key) instead of leaving a
+    stale duplicate to be popped and expanded again. Pass an empty
+    frontier to read its push/pop/update counters afterwards.
+
+    node_store=True keeps nodes in a columnar NodePool; f then receives a
+    PoolNode handle (same state/path_cost/depth attributes) and the result
+    is a PoolNode whose path() rebuilds Node objects on demand.
+    stats: an optional search_stats.SearchStats.
+    """
+    if frontier is None:
+        frontier = make_frontier(problem)
+    if node_store:
+        return pooled_best_first_search(problem, node_f=f, frontier=frontier)
 
-def best_first_search(problem: Problem, f: Callable[[Node], float]) -> Optional[Node]:
     start = Node(state=problem.initial, parent=None, action=None, path_cost=0.0)
-    frontier: List[PrioritizedItem] = []
-    counter = 0
-    heapq.heappush(frontier, PrioritizedItem(f(start), counter, start))
+    frontier.push(problem.initial, f(start), start)
 
     reached: Dict[Any, Node] = {problem.initial: start}
 
     while frontier:
-        current = heapq.heappop(frontier).node
+        _, _, current = frontier.pop()
 
         if problem.is_goal(current.state):
             return current
@@ -83,8 +55,7 @@ def best_first_search(problem: Problem, f: Callable[[Node], float]) -> Optional[
             s = child.state
             if s not in reached or child.path_cost < reached[s].path_cost:
                 reached[s] = child
-                counter += 1
-                heapq.heappush(frontier, PrioritizedItem(f(child), counter, child))
+                frontier.push(s, f(child), child)
     return None  # failure
 
 # ==========================
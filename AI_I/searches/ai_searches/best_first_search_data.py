@@ -1,11 +1,13 @@
 from __future__ import annotations
 from typing import Iterable, List, Tuple
 
-from .best_first_search import Problem, best_first_search, print_solution, Node
+from .best_first_search import best_first_search, print_solution, Node
+from .grid_problem import UnitGridProblem
+from .heuristics import manhattan
 
 Coord = Tuple[int, int]
 
-class GridProblem(Problem):
+class GridProblem(UnitGridProblem):
     """
     A simple 4-neighbor grid with walls.
     State: (row, col)
@@ -45,10 +47,6 @@ class GridProblem(Problem):
         if action == 'R': return (r, c + 1)
         return state  # should not happen
 
-# ---------- Heuristic ----------
-def manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
 # ---------- Demo runner used by main ----------
 def run_best_first_demo() -> None:
     walls = [(1, 1), (1, 2), (2, 1)]  # blocked cells
@@ -0,0 +1,237 @@
+# ai_searches/bidirectional_implicit.py
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ai_searches.frontiers import IndexedHeap
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import frontier_tracker, instrumented, watch_frontier
+
+"""
+Front-to-front bidirectional BFS / UCS for large implicit graphs.
+
+One Problem describes the forward dynamics (actions / result /
+action_cost), and a predecessors(state) callback describes the backward
+ones:
+    predecessors(state) -> iterable of (action, previous_state)
+where previous_state --action--> state is a forward move. No second,
+reversed Problem is needed, and the backward step can differ completely
+from the forward one (e.g. "+1 / *2" forward, "-1 / halve" backward).
+The search goes from problem.initial to problem.goal (a single state).
+
+Each round expands the side whose frontier is smaller. BFS expands one
+whole layer at a time and checks the new layer against the other side
+once it is complete, so the shortest meeting of that layer is picked and
+is optimal. UCS expands the batch of entries that share the lowest g.
+Paths are built only for the final meeting.
+
+bidirectional_bfs can also run on integer state ids (state_id / id_state /
+n_states). Then each side's visited set is one array('i') of depths
+(-1 = not reached), which is 4 bytes per state instead of a dict entry.
+The depths double as parent pointers when the path is rebuilt.
+"""
+
+Predecessors = Callable[[Any], Iterable[Tuple[Any, Any]]]
+
+# ==========================
+# Path reconstruction
+# ==========================
+def _layered_path(problem: Problem, predecessors: Predecessors, meet: Any,
+                  depth_f: Callable[[Any], int], depth_b: Callable[[Any], int]) -> Node:
+    """
+    Rebuild start -> meet -> goal from the two depth maps alone: walk
+    predecessors whose forward depth is one less, then successors whose
+    backward depth is one less.
+    """
+    states, actions = [meet], []
+    s = meet
+    for d in range(depth_f(meet) - 1, -1, -1):
+        action, s = next((a, p) for a, p in predecessors(s) if depth_f(p) == d)
+        actions.append(action)  # the move from s into the previous entry of states
+        states.append(s)
+    states.reverse()
+    actions.reverse()
+    actions.insert(0, None)
+    s = meet
+    for d in range(depth_b(meet) - 1, -1, -1):
+        action, s = next((a, s2) for a, s2, _ in problem.successors(s) if depth_b(s2) == d)
+        states.append(s)
+        actions.append(action)
+    return _chain(problem, states, actions)
+
+def _chain(problem: Problem, states: List[Any], actions: List[Any]) -> Node:
+    node = Node(states[0], None, None, 0.0, 0)
+    for s2, action in zip(states[1:], actions[1:]):
+        cost = node.path_cost + problem.action_cost(node.state, action, s2)
+        node = Node(s2, node, action, cost, node.depth + 1)
+    return node
+
+# ==========================
+# Bidirectional BFS (unit cost)
+# ==========================
+def _grow_hashed(layer: List[Any], depth: Dict[Any, int], other: Dict[Any, int],
+                 neighbours: Callable[[Any], Iterable[Any]]) -> Tuple[List[Any], Optional[Any]]:
+    d = depth[layer[0]] + 1
+    new: List[Any] = []
+    for s in layer:
+        for s2 in neighbours(s):
+            if s2 not in depth:
+                depth[s2] = d
+                new.append(s2)
+    # meeting check once per layer: the meeting closest to the other end wins
+    meet = min((s for s in new if s in other), key=other.__getitem__, default=None)
+    return new, meet
+
+def _grow_indexed(layer: List[int], depth: array, other: array,
+                  neighbours: Callable[[int], Iterable[int]]) -> Tuple[List[int], Optional[int]]:
+    d = depth[layer[0]] + 1
+    new: List[int] = []
+    for i in layer:
+        for j in neighbours(i):
+            if depth[j] < 0:
+                depth[j] = d
+                new.append(j)
+    meet = min((j for j in new if other[j] >= 0), key=other.__getitem__, default=None)
+    return new, meet
+
+@instrumented(expansions=("predecessors",))
+def bidirectional_bfs(problem: Problem,
+                      predecessors: Predecessors,
+                      state_id: Optional[Callable[[Any], int]] = None,
+                      id_state: Optional[Callable[[int], Any]] = None,
+                      n_states: int = 0,
+                      stats: Optional[Dict[str, int]] = None) -> Optional[Node]:
+    """
+    Shortest path in number of moves. Pass state_id, id_state and n_states
+    (ids in 0..n_states-1) to run on compact integer tables.
+    stats (optional dict) is filled with layers / reached.
+    """
+    start, goal = problem.initial, problem.goal
+    if problem.is_goal(start):
+        return Node(start, None, None, 0.0, 0)
+    indexed = state_id is not None
+
+    if indexed:
+        to_id, to_state = state_id, id_state
+        depth_f, depth_b = array('i', [-1]) * n_states, array('i', [-1]) * n_states
+
+        def forward(i: int) -> Iterable[int]:
+            s = to_state(i)
+            return [to_id(s2) for _, s2, _ in problem.successors(s)]
+
+        def backward(i: int) -> Iterable[int]:
+            return [to_id(p) for _, p in predecessors(to_state(i))]
+        grow = _grow_indexed
+        layer_f, layer_b = [to_id(start)], [to_id(goal)]
+    else:
+        depth_f, depth_b = {}, {}
+
+        def forward(s: Any) -> Iterable[Any]:
+            return [s2 for _, s2, _ in problem.successors(s)]
+
+        def backward(s: Any) -> Iterable[Any]:
+            return [p for _, p in predecessors(s)]
+        grow = _grow_hashed
+        layer_f, layer_b = [start], [goal]
+    depth_f[layer_f[0]] = 0
+    depth_b[layer_b[0]] = 0
+
+    layers = 0
+    meet = None
+    track = frontier_tracker(problem)
+    try:
+        while layer_f and layer_b and meet is None:
+            layers += 1
+            if track:
+                track(len(layer_f) + len(layer_b))
+            if len(layer_f) <= len(layer_b):
+                layer_f, meet = grow(layer_f, depth_f, depth_b, forward)
+            else:
+                layer_b, meet = grow(layer_b, depth_b, depth_f, backward)
+        if meet is None:
+            return None
+        if indexed:
+            return _layered_path(problem, predecessors, to_state(meet),
+                                 lambda s: depth_f[to_id(s)], lambda s: depth_b[to_id(s)])
+        return _layered_path(problem, predecessors, meet,
+                             lambda s: depth_f.get(s, -1), lambda s: depth_b.get(s, -1))
+    finally:
+        if stats is not None:
+            reached = (sum(1 for d in depth_f if d >= 0) + sum(1 for d in depth_b if d >= 0)
+                       if indexed else len(depth_f) + len(depth_b))
+            stats.update(layers=layers, reached=reached)
+
+# ==========================
+# Bidirectional UCS (weighted)
+# ==========================
+@instrumented(expansions=("predecessors",))
+def bidirectional_ucs(problem: Problem,
+                      predecessors: Predecessors,
+                      stats: Optional[Dict[str, int]] = None) -> Optional[Node]:
+    """
+    Cheapest path under action_cost (non-negative). Stops once the two
+    lowest frontier costs add up to at least the best meeting found.
+    stats (optional dict) is filled with batches / expanded.
+    """
+    start, goal = problem.initial, problem.goal
+    if problem.is_goal(start):
+        return Node(start, None, None, 0.0, 0)
+
+    def forward(s: Any, g: float) -> Iterable[Tuple[Any, Any, float]]:
+        for a, s2, step in problem.successors(s):
+            yield s2, a, g + step
+
+    def backward(s: Any, g: float) -> Iterable[Tuple[Any, Any, float]]:
+        for a, p in predecessors(s):
+            yield p, a, g + problem.action_cost(p, a, s)
+
+    # state -> (g, neighbour towards this side's root, action of the forward move)
+    best_f: Dict[Any, Tuple[float, Any, Any]] = {start: (0.0, None, None)}
+    best_b: Dict[Any, Tuple[float, Any, Any]] = {goal: (0.0, None, None)}
+    open_f, open_b = watch_frontier(problem, IndexedHeap()), watch_frontier(problem, IndexedHeap())
+    open_f.push(start, 0.0)
+    open_b.push(goal, 0.0)
+    best, meet = float("inf"), None
+    batches = expanded = 0
+
+    try:
+        while open_f and open_b and open_f.peek()[1] + open_b.peek()[1] < best:
+            batches += 1
+            if len(open_f) <= len(open_b):
+                frontier, labels, other, neighbours = open_f, best_f, best_b, forward
+            else:
+                frontier, labels, other, neighbours = open_b, best_b, best_f, backward
+            g_batch = frontier.peek()[1]
+            while frontier and frontier.peek()[1] == g_batch:
+                s, g, _ = frontier.pop()
+                expanded += 1
+                for s2, action, g2 in neighbours(s, g):
+                    label = labels.get(s2)
+                    if label is not None and label[0] <= g2:
+                        continue
+                    labels[s2] = (g2, s, action)
+                    frontier.push(s2, g2)
+                    twin = other.get(s2)
+                    if twin is not None and g2 + twin[0] < best:
+                        best, meet = g2 + twin[0], s2
+        if meet is None:
+            return None
+        states, actions = [meet], []
+        s = meet
+        while best_f[s][1] is not None:
+            _, s, action = best_f[s]
+            actions.append(action)
+            states.append(s)
+        states.reverse()
+        actions.reverse()
+        actions.insert(0, None)
+        s = meet
+        while best_b[s][1] is not None:
+            _, s2, action = best_b[s]
+            states.append(s2)
+            actions.append(action)
+            s = s2
+        return _chain(problem, states, actions)
+    finally:
+        if stats is not None:
+            stats.update(batches=batches, expanded=expanded)
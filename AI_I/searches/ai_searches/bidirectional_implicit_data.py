@@ -0,0 +1,56 @@
+# ai_searches/bidirectional_implicit_data.py
+from __future__ import annotations
+from typing import Iterable, List, Tuple
+
+from ai_searches.a_star import print_solution
+from ai_searches.bidirectional_implicit import bidirectional_bfs, bidirectional_ucs
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.search_core import Problem
+
+class NumberProblem(Problem):
+    """
+    Reach `goal` from `start` with '+1' and '*2' (never above `limit`).
+    The backward moves are different ones: '-1' and halving even numbers.
+    double_cost makes '*2' more expensive than '+1' for the weighted search.
+    """
+    def __init__(self, start: int, goal: int, limit: int, double_cost: float = 1.0):
+        super().__init__(start, goal)
+        self.limit = limit
+        self.double_cost = double_cost
+
+    def actions(self, state: int) -> Iterable[str]:
+        acts = []
+        if state + 1 <= self.limit:
+            acts.append('+1')
+        if 0 < state and 2 * state <= self.limit:
+            acts.append('*2')
+        return acts
+
+    def result(self, state: int, action: str) -> int:
+        return state + 1 if action == '+1' else 2 * state
+
+    def action_cost(self, state: int, action: str, state2: int) -> float:
+        return self.double_cost if action == '*2' else 1.0
+
+    def predecessors(self, state: int) -> List[Tuple[str, int]]:
+        preds = []
+        if state - 1 >= 0:
+            preds.append(('+1', state - 1))
+        if state % 2 == 0 and state > 0:
+            preds.append(('*2', state // 2))
+        return preds
+
+# ---------- Demo runner used by main ----------
+def run_bidirectional_implicit_demo() -> None:
+    problem = NumberProblem(1, 1000, limit=2000)
+    print_solution("Bidirectional BFS, 1 -> 1000 with +1 / *2", bidirectional_bfs(problem, problem.predecessors))
+    node = bidirectional_bfs(problem, problem.predecessors,
+                             state_id=int, id_state=int, n_states=problem.limit + 1)
+    print_solution("Bidirectional BFS on integer ids", node)
+
+    weighted = NumberProblem(1, 1000, limit=2000, double_cost=5.0)
+    print_solution("Bidirectional UCS, '*2' costs 5", bidirectional_ucs(weighted, weighted.predecessors))
+
+    grid = OccupancyGridProblem.from_walls(4, 4, [(1, 1), (1, 2), (2, 1)], start=(0, 0), goal=(3, 3))
+    node = bidirectional_bfs(grid, grid.predecessors, state_id=int, id_state=int, n_states=16)
+    print_solution("Bidirectional BFS on 4x4 occupancy grid", node)
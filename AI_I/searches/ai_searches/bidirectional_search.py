@@ -1,75 +1,33 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import heapq
 
-# ==========================
-# Core data structures
-# ==========================
-@dataclass(order=True)
-class PrioritizedItem:
-    priority: float
-    count: int
-    node: "Node"
-
-@dataclass
-class Node:
-    state: Any
-    parent: Optional["Node"] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0
-
-    def path(self) -> List["Node"]:
-        n, acc = self, []
-        while n:
-            acc.append(n)
-            n = n.parent
-        return list(reversed(acc))
-
-# ==========================
-# Problem interface
-# ==========================
-class Problem:
-    def __init__(self, initial: Any, goal: Any):
-        self.initial = initial   # root state for this direction
-        self.goal = goal         # target state for this direction
-
-    def is_goal(self, state: Any) -> bool:
-        return state == self.goal
-
-    def actions(self, state: Any) -> Iterable[Any]:
-        raise NotImplementedError
-
-    def result(self, state: Any, action: Any) -> Any:
-        raise NotImplementedError
-
-    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
-        return 1.0  # default cost
-
-# ==========================
-# Expand
-# ==========================
-def expand(problem: Problem, node: Node) -> Iterable[Node]:
-    s = node.state
-    for action in problem.actions(s):
-        s2 = problem.result(s, action)
-        # g(n) path cost from start to current
-        cost = node.path_cost + problem.action_cost(s, action, s2)
-        yield Node(state=s2, parent=node, action=action, path_cost=cost)
+from ai_searches.frontiers import IndexedHeap
+from ai_searches.search_core import Node, PrioritizedItem, Problem, expand
+from ai_searches.search_stats import SearchStats, frontier_tracker, instrumented, watch_frontier
 
 # ==========================
 # Helpers for stitching a solution
 # ==========================
-def _clone_chain(nodes: List[Node]) -> Node:
-    """Clone a list of nodes into a new singly-linked chain and return the tail (last node)."""
-    head_copy = Node(state=nodes[0].state, parent=None, action=None, path_cost=0.0)
-    prev = head_copy
-    for i in range(1, len(nodes)):
-        n = nodes[i]
-        new_node = Node(state=n.state, parent=prev, action=n.action,
-                        path_cost=prev.path_cost + (0.0 if n.action is None else 1.0))
-        prev = new_node
-    return prev  # tail
+def join_paths(forward: Node, backward: Node,
+               reverse_action: Optional[Callable[[Any], Any]] = None) -> Node:
+    """
+    Extend the forward chain (start -> s) with the backward chain (goal -> s)
+    walked from s back to the goal; returns the goal node. The forward nodes are
+    reused as they are, so only the backward half is rebuilt.
+
+    Step costs come from the backward path_costs, so weighted and asymmetric
+    action_cost is kept. The forward action of a backward step is
+    reverse_action(backward action) when given, else a synthetic "→state".
+    """
+    tail = forward
+    n = backward
+    while n.parent is not None:
+        p = n.parent
+        act = reverse_action(n.action) if reverse_action is not None else f"→{p.state}"
+        tail = Node(p.state, tail, act, tail.path_cost + (n.path_cost - p.path_cost), tail.depth + 1)
+        n = p
+    return tail
 
 def join_nodes(direction: str, meet_child: Node, other_side_node: Node) -> Node:
     """
@@ -77,40 +35,10 @@ def join_nodes(direction: str, meet_child: Node, other_side_node: Node) -> Node:
     direction: 'F' if we just expanded forward side; 'B' if backward side.
     meet_child: node from the side we just expanded, ending at meeting state s
     other_side_node: node from the opposite frontier, also at state s
-    Assumption: costs are symmetric for demo; for asymmetric domains, you must handle costs carefully.
     """
-    # Forward partial path: start -> ... -> s
-    f_nodes = meet_child.path()
-
-    # Backward partial path: goal -> ... -> s
-    b_nodes = other_side_node.path()
-
-    # We need s -> ... -> goal. Reverse the backward chain and drop the meeting s to avoid duplicate.
-    b_nodes_rev = list(reversed(b_nodes))  # [s, ..., goal]
-    if len(b_nodes_rev) > 0:
-        b_nodes_rev = b_nodes_rev[1:]  # drop s
-
-    # Rebuild a single chain by cloning forward nodes, then append the reversed backward chain states.
-    # We don't carry over exact actions for backward; we mark action as None for the stitch,
-    # then add synthetic actions like '→(state)' just for readability.
-    # Build head
-    head = Node(state=f_nodes[0].state, parent=None, action=None, path_cost=0.0)
-    prev = head
-    # attach forward (skip head already added)
-    for i in range(1, len(f_nodes)):
-        st = f_nodes[i].state
-        act = f_nodes[i].action
-        cost_step = 1.0 if act is not None else 0.0
-        cur = Node(state=st, parent=prev, action=act, path_cost=prev.path_cost + cost_step)
-        prev = cur
-    # attach backward reversed tail
-    for n in b_nodes_rev:
-        # synthetic action text for clarity (optional)
-        act = f"→{n.state}"
-        cur = Node(state=n.state, parent=prev, action=act, path_cost=prev.path_cost + 1.0)
-        prev = cur
-
-    return prev  # tail = goal
+    if direction == 'F':
+        return join_paths(meet_child, other_side_node)
+    return join_paths(other_side_node, meet_child)
 
 # ==========================
 # Proceed one side
@@ -139,17 +67,19 @@ def proceed(direction_label: str,
             heapq.heappush(frontier, PrioritizedItem(f_eval(child), counter_ref[0], child))
 
         if s in reached_other:
-            candidate = join_nodes(direction_label, child, reached_other[s])
-            if current_best is None or candidate.path_cost < current_best.path_cost:
-                current_best = candidate
+            # compare costs first; only build the joined path for an improvement
+            if current_best is None or child.path_cost + reached_other[s].path_cost < current_best.path_cost:
+                current_best = join_nodes(direction_label, child, reached_other[s])
 
     return current_best
 
 # ==========================
 # BIBF-SEARCH
 # ==========================
+@instrumented(problems=("problemF", "problemB"), heuristics=("fF", "fB"))
 def bibf_search(problemF: Problem, fF: Callable[[Node], float],
-                problemB: Problem, fB: Callable[[Node], float]) -> Optional[Node]:
+                problemB: Problem, fB: Callable[[Node], float],
+                stats: Optional[SearchStats] = None) -> Optional[Node]:
     """
     Bi-directional Best-First Search.
     For optimality guarantees you'd also include a tighter termination condition (bounds).
@@ -170,8 +100,11 @@ def bibf_search(problemF: Problem, fF: Callable[[Node], float],
     heapq.heappush(frontierB, PrioritizedItem(fB(startB), cB[0], startB))
 
     solution: Optional[Node] = None
+    track = frontier_tracker(problemF)
 
     while frontierF or frontierB:
+        if track:
+            track(len(frontierF) + len(frontierB))
         # pick direction by comparing current best f-tops (tie: expand backward)
         topF = frontierF[0].priority if frontierF else float("inf")
         topB = frontierB[0].priority if frontierB else float("inf")
@@ -183,6 +116,97 @@ def bibf_search(problemF: Problem, fF: Callable[[Node], float],
 
     return solution
 
+# ==========================
+# Bidirectional A* (MM) with a sound stopping rule
+# ==========================
+class _Side:
+    """One search direction: reached table plus the open list ordered three ways."""
+    __slots__ = ("problem", "h", "reached", "by_pr", "by_f", "by_g")
+
+    def __init__(self, problem: Problem, h: Callable[[Any], float]):
+        self.problem = problem
+        self.h = h
+        self.reached: Dict[Any, Node] = {}
+        self.by_pr = watch_frontier(problem, IndexedHeap())   # max(f, 2g): the MM expansion order
+        self.by_f = IndexedHeap()    # g + h, for fmin
+        self.by_g = IndexedHeap()    # g, for gmin
+
+    def add(self, node: Node) -> None:
+        s, g = node.state, node.path_cost
+        f = g + self.h(s)
+        self.reached[s] = node
+        self.by_pr.push(s, max(f, 2 * g), node)
+        self.by_f.push(s, f)
+        self.by_g.push(s, g)
+
+    def pop(self) -> Node:
+        s, _, node = self.by_pr.pop()
+        self.by_f.remove(s)
+        self.by_g.remove(s)
+        return node
+
+    def min_of(self, heap: IndexedHeap) -> float:
+        return heap.peek()[1] if heap else float("inf")
+
+@instrumented(problems=("problemF", "problemB"), heuristics=("hF", "hB"))
+def bidirectional_a_star_search(problemF: Problem, hF: Callable[[Any], float],
+                                problemB: Problem, hB: Callable[[Any], float],
+                                epsilon: float = 0.0,
+                                reverse_action: Optional[Callable[[Any], Any]] = None,
+                                stats: Optional[Dict[str, int]] = None) -> Optional[Node]:
+    """
+    Optimal bidirectional A* (MM, Holte et al. 2016).
+
+    problemB searches from the goal over reversed edges (its result() gives a
+    predecessor and its action_cost the cost of the forward edge). hF estimates
+    the cost to the goal and hB the cost from the start; both must be admissible.
+
+    Each side expands by pr(n) = max(g + h, 2g). The side with the smaller
+    minimum pr goes next. U is the cheapest meeting found so far, and the
+    search stops as soon as
+        U <= max(C, fminF, fminB, gminF + gminB + epsilon)
+    where C = min(prminF, prminB). Every bound on the right is a lower bound on
+    any path not yet found. epsilon is the smallest action cost (0 is always
+    safe). Only the final meeting is stitched into a path (join_paths).
+    stats (optional dict) is filled with expanded / meetings.
+    """
+    F, B = _Side(problemF, hF), _Side(problemB, hB)
+    F.add(Node(state=problemF.initial, path_cost=0.0, depth=0))
+    B.add(Node(state=problemB.initial, path_cost=0.0, depth=0))
+    best = float("inf")
+    meeting: Optional[Tuple[Node, Node]] = None
+    if problemF.initial in B.reached:
+        best, meeting = 0.0, (F.reached[problemF.initial], B.reached[problemF.initial])
+    expanded = meetings = 0
+
+    try:
+        while F.by_pr and B.by_pr:
+            prF, prB = F.min_of(F.by_pr), B.min_of(B.by_pr)
+            bound = max(min(prF, prB), F.min_of(F.by_f), B.min_of(B.by_f),
+                        F.min_of(F.by_g) + B.min_of(B.by_g) + epsilon)
+            if best <= bound:
+                break
+            this, other = (F, B) if prF <= prB else (B, F)
+            node = this.pop()
+            expanded += 1
+            for child in expand(this.problem, node):
+                s = child.state
+                old = this.reached.get(s)
+                if old is not None and old.path_cost <= child.path_cost:
+                    continue
+                this.add(child)   # new state, or a cheaper path (re-opened if it was closed)
+                twin = other.reached.get(s)
+                if twin is not None and child.path_cost + twin.path_cost < best:
+                    best = child.path_cost + twin.path_cost
+                    meeting = (child, twin) if this is F else (twin, child)
+                    meetings += 1
+        if meeting is None:
+            return None
+        return join_paths(meeting[0], meeting[1], reverse_action)
+    finally:
+        if stats is not None:
+            stats.update(expanded=expanded, meetings=meetings)
+
 # ==========================
 # Helpers for printing
 # ==========================
@@ -2,13 +2,15 @@ from __future__ import annotations
 from typing import Iterable, List, Tuple, Set
 
 from ai_searches.bidirectional_search import (
-    Problem, Node,
-    bibf_search, print_solution
+    Node,
+    bibf_search, bidirectional_a_star_search, print_solution
 )
+from ai_searches.grid_problem import UnitGridProblem
+from ai_searches.heuristics import manhattan
 
 Coord = Tuple[int, int]
 
-class GridProblem(Problem):
+class GridProblem(UnitGridProblem):
     """
     4-neighbor grid with walls. Undirected moves: U/D/L/R (unit cost).
     """
@@ -48,11 +50,6 @@ class GridProblem(Problem):
     def action_cost(self, state: Coord, action: str, state2: Coord) -> float:
         return 1.0
 
-# ---------- Heuristic ----------
-# h(n)
-def manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
 # ---------- Demo runner (exported to main) ----------
 def run_bibf_demo() -> None:
     rows, cols = 6, 6
@@ -74,4 +71,11 @@ def run_bibf_demo() -> None:
         return n.path_cost + manhattan(n.state, start)
 
     node = bibf_search(problemF, fF, problemB, fB)
-    print_solution("Bi-directional Best-First (A* on both ends)", node)
\ No newline at end of file
+    print_solution("Bi-directional Best-First (A* on both ends)", node)
+
+    # Optimal bidirectional A*: stops once no better meeting is possible
+    reverse = {'U': 'D', 'D': 'U', 'L': 'R', 'R': 'L'}
+    node = bidirectional_a_star_search(problemF, lambda s: manhattan(s, goal),
+                                       problemB, lambda s: manhattan(s, start),
+                                       reverse_action=reverse.get)
+    print_solution("Bi-directional A* (MM stopping rule)", node)
@@ -0,0 +1,421 @@
+# ai_searches/csr_graph.py
+from __future__ import annotations
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import heapq
+
+import numpy as np
+
+from ai_searches.search_core import Problem
+from ai_searches.search_stats import SearchStats, instrumented, record_counts
+
+"""
+Compressed sparse row (CSR) graph backend for large explicit graphs.
+
+Node labels (any hashable: "A", 42, (r, c)) are interned to ids 0..n-1
+once. The out-edges of node u are the slice indptr[u]:indptr[u+1] of two
+flat arrays:
+    indices[e]  target node id
+    weights[e]  edge cost
+which for 10^7 edges is ~200 MB instead of several GB of nested dicts.
+
+The specialised loops (csr_bfs, csr_dfs, csr_ucs, csr_a_star) read the
+arrays through memoryviews and keep dist / parent in flat lists, so an
+edge relaxation is a few integer index operations with no string hashing
+and no Node objects. They take and return labels: a GraphPath with the
+label path, its cost and the number of expanded nodes. With stats (a
+SearchStats or a plain dict) they also report expanded / generated
+edges / frontier pushes and peak size through record_counts. The lists belong
+to the graph and are reused across queries; only the entries a query
+touched are reset (batch_queries.BatchSearcher shares them), so a short query
+on a huge graph costs no O(n) allocation.
+
+CSRProblem wraps a CSRGraph as a regular Problem (states are ids, actions
+are edge positions) for the generic searches in this package.
+"""
+
+@dataclass
+class GraphPath:
+    labels: List[Any]
+    cost: float
+    expanded: int
+
+    # Node-style names, so SearchStats and the benchmarks read it like a Node
+    @property
+    def path_cost(self) -> float:
+        return self.cost
+
+    @property
+    def depth(self) -> int:
+        return len(self.labels) - 1
+
+class CSRGraph:
+    """labels=range(n) means the labels are the ids: no label dict is built (cheap at 10^7 nodes)."""
+    def __init__(self, labels: Sequence[Any], indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.labels = labels
+        self.index: Optional[Dict[Any, int]] = (None if isinstance(labels, range) and labels.start == 0
+                                                and labels.step == 1 else
+                                                {label: i for i, label in enumerate(labels)})
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @cached_property
+    def max_integer_cost(self) -> Optional[int]:
+        """Largest weight if all weights are non-negative integers, else None (one scan, then cached)."""
+        w = self.weights
+        if len(w) and w.min() >= 0 and np.all(np.mod(w, 1) == 0):
+            return int(w.max())
+        return None
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+
+    # ---------- builders ----------
+    @classmethod
+    def from_arrays(cls, labels: Sequence[Any], src: np.ndarray, dst: np.ndarray,
+                    weights: Optional[np.ndarray] = None) -> "CSRGraph":
+        """Build from parallel id arrays (src[k] -> dst[k] costs weights[k]); edge order per node is kept."""
+        n = len(labels)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        w = np.ones(len(src)) if weights is None else np.asarray(weights, dtype=np.float64)
+        order = np.argsort(src, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        index_type = np.int32 if n < 2**31 else np.int64
+        return cls(labels, indptr, dst[order].astype(index_type), w[order])
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Any, ...]], directed: bool = True,
+                   labels: Optional[Iterable[Any]] = None) -> "CSRGraph":
+        """
+        edges: (u, v) or (u, v, weight) label tuples. Labels are interned in
+        first-seen order (after the optional `labels`, which may list isolated nodes).
+        """
+        index: Dict[Any, int] = {}
+        if labels is not None:
+            for label in labels:
+                index.setdefault(label, len(index))
+        src, dst, w = array('q'), array('q'), array('d')
+        for edge in edges:
+            u = index.setdefault(edge[0], len(index))
+            v = index.setdefault(edge[1], len(index))
+            cost = float(edge[2]) if len(edge) > 2 else 1.0
+            src.append(u)
+            dst.append(v)
+            w.append(cost)
+            if not directed:
+                src.append(v)
+                dst.append(u)
+                w.append(cost)
+        return cls.from_arrays(list(index), np.frombuffer(src, dtype=np.int64),
+                               np.frombuffer(dst, dtype=np.int64), np.frombuffer(w, dtype=np.float64))
+
+    @classmethod
+    def from_dict(cls, graph: Mapping[Any, Union[Mapping[Any, float], Sequence[Any]]]) -> "CSRGraph":
+        """
+        Build from the dict layouts used by the demos: {u: {v: cost}} (ucs_data,
+        breadth_first_search_data) or {u: [v, ...]} (dfs, unit costs).
+        """
+        def edges() -> Iterable[Tuple[Any, Any, float]]:
+            for u, nbrs in graph.items():
+                if isinstance(nbrs, Mapping):
+                    for v, cost in nbrs.items():
+                        yield u, v, cost
+                else:
+                    for v in nbrs:
+                        yield u, v, 1.0
+        return cls.from_edges(edges(), directed=True, labels=graph.keys())
+
+    # ---------- lookups ----------
+    def id_of(self, label: Any) -> int:
+        if self.index is None:
+            if isinstance(label, (int, np.integer)) and 0 <= label < len(self.labels):
+                return int(label)
+            raise KeyError(f"unknown node label {label!r}")
+        try:
+            return self.index[label]
+        except KeyError:
+            raise KeyError(f"unknown node label {label!r}") from None
+
+    def neighbours(self, label: Any) -> List[Tuple[Any, float]]:
+        """(label, cost) of the out-edges of label."""
+        u = self.id_of(label)
+        lo, hi = self.indptr[u], self.indptr[u + 1]
+        return [(self.labels[v], float(w)) for v, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist())]
+
+    def _views(self) -> Tuple[memoryview, memoryview, memoryview]:
+        return memoryview(self.indptr), memoryview(self.indices), memoryview(self.weights)
+
+    def _buffers(self) -> "_Buffers":
+        buffers = getattr(self, "_scratch", None)  # MmapGraph skips CSRGraph.__init__
+        if buffers is None:
+            buffers = self._scratch = _Buffers(self.n_nodes)
+        return buffers
+
+    def _path_ids(self, parent_edge: List[int], goal: int) -> Tuple[List[int], float]:
+        """Walk parent edges back from goal; an edge's source is found by bisecting indptr."""
+        ids, cost = [goal], 0.0
+        v = goal
+        while parent_edge[v] >= 0:
+            e = parent_edge[v]
+            cost += float(self.weights[e])
+            v = int(np.searchsorted(self.indptr, e, side="right")) - 1
+            ids.append(v)
+        ids.reverse()
+        return ids, cost
+
+    def _path(self, parent_edge: List[int], goal: int, expanded: int) -> GraphPath:
+        ids, cost = self._path_ids(parent_edge, goal)
+        return GraphPath([self.labels[i] for i in ids], cost, expanded)
+
+# ==========================
+# Specialised loops
+# ==========================
+NO_EDGE = -1
+INF = float("inf")
+
+class _Buffers:
+    """
+    Per-graph scratch lists for the loops below and batch_queries.BatchSearcher.
+    Every node a query writes to is recorded in touched, and reset() restores
+    just those entries. dist is only allocated by the first weighted query.
+    """
+    def __init__(self, n: int):
+        self.n = n
+        self.parent_edge = [NO_EDGE] * n
+        self.mark = bytearray(n)
+        self._dist: Optional[List[float]] = None
+        self.touched = array('q')  # typed: no int object is kept alive per reached node
+
+    @property
+    def dist(self) -> List[float]:
+        if self._dist is None:
+            self._dist = [INF] * self.n
+        return self._dist
+
+    def reset(self) -> None:
+        if 4 * len(self.touched) > self.n:  # most of the graph: refill in C instead
+            self.parent_edge[:] = [NO_EDGE] * self.n
+            self.mark[:] = bytes(self.n)
+            if self._dist is not None:
+                self._dist[:] = [INF] * self.n
+            del self.touched[:]
+            return
+        parent_edge, mark, dist = self.parent_edge, self.mark, self._dist
+        for v in self.touched:
+            parent_edge[v] = NO_EDGE
+            mark[v] = 0
+            if dist is not None:
+                dist[v] = INF
+        del self.touched[:]
+
+@instrumented(problems=(), frontiers=())  # raw arrays: the loop counts for itself
+def csr_bfs(graph: CSRGraph, start: Any, goal: Any,
+            stats: Optional[Dict[str, Any]] = None) -> Optional[GraphPath]:
+    """Fewest edges from start to goal (cost reports their weight sum)."""
+    s, t = graph.id_of(start), graph.id_of(goal)
+    indptr, indices, _ = graph._views()
+    buffers = graph._buffers()
+    parent_edge, seen, touched = buffers.parent_edge, buffers.mark, buffers.touched
+    seen[s] = 1
+    touched.append(s)
+    frontier = deque([s])
+    expanded = generated = peak = 0
+    try:
+        while frontier:
+            u = frontier.popleft()
+            if u == t:
+                return graph._path(parent_edge, t, expanded)
+            expanded += 1
+            lo, hi = indptr[u], indptr[u + 1]
+            generated += hi - lo
+            for e in range(lo, hi):
+                v = indices[e]
+                if not seen[v]:
+                    seen[v] = 1
+                    parent_edge[v] = e
+                    touched.append(v)
+                    frontier.append(v)
+            if len(frontier) > peak:
+                peak = len(frontier)
+        return None
+    finally:
+        record_counts(stats, expanded=expanded, generated=generated, frontier_pushes=len(touched),
+                      peak_frontier=peak)
+        buffers.reset()
+
+@instrumented(problems=(), frontiers=())
+def csr_dfs(graph: CSRGraph, start: Any, goal: Any,
+            stats: Optional[Dict[str, Any]] = None) -> Optional[GraphPath]:
+    """
+    Iterative DFS in neighbour order (same visiting order as dfs.dfs_iterative).
+    The path follows the edges DFS actually took to each node.
+    """
+    s, t = graph.id_of(start), graph.id_of(goal)
+    indptr, indices, _ = graph._views()
+    buffers = graph._buffers()
+    parent_edge, visited, touched = buffers.parent_edge, buffers.mark, buffers.touched
+    stack = [(s, NO_EDGE)]
+    expanded = generated = pushed = peak = 0
+    try:
+        while stack:
+            u, via = stack.pop()
+            if visited[u]:
+                continue
+            visited[u] = 1
+            parent_edge[u] = via
+            touched.append(u)
+            if u == t:
+                return graph._path(parent_edge, t, expanded)
+            expanded += 1
+            lo, hi = indptr[u], indptr[u + 1]
+            generated += hi - lo
+            size = len(stack)
+            for e in range(hi - 1, lo - 1, -1):
+                v = indices[e]
+                if not visited[v]:
+                    stack.append((v, e))
+            pushed += len(stack) - size
+            if len(stack) > peak:
+                peak = len(stack)
+        return None
+    finally:
+        record_counts(stats, expanded=expanded, generated=generated, frontier_pushes=pushed + 1,
+                      peak_frontier=peak)
+        buffers.reset()
+
+@instrumented(problems=(), frontiers=())
+def csr_ucs(graph: CSRGraph, start: Any, goal: Any,
+            stats: Optional[Dict[str, Any]] = None) -> Optional[GraphPath]:
+    """Dijkstra with a lazy-deletion heap of (g, id)."""
+    return csr_a_star(graph, start, goal, None, stats=stats)
+
+@instrumented(problems=(), frontiers=())  # h may be an array, so it is counted here, not wrapped
+def csr_a_star(graph: CSRGraph, start: Any, goal: Any,
+               h: Optional[Union[np.ndarray, Sequence[float], Callable[[int], float]]],
+               stats: Optional[Dict[str, Any]] = None) -> Optional[GraphPath]:
+    """
+    A* over ids. h is a per-node array (indexed by id, e.g. built from the
+    labels' coordinates) or a callable on ids; None means h = 0 (UCS).
+    A callable is evaluated only for the nodes the search reaches, once each.
+    """
+    s, t = graph.id_of(start), graph.id_of(goal)
+    indptr, indices, weights = graph._views()
+    memo: Optional[Dict[int, float]] = None
+    if h is None:
+        hv = None
+    elif callable(h):
+        hv, memo = None, {}
+    elif isinstance(h, np.ndarray):
+        hv = memoryview(np.ascontiguousarray(h, dtype=np.float64))  # no copy for a float64 array
+    else:
+        hv = h
+    buffers = graph._buffers()
+    dist, parent_edge, touched = buffers.dist, buffers.parent_edge, buffers.touched
+    dist[s] = 0.0
+    touched.append(s)
+    if memo is not None:
+        h0 = memo[s] = float(h(s))
+    else:
+        h0 = hv[s] if hv is not None else 0.0
+    heap = [(h0, 0.0, s)]
+    expanded = generated = pushed = peak = 0
+    try:
+        while heap:
+            _, g, u = heapq.heappop(heap)
+            if g > dist[u]:
+                continue                       # stale entry: u was reached more cheaply since
+            if u == t:
+                return graph._path(parent_edge, t, expanded)
+            expanded += 1
+            lo, hi = indptr[u], indptr[u + 1]
+            generated += hi - lo
+            for e in range(lo, hi):
+                v = indices[e]
+                g2 = g + weights[e]
+                if g2 < dist[v]:
+                    if dist[v] == INF:
+                        touched.append(v)
+                    dist[v] = g2
+                    parent_edge[v] = e
+                    if memo is not None:
+                        hv2 = memo.get(v)
+                        if hv2 is None:
+                            hv2 = memo[v] = float(h(v))
+                    else:
+                        hv2 = hv[v] if hv is not None else 0.0
+                    heapq.heappush(heap, (g2 + hv2, g2, v))
+                    pushed += 1
+            if len(heap) > peak:
+                peak = len(heap)
+        return None
+    finally:
+        record_counts(stats, expanded=expanded, generated=generated, frontier_pushes=pushed + 1,
+                      peak_frontier=peak, h_calls=len(memo) if memo is not None else 0)
+        buffers.reset()
+
+# ==========================
+# Edge-list loader
+# ==========================
+def load_edge_list(path: str, directed: bool = False, delimiter: Optional[str] = None,
+                   label_type: Callable[[str], Any] = str, comment: str = "#") -> CSRGraph:
+    """
+    Read "u v [weight]" lines (whitespace-separated unless delimiter is given;
+    blank lines and lines starting with `comment` are skipped).
+    label_type converts label strings, e.g. int for numeric node ids.
+    """
+    def edges() -> Iterable[Tuple[Any, ...]]:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith(comment):
+                    continue
+                parts = line.split(delimiter)
+                if len(parts) < 2:
+                    raise ValueError(f"{path}: expected 'u v [weight]', got {line!r}")
+                u, v = label_type(parts[0]), label_type(parts[1])
+                yield (u, v, float(parts[2])) if len(parts) > 2 else (u, v)
+    return CSRGraph.from_edges(edges(), directed=directed)
+
+# ==========================
+# Problem adapter
+# ==========================
+class CSRProblem(Problem):
+    """
+    CSRGraph as a Problem for the generic searches: states are node ids and
+    an action is the position of an out-edge. Use label_path() on the result.
+    """
+    def __init__(self, graph: CSRGraph, start: Any, goal: Any):
+        super().__init__(graph.id_of(start), graph.id_of(goal))
+        self.graph = graph
+        self._indptr, self._indices, self._weights = graph._views()
+
+    def actions(self, state: int) -> Iterable[int]:
+        return range(self._indptr[state], self._indptr[state + 1])
+
+    def result(self, state: int, action: int) -> int:
+        return self._indices[action]
+
+    def action_cost(self, state: int, action: int, state2: int) -> float:
+        return self._weights[action]
+
+    def successors(self, state: int) -> Iterable[Tuple[int, int, float]]:
+        """Zip of the node's edge positions, targets and weights: array slices, no per-edge calls."""
+        lo, hi = self._indptr[state], self._indptr[state + 1]
+        return zip(range(lo, hi), self._indices[lo:hi], self._weights[lo:hi])
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return self.graph.max_integer_cost
+
+    def label_path(self, node: Any) -> List[Any]:
+        return [self.graph.labels[n.state] for n in node.path()] if node is not None else []
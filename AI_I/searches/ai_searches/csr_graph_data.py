@@ -0,0 +1,21 @@
+# ai_searches/csr_graph_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search
+from ai_searches.csr_graph import CSRGraph, CSRProblem, csr_bfs, csr_dfs, csr_ucs
+from ai_searches.ucs_data import build_sample_graph
+
+# ---------- Demo runner used by main ----------
+def run_csr_graph_demo() -> None:
+    graph = CSRGraph.from_dict(build_sample_graph())
+    print(f"\n== CSR graph: {graph.n_nodes} nodes, {graph.n_edges} edges ==")
+    print("indptr :", graph.indptr.tolist())
+    print("indices:", graph.indices.tolist())
+    for label, search in (("BFS", csr_bfs), ("DFS", csr_dfs), ("UCS", csr_ucs)):
+        result = search(graph, "A", "G")
+        print(f"{label}: {' -> '.join(result.labels)}  cost={result.cost}  expanded={result.expanded}")
+
+    # the same graph through the generic Problem interface
+    problem = CSRProblem(graph, "A", "G")
+    node = a_star_search(problem, lambda s: 0.0)
+    print("A* via CSRProblem:", " -> ".join(problem.label_path(node)), f" cost={node.path_cost}")
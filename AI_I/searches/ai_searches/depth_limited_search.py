@@ -1,54 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Iterable, Optional, List
+from typing import Any, Optional, List
 
-# ==========================
-# Core node
-# ==========================
-@dataclass
-class Node:
-    state: Any
-    parent: Optional["Node"] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0
-    depth: int = 0
-
-    def path(self) -> List["Node"]:
-        n, acc = self, []
-        while n:
-            acc.append(n)
-            n = n.parent
-        return list(reversed(acc))
-
-# ==========================
-# Abstract Problem
-# ==========================
-class Problem:
-    def __init__(self, initial: Any, goal: Any):
-        self.initial = initial
-        self.goal = goal
-
-    def is_goal(self, state: Any) -> bool:
-        return state == self.goal
-
-    def actions(self, state: Any) -> Iterable[Any]:
-        raise NotImplementedError
-
-    def result(self, state: Any, action: Any) -> Any:
-        raise NotImplementedError
-
-    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
-        return 1.0
-
-# ==========================
-# EXPAND (generate successors)
-# ==========================
-def expand(problem: Problem, node: Node) -> Iterable[Node]:
-    s = node.state
-    for action in problem.actions(s):
-        s2 = problem.result(s, action)
-        cost = node.path_cost + problem.action_cost(s, action, s2)
-        yield Node(state=s2, parent=node, action=action, path_cost=cost, depth=node.depth + 1)
+from ai_searches.search_core import Node, Problem, expand
+from ai_searches.search_stats import SearchStats, frontier_tracker, instrumented
 
 # ==========================
 # Cycle check (on current path)
@@ -66,11 +20,16 @@ def is_cycle(node: Node) -> bool:
 # Depth-Limited Search (DLS)
 # Returns: ("success", node) | ("cutoff", None) | ("failure", None)
 # ==========================
-def depth_limited_search(problem: Problem, limit: int) -> tuple[str, Optional[Node]]:
+@instrumented()
+def depth_limited_search(problem: Problem, limit: int,
+                         stats: Optional[SearchStats] = None) -> tuple[str, Optional[Node]]:
     stack: List[Node] = [Node(state=problem.initial, depth=0)]
     result: str = "failure"  # will flip to "cutoff" if we ever exceed the limit
+    track = frontier_tracker(problem)
 
     while stack:
+        if track:
+            track(len(stack))
         node = stack.pop()
 
         if problem.is_goal(node.state):
@@ -2,36 +2,54 @@
 from __future__ import annotations
 from typing import Dict, List, Any, Optional, Set
 
+from ai_searches.search_stats import SearchStats, instrumented, record_counts
+
 Graph = Dict[Any, List[Any]]
 
-def dfs_recursive(graph: Graph, start: Any, goal: Optional[Any] = None):
+def _record_dfs(stats: Optional[Dict[str, Any]], path: List[Any], found_goal: bool, **counts: int) -> None:
+    record_counts(stats, **counts)
+    if found_goal and isinstance(stats, SearchStats):
+        stats.found = True
+        stats.depth = len(path) - 1
+        stats.cost = float(stats.depth)
+
+@instrumented(problems=(), frontiers=())  # dict graph, no Problem: counts are kept by hand
+def dfs_recursive(graph: Graph, start: Any, goal: Optional[Any] = None,
+                  stats: Optional[Dict[str, Any]] = None):
     """
     Practical DFS (recursive) for graphs.
     - Uses a global visited set (no cycle on re-visits)
     - Keeps a parent map for path reconstruction to goal
+    - stats: expanded / generated neighbours / deepest recursion (peak_frontier)
     Returns: {"order": [...], "path": [...], "visited": set(...)}
     """
     visited: Set[Any] = set()
     parent: Dict[Any, Optional[Any]] = {start: None}
     order: List[Any] = []
     found_goal = False
+    expanded = generated = peak = 0
 
-    def visit(u: Any) -> bool:
-        nonlocal found_goal
+    def visit(u: Any, depth: int) -> bool:
+        nonlocal found_goal, expanded, generated, peak
         visited.add(u)
         order.append(u)
+        if depth > peak:
+            peak = depth
         if goal is not None and u == goal:
             found_goal = True
             return True
+        expanded += 1
+        neighbors = graph.get(u, [])
+        generated += len(neighbors)
         # iterate neighbors in the given order (stable, predictable)
-        for v in graph.get(u, []):
+        for v in neighbors:
             if v not in visited:
                 parent[v] = u
-                if visit(v):
+                if visit(v, depth + 1):
                     return True
         return False
 
-    visit(start)
+    visit(start, 1)
 
     path: List[Any] = []
     if goal is not None and found_goal:
@@ -44,14 +62,19 @@ def dfs_recursive(graph: Graph, start: Any, goal: Optional[Any] = None):
         # No goal specified or not found -> path = [start] for consistency
         path = [start]
 
+    _record_dfs(stats, path, found_goal, expanded=expanded, generated=generated,
+                frontier_pushes=len(visited), peak_frontier=peak)
     return {"order": order, "path": path, "visited": visited}
 
 
-def dfs_iterative(graph: Graph, start: Any, goal: Optional[Any] = None):
+@instrumented(problems=(), frontiers=())
+def dfs_iterative(graph: Graph, start: Any, goal: Optional[Any] = None,
+                  stats: Optional[Dict[str, Any]] = None):
     """
     Practical DFS (iterative, stack-based) for graphs.
     - Uses a global visited set
     - Keeps parent for path reconstruction
+    - stats: expanded / generated neighbours / stack pushes and peak size
     NOTE: To mimic recursive order, push neighbors in reverse order.
     """
     visited: Set[Any] = set()
@@ -60,8 +83,12 @@ def dfs_iterative(graph: Graph, start: Any, goal: Optional[Any] = None):
 
     stack: List[Any] = [start]
     found_goal = False
+    expanded = generated = peak = 0
+    pushed = 1
 
     while stack:
+        if len(stack) > peak:
+            peak = len(stack)
         u = stack.pop()
         if u in visited:
             continue
@@ -72,13 +99,16 @@ def dfs_iterative(graph: Graph, start: Any, goal: Optional[Any] = None):
             found_goal = True
             break
 
+        expanded += 1
         neighbors = graph.get(u, [])
+        generated += len(neighbors)
         # push reversed to simulate the same LIFO exploration order as recursion
         for v in reversed(neighbors):
             if v not in visited:
                 if v not in parent:
                     parent[v] = u
                 stack.append(v)
+                pushed += 1
 
     path: List[Any] = []
     if goal is not None and found_goal:
@@ -90,4 +120,6 @@ def dfs_iterative(graph: Graph, start: Any, goal: Optional[Any] = None):
     else:
         path = [start]
 
+    _record_dfs(stats, path, found_goal, expanded=expanded, generated=generated,
+                frontier_pushes=pushed, peak_frontier=peak)
     return {"order": order, "path": path, "visited": visited}
\ No newline at end of file
@@ -0,0 +1,117 @@
+# ai_searches/distance_field.py
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, List, Optional, Union
+import math
+
+import numpy as np
+
+from ai_searches.frontiers import make_frontier
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.search_core import Problem
+
+"""
+Cost-to-go for every state in one pass, instead of one search per start.
+
+For a unit-cost OccupancyGridProblem the field is a breadth-first
+wavefront: each layer is an integer array of cell ids, and all of its
+successors are produced with a few NumPy operations per move direction.
+Any other Problem falls back to a single Dijkstra over its actions.
+
+Moves are assumed reversible with equal cost (true for the grid problems
+here), so distances *from* the source are distances *to* it.
+A DistanceField is callable, so it can be passed straight to
+a_star_search as h_provider (it is the perfect heuristic). It is inf on
+states that cannot reach the source; with start and goal disconnected,
+A* then returns None.
+"""
+
+INF = math.inf
+
+class DistanceField:
+    """dist(state) -> cost to the source; inf where the source is unreachable."""
+
+    def __init__(self, source: Any, values: Union[array, Dict[Any, float]],
+                 grid: Optional[OccupancyGridProblem] = None):
+        self.source = source
+        self.grid = grid
+        self._values = values
+        self._dense = isinstance(values, array)
+
+    def __call__(self, state: Any) -> float:
+        if self._dense:
+            return self._values[state]
+        return self._values.get(state, INF)
+
+    def as_array(self) -> np.ndarray:
+        """Dense grids only: (rows, cols) float64 view of the distances."""
+        if not self._dense:
+            raise TypeError("as_array() needs a grid distance field")
+        return np.frombuffer(self._values, dtype=np.float64).reshape(self.grid.rows, self.grid.cols)
+
+    def descend(self, problem: Problem, state: Any) -> List[Any]:
+        """
+        Route from state to the source by always stepping to the neighbour
+        with the smallest distance (many agents can share one field).
+        Returns [] when the source is unreachable.
+        """
+        if self(state) == INF:
+            return []
+        route = [state]
+        while self(state) > 0:
+            state = min((s2 for _, s2, _ in problem.successors(state)), key=self)
+            route.append(state)
+        return route
+
+
+# ==========================
+# Unit-cost grids: NumPy wavefront BFS
+# ==========================
+def grid_distance_field(problem: OccupancyGridProblem, source: Optional[Any] = None) -> DistanceField:
+    """Breadth-first wavefront from source (default: the goal) over the whole grid."""
+    src = problem.goal if source is None else problem.cell_id(source)
+    n = problem.rows * problem.cols
+    dist = np.full(n, np.inf)
+    mask = np.frombuffer(problem.move_mask, dtype=np.uint8)
+    steps = [(np.uint8(1 << k), problem.offset[a]) for k, (a, _, _) in enumerate(problem.moves)]
+
+    if problem.passable(src):
+        dist[src] = 0.0
+        layer = np.array([src], dtype=np.int64)
+        level = 0
+        while layer.size:
+            level += 1
+            layer_mask = mask[layer]
+            parts = [layer[(layer_mask & bit) != 0] + off for bit, off in steps]
+            nxt = np.unique(np.concatenate(parts))
+            nxt = nxt[np.isinf(dist[nxt])]
+            dist[nxt] = level
+            layer = nxt
+
+    return DistanceField(src, array('d', dist.tobytes()), grid=problem)
+
+
+# ==========================
+# General case: one Dijkstra
+# ==========================
+def dijkstra_distance_field(problem: Problem, source: Optional[Any] = None) -> DistanceField:
+    """Dijkstra from source (default: the goal) over problem.actions/result/action_cost."""
+    src = problem.goal if source is None else source
+    dist: Dict[Any, float] = {src: 0.0}
+    frontier = make_frontier(problem)
+    frontier.push(src, 0.0)
+    while frontier:
+        s, d, _ = frontier.pop()
+        for _, s2, step in problem.successors(s):
+            d2 = d + step
+            if d2 < dist.get(s2, INF):
+                dist[s2] = d2
+                frontier.push(s2, d2)
+    return DistanceField(src, dist)
+
+
+def distance_field(problem: Problem, source: Optional[Any] = None) -> DistanceField:
+    """Pick the wavefront for unit-cost occupancy grids, Dijkstra for everything else."""
+    if isinstance(problem, OccupancyGridProblem) and problem.integer_cost_bound() == 1:
+        return grid_distance_field(problem, source)
+    return dijkstra_distance_field(problem, source)
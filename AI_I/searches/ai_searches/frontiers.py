@@ -0,0 +1,263 @@
+# ai_searches/frontiers.py
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple, Union
+import math
+
+from ai_searches.search_stats import watch_frontier
+
+"""
+Frontier (priority queue) implementations shared by the best-first family.
+
+A frontier holds at most one entry per key (state). push() inserts a new
+key or re-prioritises the existing entry in place (decrease-key), so a
+cheaper path never leaves a stale duplicate behind to be popped and
+expanded again.
+
+Interface used by the searches:
+    push(key, priority, item) / pop() -> (key, priority, item)
+    len(frontier), key in frontier, priority_of(key)
+    IndexedHeap also has peek() and remove(key)
+    pushes / pops / updates counters
+
+IndexedHeap works for any priorities; BucketQueue gives O(1) operations
+when priorities are small non-negative integers (and falls back to an
+IndexedHeap internally when they are not). make_frontier() chooses
+between them from Problem.integer_cost_bound().
+"""
+
+# ==========================
+# Indexed binary heap
+# ==========================
+class IndexedHeap:
+    """
+    Binary min-heap with a key -> position index.
+    Entries are [priority, count, key, item]; count breaks ties FIFO, the
+    same way the old PrioritizedItem counter did.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[list] = []
+        self._pos: Dict[Any, int] = {}
+        self._counter = 0
+        self.pushes = 0   # new keys inserted
+        self.pops = 0
+        self.updates = 0  # in-place re-prioritisations (decrease-key)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._pos
+
+    def priority_of(self, key: Any) -> float:
+        return self._heap[self._pos[key]][0]
+
+    def push(self, key: Any, priority: float, item: Any = None) -> None:
+        """Insert key, or replace its entry (priority and item) if already queued."""
+        self._counter += 1
+        i = self._pos.get(key)
+        if i is None:
+            self.pushes += 1
+            entry = [priority, self._counter, key, item]
+            self._heap.append(entry)
+            i = len(self._heap) - 1
+            self._pos[key] = i
+            self._sift_up(i)
+            return
+        self.updates += 1
+        entry = self._heap[i]
+        old = entry[0]
+        entry[0], entry[1], entry[3] = priority, self._counter, item
+        if priority <= old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def pop(self) -> Tuple[Any, float, Any]:
+        heap = self._heap
+        last = heap.pop()
+        if heap:
+            top = heap[0]
+            heap[0] = last
+            self._pos[last[2]] = 0
+            self._sift_down(0)
+        else:
+            top = last
+        del self._pos[top[2]]
+        self.pops += 1
+        return top[2], top[0], top[3]
+
+    def peek(self) -> Tuple[Any, float, Any]:
+        top = self._heap[0]
+        return top[2], top[0], top[3]
+
+    def remove(self, key: Any) -> Any:
+        """Delete key's entry; returns its item."""
+        heap = self._heap
+        i = self._pos.pop(key)
+        entry = heap[i]
+        last = heap.pop()
+        if i < len(heap):
+            heap[i] = last
+            self._pos[last[2]] = i
+            if last < entry:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        return entry[3]
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos = self._heap, self._pos
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            p = heap[parent]
+            if entry < p:
+                heap[i] = p
+                pos[p[2]] = i
+                i = parent
+            else:
+                break
+        heap[i] = entry
+        pos[entry[2]] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos = self._heap, self._pos
+        n = len(heap)
+        entry = heap[i]
+        child = 2 * i + 1
+        while child < n:
+            right = child + 1
+            if right < n and heap[right] < heap[child]:
+                child = right
+            c = heap[child]
+            if c < entry:
+                heap[i] = c
+                pos[c[2]] = i
+                i = child
+                child = 2 * i + 1
+            else:
+                break
+        heap[i] = entry
+        pos[entry[2]] = i
+
+    def stats(self) -> Dict[str, int]:
+        return {"pushes": self.pushes, "pops": self.pops, "updates": self.updates}
+
+
+# ==========================
+# Bucket queue (Dial)
+# ==========================
+class BucketQueue:
+    """
+    Dial's bucket queue: bucket b holds the keys with priority b and a
+    cursor walks the buckets upwards. For small non-negative integer
+    priorities push, pop and decrease-key are O(1), plus the cursor walk,
+    which is O(max priority) over a whole search. Equal priorities pop
+    LIFO, which favours deeper nodes on f-ties.
+
+    A priority that is fractional, negative, above max_bucket or not finite
+    (e.g. an inexact heuristic on an integer-cost problem, or h = inf for a
+    state that cannot reach the goal) moves every entry into an IndexedHeap
+    once; from then on the queue delegates to that heap.
+    """
+
+    def __init__(self, max_bucket: int = 1 << 22) -> None:
+        self._buckets: List[Optional[Dict[Any, list]]] = []
+        self._bucket_of: Dict[Any, int] = {}
+        self._cursor = 0
+        self._size = 0
+        self._counter = 0
+        self._max_bucket = max_bucket
+        self._heap: Optional[IndexedHeap] = None
+        self.pushes = 0
+        self.pops = 0
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Any) -> bool:
+        if self._heap is not None:
+            return key in self._heap
+        return key in self._bucket_of
+
+    def priority_of(self, key: Any) -> float:
+        if self._heap is not None:
+            return self._heap.priority_of(key)
+        return self._buckets[self._bucket_of[key]][key][0]
+
+    def push(self, key: Any, priority: float, item: Any = None) -> None:
+        """Insert key, or move it to the bucket of its new priority."""
+        new = key not in self
+        if self._heap is None:
+            b = int(priority) if math.isfinite(priority) else -1
+            if b == priority and 0 <= b <= self._max_bucket:
+                self._push_bucket(key, b, priority, item)
+            else:
+                self._spill()
+        if self._heap is not None:
+            self._heap.push(key, priority, item)
+        # counted only once the entry is in
+        if new:
+            self.pushes += 1
+            self._size += 1
+        else:
+            self.updates += 1
+
+    def _push_bucket(self, key: Any, b: int, priority: float, item: Any) -> None:
+        old = self._bucket_of.get(key)
+        if old is not None:
+            del self._buckets[old][key]
+        buckets = self._buckets
+        if b >= len(buckets):
+            buckets.extend([None] * (b + 1 - len(buckets)))
+        bucket = buckets[b]
+        if bucket is None:
+            bucket = buckets[b] = {}
+        self._counter += 1
+        bucket[key] = [priority, self._counter, key, item]
+        self._bucket_of[key] = b
+        if b < self._cursor:
+            self._cursor = b
+
+    def _spill(self) -> None:
+        heap = IndexedHeap()
+        for bucket in self._buckets:
+            if bucket:
+                for priority, _, key, item in bucket.values():
+                    heap.push(key, priority, item)
+        self._heap = heap
+        self._buckets, self._bucket_of = [], {}
+
+    def pop(self) -> Tuple[Any, float, Any]:
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+        self._size -= 1
+        self.pops += 1
+        if self._heap is not None:
+            return self._heap.pop()
+        buckets = self._buckets
+        b = self._cursor
+        while not buckets[b]:
+            b += 1
+        self._cursor = b
+        _, entry = buckets[b].popitem()
+        del self._bucket_of[entry[2]]
+        return entry[2], entry[0], entry[3]
+
+    def stats(self) -> Dict[str, int]:
+        return {"pushes": self.pushes, "pops": self.pops, "updates": self.updates}
+
+
+# ==========================
+# Strategy selection
+# ==========================
+def make_frontier(problem: Any) -> Union[IndexedHeap, BucketQueue]:
+    """
+    Pick the frontier for a problem: a BucketQueue when the problem reports
+    bounded non-negative integer action costs (Problem.integer_cost_bound),
+    otherwise an IndexedHeap. Under a SearchStats the frontier is observed.
+    """
+    bound = problem.integer_cost_bound()
+    return watch_frontier(problem, BucketQueue() if bound is not None else IndexedHeap())
@@ -0,0 +1,37 @@
+# ai_searches/grid_problem.py
+from __future__ import annotations
+from typing import List, Optional, Set, Tuple
+
+from ai_searches.search_core import Problem
+
+"""
+Shared base for the 4-neighbour (row, col) GridProblems of the demo
+modules (a_star_data, best_first_search_data, bidirectional_search_data,
+rbfs_data). Subclasses set rows, cols and walls; the one-pass successors
+and the unit integer_cost_bound live here so the copies do not each
+carry their own.
+"""
+
+Coord = Tuple[int, int]
+
+MOVES_4 = (('U', -1, 0), ('D', 1, 0), ('L', 0, -1), ('R', 0, 1))
+
+class UnitGridProblem(Problem):
+    """4-neighbour grid with walls, unit move cost; needs self.rows, self.cols, self.walls."""
+    rows: int
+    cols: int
+    walls: Set[Coord]
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return 1
+
+    def successors(self, state: Coord) -> List[Tuple[str, Coord, float]]:
+        """actions + result + action_cost in one pass: each neighbour is computed once."""
+        r, c = state
+        rows, cols, walls = self.rows, self.cols, self.walls
+        out = []
+        for a, dr, dc in MOVES_4:
+            s2 = (r + dr, c + dc)
+            if 0 <= s2[0] < rows and 0 <= s2[1] < cols and s2 not in walls:
+                out.append((a, s2, 1.0))
+        return out
@@ -0,0 +1,21 @@
+# ai_searches/heuristics.py
+from __future__ import annotations
+from typing import Tuple
+
+"""
+Closed-form distance heuristics shared by the grid demos. Precomputed
+landmark (ALT) heuristics for arbitrary maps and graphs are in landmarks.
+"""
+
+Coord = Tuple[int, int]
+
+# -------- Manhattan distance (admissible & consistent in 4-neighbor unit-cost grids) --------
+def manhattan(a: Coord, b: Coord) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+# -------- Octile distance (admissible & consistent in 8-neighbor grids, diagonal cost sqrt(2)) --------
+SQRT2 = 2 ** 0.5
+
+def octile(a: Coord, b: Coord) -> float:
+    dr, dc = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
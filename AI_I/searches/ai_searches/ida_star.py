@@ -0,0 +1,42 @@
+# ai_searches/ida_star.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional
+
+from ai_searches.iterative_deepening_search import bounded_depth_first
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import instrumented
+
+"""
+IDA* (iterative-deepening A*): depth-first iterations bounded by f = g + h.
+The first bound is h(start). Each later bound is the smallest f that
+exceeded the previous one, so no iteration repeats without new nodes.
+
+Memory is O(depth): only the current path is kept (see
+iterative_deepening_search.bounded_depth_first). With an admissible h the
+first solution found is optimal. Same Problem / h_provider interface as
+a_star_search; the returned node is a search_core.Node.
+"""
+
+@instrumented(heuristics=("h_provider",))
+def ida_star_search(problem: Problem,
+                    h_provider: Callable[[Any], float],
+                    max_bound: float = float("inf"),
+                    stats: Optional[Dict[str, Any]] = None) -> Optional[Node]:
+    """
+    max_bound stops the search once the f bound would exceed it. An
+    exhausted space (nothing cut off) returns None at once.
+    stats (optional dict) is filled with iterations / generated / bounds.
+    """
+    bound = h_provider(problem.initial)
+    bounds = []
+    try:
+        while bound <= max_bound and bound < float("inf"):
+            bounds.append(bound)
+            node, bound = bounded_depth_first(problem, bound, h_provider, stats)
+            if node is not None:
+                return node
+        return None
+    finally:
+        if stats is not None:
+            stats["iterations"] = len(bounds)
+            stats["bounds"] = bounds
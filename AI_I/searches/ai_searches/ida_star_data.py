@@ -0,0 +1,21 @@
+# ai_searches/ida_star_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search, print_solution
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import manhattan
+from ai_searches.ida_star import ida_star_search
+
+# ---------- Demo runner used by main ----------
+def run_ida_star_demo() -> None:
+    walls = [(1, 1), (1, 2), (2, 1)]
+    start, goal = (0, 0), (3, 3)
+    problem = GridProblem(grid_rows=4, grid_cols=4, walls=walls, start=start, goal=goal)
+
+    def h(state) -> float:
+        return float(manhattan(state, goal))
+
+    print_solution("A* on 4x4 Grid", a_star_search(problem, h))
+    stats = {}
+    print_solution("IDA* on 4x4 Grid", ida_star_search(problem, h, stats=stats))
+    print(f"iterations={stats['iterations']} bounds={stats['bounds']} generated={stats['generated']}")
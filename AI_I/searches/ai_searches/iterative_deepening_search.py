@@ -1,30 +1,130 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from ai_searches.depth_limited_search import Problem, Node, depth_limited_search, print_dls_result
+from ai_searches.search_stats import SearchStats, instrumented
 
-def iterative_deepening_search(problem: Problem, max_depth: int = 50) -> Optional[Node]:
+@instrumented()
+def iterative_deepening_search(problem: Problem, max_depth: int = 50, verbose: bool = False,
+                               stats: Optional[SearchStats] = None) -> Optional[Node]:
     """
         Iterative Deepening Search (IDS)
         Repeatedly applies Depth-Limited Search, increasing the limit until
         a solution is found or the maximum depth is reached.
+        verbose prints one line per iteration.
         """
     for depth in range(max_depth + 1):
-        print(f"\n[IDS] Running depth-limited search with limit={depth}")
+        if verbose:
+            print(f"\n[IDS] Running depth-limited search with limit={depth}")
         result, node = depth_limited_search(problem, limit = depth)
         if result == "success":
-            print(f"[IDS] Success found at depth {depth}")
+            if verbose:
+                print(f"[IDS] Success found at depth {depth}")
             return node
         elif result == "failure":
             # no more nodes to explore
-            print("[IDS] Failure — no nodes left to expand.")
+            if verbose:
+                print("[IDS] Failure — no nodes left to expand.")
             return None
     # if "cutoff", continue to next iteration
-    print("[IDS] Reached max_depth with no solution.")
+    if verbose:
+        print("[IDS] Reached max_depth with no solution.")
     return None
 
+# ==========================
+# Bounded depth-first engine with incremental path state
+# ==========================
+def bounded_depth_first(problem: Problem,
+                        bound: float,
+                        h: Optional[Callable[[Any], float]] = None,
+                        stats: Optional[Dict[str, int]] = None) -> Tuple[Optional[Node], float]:
+    """
+    One depth-first iteration below a bound. The value checked against the
+    bound is the depth when h is None (depth-limited search), else g + h (IDA*).
+
+    The current path lives in parallel lists (states, actions, g, successor
+    iterators) that grow and shrink as the search descends and backtracks.
+    The on-path states are also kept in a set, so the cycle check is O(1).
+    No Node is built until a goal is found.
+
+    Returns (solution, next_bound). next_bound is the smallest value that
+    exceeded the bound (inf when nothing did, i.e. the space is exhausted).
+    """
+    generated = 0
+    start = problem.initial
+    next_bound = float("inf")
+    if problem.is_goal(start):
+        return Node(state=start, path_cost=0.0, depth=0), next_bound
+    states: List[Any] = [start]
+    actions: List[Any] = [None]
+    costs: List[float] = [0.0]
+    pending = [iter(problem.successors(start))]
+    on_path = {start}
+
+    try:
+        while pending:
+            for action, s2, step in pending[-1]:
+                generated += 1
+                if s2 in on_path:
+                    continue
+                g2 = costs[-1] + step
+                depth2 = len(states)
+                value = depth2 if h is None else g2 + h(s2)
+                if value > bound:
+                    if value < next_bound:
+                        next_bound = value
+                    continue
+                if problem.is_goal(s2):
+                    node = None
+                    for depth, (state, act, g) in enumerate(zip(states + [s2], actions + [action], costs + [g2])):
+                        node = Node(state, node, act, g, depth)
+                    return node, next_bound
+                if h is None and depth2 == bound:
+                    # children of s2 would all be cut off: only check that it has some
+                    if next_bound > depth2 + 1 and any(True for _ in problem.actions(s2)):
+                        next_bound = depth2 + 1
+                    continue
+                states.append(s2)
+                actions.append(action)
+                costs.append(g2)
+                on_path.add(s2)
+                pending.append(iter(problem.successors(s2)))
+                break
+            else:
+                # every action tried: backtrack
+                pending.pop()
+                on_path.discard(states.pop())
+                actions.pop()
+                costs.pop()
+        return None, next_bound
+    finally:
+        if stats is not None:
+            stats["generated"] = stats.get("generated", 0) + generated
+
+@instrumented()
+def iterative_deepening_path_search(problem: Problem, max_depth: int = 50,
+                                    stats: Optional[Dict[str, int]] = None) -> Optional[Node]:
+    """
+    IDS on bounded_depth_first: same result as iterative_deepening_search
+    (a shallowest solution) without building a Node per child or walking the
+    parent chain for cycle checks. Stops early once no node was cut off.
+    stats (optional dict) is filled with iterations / generated.
+    """
+    limit: float = 0
+    iterations = 0
+    try:
+        while limit <= max_depth:
+            iterations += 1
+            node, limit = bounded_depth_first(problem, limit, stats=stats)
+            if node is not None:
+                return node
+        return None
+    finally:
+        if stats is not None:
+            stats["iterations"] = iterations
+
 def run_iterative_demo(problem: Problem) -> None:
-    node = iterative_deepening_search(problem, max_depth=10)
+    node = iterative_deepening_search(problem, max_depth=10, verbose=True)
     if node:
         print_dls_result("Iterative Deepening Search (IDS)", ("success", node))
     else:
-        print("\nNo solution found by IDS.")
\ No newline at end of file
+        print("\nNo solution found by IDS.")
@@ -0,0 +1,224 @@
+# ai_searches/jump_point_search.py
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import SQRT2
+from ai_searches.search_core import Node
+from ai_searches.search_stats import SearchStats, instrumented, record_counts
+
+"""
+Jump Point Search (JPS) on uniform-cost grids (rows, cols, walls, start, goal).
+
+On an open grid, many shortest paths are symmetric: they differ only in the
+order of the same moves. Plain A* can push much of that region onto
+its heap. JPS keeps one canonical path per region. From a node it
+"jumps" in a straight line, cell by cell without touching the heap, and
+stops only at jump points:
+  * the goal;
+  * a cell with a forced neighbour, a free cell next to the line whose
+    cell behind (towards the parent) is a wall. Only a path through this
+    cell reaches that neighbour optimally, so the search must branch here;
+  * 4-connected vertical and 8-connected diagonal jumps: a cell from which
+    one of the component straight jumps finds a jump point.
+Only jump points are pushed and expanded. Each one continues in every
+direction but straight back (4-connected), or in the natural plus forced
+directions (8-connected).
+
+    jump_point_search(problem)  problem: GridProblem, 4-neighbour unit cost
+    jump_point_search(problem)  problem: OctileGridProblem, 8-neighbour,
+                                diagonals cost sqrt(2) and may not cut corners
+
+The jump-point path is then unrolled into one Node per cell, with the
+problem's own actions and action costs. The result has the same shape as
+a_star_search's and the same (optimal) cost.
+
+Walls on the endpoints are treated as a_star_search treats them: a walled
+start is left like any other cell (a shortest path never comes back to
+it), and a walled goal is never reached, so the result is None unless
+start == goal.
+
+The walls are copied once into a bytearray padded with a one-cell border.
+Cells are flat ids, so a step is one integer addition and no bounds checks
+are needed.
+"""
+
+Coord = Tuple[int, int]
+
+class OctileGridProblem(GridProblem):
+    """
+    GridProblem with diagonal moves 'UL','UR','DL','DR' (cost sqrt(2)). A
+    diagonal move needs both cells it passes between to be free (no corner cutting).
+    """
+    DIAGONALS: Dict[str, Tuple[int, int]] = {'UL': (-1, -1), 'UR': (-1, 1), 'DL': (1, -1), 'DR': (1, 1)}
+
+    def successors(self, state: Coord) -> List[Tuple[str, Coord, float]]:
+        out = super().successors(state)
+        r, c = state
+        rows, cols, walls = self.rows, self.cols, self.walls
+        for a, (dr, dc) in self.DIAGONALS.items():
+            s2 = (r + dr, c + dc)
+            if (0 <= s2[0] < rows and 0 <= s2[1] < cols and s2 not in walls
+                    and (r + dr, c) not in walls and (r, c + dc) not in walls):
+                out.append((a, s2, SQRT2))
+        return out
+
+    def actions(self, state: Coord) -> Iterable[str]:
+        return [a for a, _, _ in self.successors(state)]
+
+    def result(self, state: Coord, action: str) -> Coord:
+        if action in self.DIAGONALS:
+            dr, dc = self.DIAGONALS[action]
+            return (state[0] + dr, state[1] + dc)
+        return super().result(state, action)
+
+    def action_cost(self, state: Coord, action: str, state2: Coord) -> float:
+        return SQRT2 if action in self.DIAGONALS else 1.0
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return None
+
+# ==========================
+# Jump Point Search
+# ==========================
+@instrumented(problems=())  # the grid is read directly: the counters are filled in below
+def jump_point_search(problem: GridProblem, stats: Optional[Dict[str, int]] = None) -> Optional[Node]:
+    """
+    Optimal path on a unit-cost grid (8-connected for an OctileGridProblem).
+    stats (optional dict) is filled with expanded / pushed jump points and
+    the number of cells scanned by the jumps. A SearchStats also gets them
+    as counters: expanded, frontier_pushes / peak_frontier and, for the
+    scanned cells, generated.
+    """
+    diagonal = isinstance(problem, OctileGridProblem)
+    if not diagonal and problem.integer_cost_bound() != 1:
+        raise ValueError("jump_point_search needs a unit-cost grid")
+    rows, cols = problem.rows, problem.cols
+    W = cols + 2
+    free = bytearray(W * (rows + 2))
+    for r in range(rows):
+        free[(r + 1) * W + 1:(r + 1) * W + 1 + cols] = b"\x01" * cols
+    for r, c in problem.walls:
+        if 0 <= r < rows and 0 <= c < cols:
+            free[(r + 1) * W + c + 1] = 0
+
+    def cell(s: Coord) -> int:
+        return (s[0] + 1) * W + s[1] + 1
+
+    start, goal = cell(problem.initial), cell(problem.goal)
+    free[start] = 1        # as in a_star_search: a walled start is left, a walled goal never reached
+    if not free[goal]:
+        return None
+    gr, gc = divmod(goal, W)
+    scanned = 0
+
+    def jump(u: int, dh: int, dv: int) -> int:
+        """Walk from u in direction (dv rows, dh cols) -- dv in flat units -- to the next jump point, or -1."""
+        nonlocal scanned
+        d = dh + dv
+        while True:
+            if dh and dv and not (free[u + dh] and free[u + dv]):
+                return -1                      # a diagonal step may not cut a corner
+            u += d
+            scanned += 1
+            if not free[u]:
+                return -1
+            if u == goal:
+                return u
+            if dh and dv:
+                if jump(u, dh, 0) >= 0 or jump(u, 0, dv) >= 0:
+                    return u
+            elif dh:
+                if (free[u - W] and not free[u - W - dh]) or (free[u + W] and not free[u + W - dh]):
+                    return u
+            else:
+                if (free[u - 1] and not free[u - 1 - dv]) or (free[u + 1] and not free[u + 1 - dv]):
+                    return u
+                if not diagonal and (jump(u, 1, 0) >= 0 or jump(u, -1, 0) >= 0):
+                    return u
+
+    straight = [(1, 0), (-1, 0), (0, W), (0, -W)]
+    all_dirs = straight + ([(1, W), (1, -W), (-1, W), (-1, -W)] if diagonal else [])
+
+    def directions(u: int, dh: int, dv: int) -> Iterable[Tuple[int, int]]:
+        """Directions to jump in from jump point u, reached moving (dh, dv)."""
+        if not (dh or dv):
+            return all_dirs
+        if not diagonal:
+            return [(h, v) for h, v in straight if (h, v) != (-dh, -dv)]
+        if dh and dv:
+            out = [(dh, 0), (0, dv)]
+            if free[u + dh] and free[u + dv]:
+                out.append((dh, dv))
+            return out
+        out = [(dh, dv)]
+        for side_h, side_v in (((0, W), (0, -W)) if dh else ((1, 0), (-1, 0))):
+            if free[u + side_h + side_v]:
+                out += [(side_h, side_v), (dh + side_h, dv + side_v)]
+        return out
+
+    def h(u: int) -> float:
+        r, c = divmod(u, W)
+        dr, dc = abs(r - gr), abs(c - gc)
+        return dr + dc if not diagonal else max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+
+    def step_cost(dh: int, dv: int) -> float:
+        return SQRT2 if dh and dv else 1.0
+
+    g: Dict[int, float] = {start: 0.0}
+    came: Dict[int, Tuple[int, int, int]] = {start: (-1, 0, 0)}   # jump point -> (parent, dh, dv)
+    closed = set()
+    heap = [(h(start), -0.0, start)]   # ties on f: deepest first
+    expanded = pushed = peak = 0
+    try:
+        while heap:
+            _, gu, u = heapq.heappop(heap)
+            gu = -gu
+            if u in closed or gu > g[u]:
+                continue
+            if u == goal:
+                return _unroll(problem, came, goal, W)
+            closed.add(u)
+            expanded += 1
+            _, dh, dv = came[u]
+            for jh, jv in directions(u, dh, dv):
+                v = jump(u, jh, jv)
+                if v < 0 or v in closed:
+                    continue
+                steps = abs(v - u) // abs(jh + jv)
+                g2 = gu + steps * step_cost(jh, jv)
+                if g2 < g.get(v, float("inf")):
+                    g[v] = g2
+                    came[v] = (u, jh, jv)
+                    heapq.heappush(heap, (g2 + h(v), -g2, v))
+                    pushed += 1
+                    if len(heap) > peak:
+                        peak = len(heap)
+        return None
+    finally:
+        if stats is not None:
+            stats.update(expanded=expanded, pushed=pushed, scanned=scanned)
+            if isinstance(stats, SearchStats):
+                record_counts(stats, expanded=expanded, generated=scanned, frontier_pushes=pushed,
+                              peak_frontier=peak)
+
+def _unroll(problem: GridProblem, came: Dict[int, Tuple[int, int, int]], goal: int, W: int) -> Node:
+    """Jump-point chain -> one Node per cell, with the problem's actions and costs."""
+    names = {(0, -W): 'U', (0, W): 'D', (-1, 0): 'L', (1, 0): 'R',
+             (-1, -W): 'UL', (1, -W): 'UR', (-1, W): 'DL', (1, W): 'DR'}
+    segments = []
+    u = goal
+    while came[u][0] >= 0:
+        parent, dh, dv = came[u]
+        segments.append((parent, u, dh, dv))
+        u = parent
+    state = divmod(u, W)
+    node = Node((state[0] - 1, state[1] - 1))
+    for parent, v, dh, dv in reversed(segments):
+        action = names[(dh, dv)]
+        for _ in range(abs(v - parent) // abs(dh + dv)):
+            s = node.state
+            s2 = problem.result(s, action)
+            node = Node(s2, node, action, node.path_cost + problem.action_cost(s, action, s2), node.depth + 1)
+    return node
@@ -0,0 +1,18 @@
+# ai_searches/jump_point_search_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search, print_solution
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import manhattan, octile
+from ai_searches.jump_point_search import OctileGridProblem, jump_point_search
+
+# ---------- Demo runner used by main ----------
+def run_jump_point_search_demo() -> None:
+    walls = [(1, 1), (1, 2), (2, 1), (3, 4), (4, 4)]
+    start, goal = (0, 0), (5, 5)
+    for cls, h, label in ((GridProblem, manhattan, "4-connected"), (OctileGridProblem, octile, "8-connected")):
+        problem = cls(6, 6, walls, start, goal)
+        stats = {}
+        print_solution(f"JPS on 6x6 grid, {label}", jump_point_search(problem, stats=stats))
+        print(f"jump points expanded: {stats['expanded']}")
+        print_solution(f"A* on 6x6 grid, {label}", a_star_search(problem, lambda s: h(s, goal)))
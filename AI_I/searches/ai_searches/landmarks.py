@@ -0,0 +1,198 @@
+# ai_searches/landmarks.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import heapq
+import os
+
+import numpy as np
+
+from ai_searches.batch_queries import intern_problem
+from ai_searches.csr_graph import CSRGraph
+from ai_searches.search_core import Problem
+
+"""
+Landmark (ALT) heuristics from precomputed distance tables.
+
+The preprocessing runs once per map:
+  * every state reachable from problem.initial is interned (intern_problem);
+  * k landmarks are picked by farthest-point selection. Each new landmark is
+    the state farthest from its nearest chosen landmark, so the landmarks
+    spread out to the edges of the map;
+  * one Dijkstra per landmark fills row i of from_landmark, d(L_i, v). On
+    directed maps (some edge u -> v without an equal-cost v -> u), a
+    Dijkstra over the reversed edges also fills to_landmark, d(v, L_i).
+A table is a (k, n) array. It is float32 when every distance is an integer
+below 2^24, so the values stay exact, and float64 otherwise.
+
+By the triangle inequality, for every landmark L
+    d(s, g) >= d(L, g) - d(L, s)   and   d(s, g) >= d(s, L) - d(g, L)
+so h(s) = the largest bound over all landmarks is admissible and consistent.
+On undirected maps, both bounds reduce to the differential heuristic
+|d(L, s) - d(L, g)|. heuristic(goal) evaluates h for every state at once
+with NumPy and returns a plain h(state) lookup, to pass as a_star_search's
+h_provider or recursive_best_first_search's h. It works on graphs with no
+geometry at all (SimpleGraphProblem) and sees the walls that Manhattan
+distance ignores.
+
+save / load keep the tables in one .npz file, so the Dijkstras are paid once
+per map. landmark_table() loads the file if it exists and builds it if not.
+"""
+
+INF = float("inf")
+
+def _dijkstra(graph: CSRGraph, source: int) -> np.ndarray:
+    """Distances from source to every node (inf when unreachable)."""
+    indptr, indices, weights = graph._views()
+    dist = [INF] * graph.n_nodes
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            d2 = d + weights[e]
+            if d2 < dist[v]:
+                dist[v] = d2
+                heapq.heappush(heap, (d2, v))
+    return np.array(dist)
+
+def _edge_sources(graph: CSRGraph) -> np.ndarray:
+    return np.repeat(np.arange(graph.n_nodes, dtype=np.int64), np.diff(graph.indptr))
+
+def _reversed(graph: CSRGraph) -> CSRGraph:
+    return CSRGraph.from_arrays(graph.labels, graph.indices, _edge_sources(graph), graph.weights)
+
+def _is_symmetric(graph: CSRGraph) -> bool:
+    """True when every edge u -> v (cost w) has a twin v -> u with the same cost."""
+    src, dst, w = _edge_sources(graph), graph.indices.astype(np.int64), graph.weights
+    fwd, bwd = np.lexsort((w, dst, src)), np.lexsort((w, src, dst))
+    return (np.array_equal(src[fwd], dst[bwd]) and np.array_equal(dst[fwd], src[bwd])
+            and np.array_equal(w[fwd], w[bwd]))
+
+def _compact(rows: List[np.ndarray]) -> np.ndarray:
+    table = np.vstack(rows)
+    finite = table[np.isfinite(table)]
+    if finite.size == 0 or (np.all(np.mod(finite, 1) == 0) and finite.max() < 2**24):
+        return table.astype(np.float32)
+    return table
+
+# ==========================
+# Distance tables
+# ==========================
+class LandmarkTable:
+    """
+    states[i] is the state with id i. landmarks holds the landmark ids.
+    from_landmark[j, i] = d(landmark j, state i). to_landmark[j, i] =
+    d(state i, landmark j), or None on symmetric maps (equal to from_landmark).
+    """
+    def __init__(self, states: Sequence[Any], landmarks: np.ndarray,
+                 from_landmark: np.ndarray, to_landmark: Optional[np.ndarray] = None):
+        self.states = states
+        self.index: Dict[Any, int] = {s: i for i, s in enumerate(states)}
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+
+    @property
+    def nbytes(self) -> int:
+        return self.from_landmark.nbytes + (self.to_landmark.nbytes if self.to_landmark is not None else 0)
+
+    # ---------- preprocessing ----------
+    @classmethod
+    def build(cls, problem: Problem, k: int = 8) -> "LandmarkTable":
+        """Intern the map reachable from problem.initial, then from_graph."""
+        return cls.from_graph(intern_problem(problem), k)
+
+    @classmethod
+    def from_graph(cls, graph: CSRGraph, k: int = 8, first: int = 0) -> "LandmarkTable":
+        """
+        Farthest-point selection seeded at node `first`. The first landmark
+        is the node farthest from it. Stops early if every node is already
+        a landmark or unreachable.
+        """
+        symmetric = _is_symmetric(graph)
+        backward = None if symmetric else _reversed(graph)
+        nearest = _dijkstra(graph, first)
+        landmarks: List[int] = []
+        rows_from: List[np.ndarray] = []
+        rows_to: List[np.ndarray] = []
+        while len(landmarks) < k:
+            # unreachable from every landmark so far (inf) is the farthest of all
+            candidate = np.where(nearest > 0, nearest, -1.0)
+            if landmarks:
+                candidate[landmarks] = -1.0
+            lm = int(np.argmax(candidate))
+            if candidate[lm] <= 0:
+                break
+            landmarks.append(lm)
+            row = _dijkstra(graph, lm)
+            rows_from.append(row)
+            if backward is not None:
+                rows_to.append(_dijkstra(backward, lm))
+            nearest = row if len(landmarks) == 1 else np.minimum(nearest, row)
+        if not landmarks:                         # a single-state map
+            landmarks, rows_from = [first], [np.zeros(graph.n_nodes)]
+            rows_to = [] if backward is None else [np.zeros(graph.n_nodes)]
+        return cls(graph.labels, np.array(landmarks, dtype=np.int64), _compact(rows_from),
+                   _compact(rows_to) if backward is not None else None)
+
+    # ---------- heuristic ----------
+    def heuristic(self, goal: Any) -> Callable[[Any], float]:
+        """
+        Admissible h(state) towards goal, for every state precomputed in one
+        vectorised pass. States unknown to the table, and landmarks that
+        cannot reach both ends, contribute 0.
+        """
+        g = self.index.get(goal)
+        if g is None:
+            return lambda state: 0.0
+        frm = self.from_landmark.astype(np.float64)
+        with np.errstate(invalid="ignore"):
+            bound = frm[:, g:g + 1] - frm                            # d(L, g) - d(L, s)
+            if self.to_landmark is None:
+                bound = np.abs(bound)
+            else:
+                to = self.to_landmark.astype(np.float64)
+                bound = np.maximum(bound, to - to[:, g:g + 1])       # d(s, L) - d(g, L)
+        bound[~np.isfinite(bound)] = 0.0
+        hv = np.maximum(bound.max(axis=0), 0.0).tolist()
+        index = self.index
+
+        def h(state: Any) -> float:
+            i = index.get(state)
+            return hv[i] if i is not None else 0.0
+        return h
+
+    # ---------- persistence ----------
+    def save(self, path: str) -> None:
+        """
+        Write the tables to path (.npz). States must be numbers, strings or
+        equal-length tuples of numbers, e.g. (row, col), as in this package's problems.
+        """
+        states = np.array(self.states)
+        if states.dtype == object or states.ndim > 2:
+            raise ValueError("only numbers, strings or equal-length tuples of numbers can be saved")
+        arrays = {"states": states, "landmarks": self.landmarks, "from_landmark": self.from_landmark}
+        if self.to_landmark is not None:
+            arrays["to_landmark"] = self.to_landmark
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "LandmarkTable":
+        with np.load(path, allow_pickle=False) as data:
+            states = data["states"]
+            states = [tuple(row) for row in states.tolist()] if states.ndim == 2 else states.tolist()
+            return cls(states, data["landmarks"], data["from_landmark"],
+                       data["to_landmark"] if "to_landmark" in data.files else None)
+
+def landmark_table(problem: Problem, k: int = 8, path: Optional[str] = None) -> LandmarkTable:
+    """Load the map's table from path if it exists, else build it (and save it to path)."""
+    if path is not None and os.path.exists(path):
+        return LandmarkTable.load(path)
+    table = LandmarkTable.build(problem, k)
+    if path is not None:
+        table.save(path)
+    return table
@@ -0,0 +1,28 @@
+# ai_searches/landmarks_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search, print_solution
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import manhattan
+from ai_searches.landmarks import LandmarkTable
+from ai_searches.recursive_best_first_search import recursive_best_first_search
+from ai_searches.ucs_data import SimpleGraphProblem, build_sample_graph
+
+# ---------- Demo runner used by main ----------
+def run_landmarks_demo() -> None:
+    # a weighted graph: no coordinates, so no Manhattan distance to fall back on
+    problem = SimpleGraphProblem(build_sample_graph(), start="A", goal="G")
+    table = LandmarkTable.build(problem, k=3)
+    h = table.heuristic("G")
+    print("\n== ALT landmarks on the sample graph ==")
+    print("landmarks:", [table.states[i] for i in table.landmarks])
+    print("h to G   :", {s: h(s) for s in table.states})
+    print_solution("A* with landmark h", a_star_search(problem, h))
+    print_solution("RBFS with landmark h", recursive_best_first_search(problem, h))
+
+    # a wall with one gap on the far side: Manhattan says 2, the landmarks see the detour
+    walls = [(2, c) for c in range(5)]
+    grid = GridProblem(grid_rows=5, grid_cols=6, walls=walls, start=(1, 0), goal=(3, 0))
+    h = LandmarkTable.build(grid, k=4).heuristic(grid.goal)
+    print(f"\nh(start): manhattan={manhattan(grid.initial, grid.goal)} landmarks={h(grid.initial):g}")
+    print_solution("A* with landmark h on 5x6 grid", a_star_search(grid, h))
@@ -0,0 +1,276 @@
+# ai_searches/mmap_graph.py
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import csv
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from ai_searches.csr_graph import CSRGraph, CSRProblem
+
+"""
+Memory-mapped on-disk graph format, for searches over graphs larger than RAM.
+
+One file holds the CSR arrays of csr_graph plus a label table:
+
+    header (128 bytes, little-endian)
+        magic "CSRGRPH1", version, flags (bit 0: 64-bit indices),
+        n_nodes, n_edges, max integer cost (-1 if costs are not all
+        non-negative integers), then the offset of every section
+    indptr         int64[n_nodes + 1]
+    indices        int32[n_edges] (int64 with flag bit 0)
+    weights        float64[n_edges]
+    label_offsets  int64[n_nodes + 1]   label i = label_bytes[off[i]:off[i+1]] (UTF-8)
+    label_order    int64[n_nodes]       ids sorted by label bytes, for lookups
+    label_bytes
+
+Every section is 8-byte aligned. MmapGraph.open maps the file and wraps
+each section with np.frombuffer, so opening is O(1) whatever the size: no
+parsing and no copies, and pages are read only when a search touches
+them. Labels are decoded on demand, and id_of() binary-searches
+label_order. MmapGraph is a CSRGraph, so csr_bfs / csr_ucs / csr_a_star
+and CSRProblem (through MmapGraphProblem) run on it unchanged.
+
+convert_csv streams an edge-list CSV into the format in two passes over
+a temporary binary edge file. Only the label dictionary and per-node
+counters are held in memory, never the edges.
+"""
+
+MAGIC = b"CSRGRPH1"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIqqq7q")   # magic, version, flags, n, m, max int cost, 7 section offsets
+HEADER_SIZE = 128
+_EDGE = np.dtype([("src", "<i8"), ("dst", "<i8"), ("w", "<f8")])
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+def _layout(n: int, m: int, wide: bool, label_len: int) -> Tuple[List[int], int]:
+    """Section offsets (indptr, indices, weights, label_offsets, label_order, label_bytes, end)."""
+    sizes = [8 * (n + 1), (8 if wide else 4) * m, 8 * m, 8 * (n + 1), 8 * n, label_len]
+    offsets, pos = [], HEADER_SIZE
+    for size in sizes:
+        offsets.append(pos)
+        pos = _align(pos + size)
+    offsets.append(pos)
+    return offsets, pos
+
+# ==========================
+# Reading
+# ==========================
+class _LabelTable(Sequence):
+    """Read-only sequence of labels decoded from the mapping on access."""
+    def __init__(self, offsets: np.ndarray, data: memoryview):
+        self._offsets = memoryview(offsets)
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def raw(self, i: int) -> bytes:
+        return bytes(self._data[self._offsets[i]:self._offsets[i + 1]])
+
+    def __getitem__(self, i: int) -> str:   # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return self.raw(i).decode("utf-8")
+
+class MmapGraph(CSRGraph):
+    """A CSRGraph whose arrays and labels live in a memory-mapped file."""
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{path}: too short for a CSR graph file")
+        magic, version, flags, n, m, max_cost, *off = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version-{VERSION} CSR graph file")
+        buf = self._map
+        index_type = np.int64 if flags & 1 else np.int32
+        self.indptr = np.frombuffer(buf, np.int64, n + 1, off[0])
+        self.indices = np.frombuffer(buf, index_type, m, off[1])
+        self.weights = np.frombuffer(buf, np.float64, m, off[2])
+        self.labels = _LabelTable(np.frombuffer(buf, np.int64, n + 1, off[3]),
+                                  memoryview(buf)[off[5]:off[5] + off[6]])
+        self._order = memoryview(np.frombuffer(buf, np.int64, n, off[4]))
+        self.max_integer_cost = None if max_cost < 0 else int(max_cost)
+
+    @classmethod
+    def open(cls, path: str) -> "MmapGraph":
+        return cls(path)
+
+    def close(self) -> None:
+        # drop the numpy views first: an mmap with exported buffers can't be closed
+        for name in ("indptr", "indices", "weights", "labels", "_order"):
+            self.__dict__.pop(name, None)
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # a caller still holds a view; the mapping is released with it
+        self._file.close()
+
+    def __enter__(self) -> "MmapGraph":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def id_of(self, label: Any) -> int:
+        """Binary search over the ids sorted by label bytes."""
+        key = str(label).encode("utf-8")
+        order, labels = self._order, self.labels
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if labels.raw(order[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and labels.raw(order[lo]) == key:
+            return order[lo]
+        raise KeyError(f"unknown node label {label!r}")
+
+class MmapGraphProblem(CSRProblem):
+    """CSRProblem over a graph file: neighbours are read straight from the mapping."""
+    def __init__(self, graph: MmapGraph, start: Any, goal: Any):
+        super().__init__(graph, start, goal)
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return self.graph.max_integer_cost   # from the header: no scan over the weights
+
+# ==========================
+# Writing
+# ==========================
+def _write(path: str, labels: Sequence[Any], indptr: np.ndarray, fill_edges, max_cost: int) -> None:
+    """Write header, indptr and label table; fill_edges(indices, weights) writes the edge arrays."""
+    encoded = [str(label).encode("utf-8") for label in labels]
+    n, m = len(encoded), int(indptr[-1])
+    wide = n >= 2**31
+    label_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=label_offsets[1:])
+    offsets, size = _layout(n, m, wide, int(label_offsets[-1]))
+
+    with open(path, "wb") as f:
+        f.truncate(size)
+    with open(path, "r+b") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, int(wide), n, m, max_cost,
+                             offsets[0], offsets[1], offsets[2], offsets[3], offsets[4], offsets[5],
+                             int(label_offsets[-1])))
+
+    def section(k: int, dtype: Any, count: int) -> np.memmap:
+        return np.memmap(path, dtype=dtype, mode="r+", offset=offsets[k], shape=(count,))
+
+    if m:
+        indices, weights = section(1, np.int64 if wide else np.int32, m), section(2, np.float64, m)
+        fill_edges(indices, weights)
+        indices.flush()
+        weights.flush()
+        del indices, weights
+    for k, values in ((0, indptr), (3, label_offsets),
+                      (4, np.array(sorted(range(n), key=encoded.__getitem__), dtype=np.int64))):
+        if len(values):
+            out = section(k, np.int64, len(values))
+            out[:] = values
+            out.flush()
+            del out
+    with open(path, "r+b") as f:
+        f.seek(offsets[5])
+        for b in encoded:
+            f.write(b)
+
+def _max_integer_cost(weights: np.ndarray) -> int:
+    if len(weights) and (weights.min() < 0 or np.any(np.mod(weights, 1) != 0)):
+        return -1
+    return int(weights.max()) if len(weights) else 0
+
+def write_graph(graph: CSRGraph, path: str) -> None:
+    """Save an in-memory CSRGraph (labels are stored as str(label))."""
+    def fill(indices: np.ndarray, weights: np.ndarray) -> None:
+        indices[:] = graph.indices
+        weights[:] = graph.weights
+    _write(path, graph.labels, graph.indptr, fill, _max_integer_cost(graph.weights))
+
+def convert_csv(csv_path: str, out_path: str, directed: bool = False, has_header: bool = False,
+                delimiter: str = ",", chunk_edges: int = 1 << 20) -> Dict[str, int]:
+    """
+    Stream "u,v[,w]" rows (w defaults to 1) into a graph file. Memory use is
+    the label dictionary plus per-node counters, never the edge list.
+    Pass 1 interns labels, counts out-degrees and spills edge records to a
+    temporary file. Pass 2 scatters each chunk into its CSR slots and keeps
+    the file order of every node's edges. Returns {"nodes", "edges"}.
+    """
+    index: Dict[str, int] = {}
+    degree = np.zeros(1024, dtype=np.int64)
+    all_int, max_cost = True, 0
+    tmp_path = out_path + ".edges.tmp"
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as src, open(tmp_path, "wb") as tmp:
+            rows = csv.reader(src, delimiter=delimiter)
+            if has_header:
+                next(rows, None)
+            s, d, w = array('q'), array('q'), array('d')
+
+            def spill() -> None:
+                nonlocal degree, all_int, max_cost
+                if not s:
+                    return
+                chunk = np.empty(len(s), dtype=_EDGE)
+                chunk["src"], chunk["dst"], chunk["w"] = s, d, w
+                chunk.tofile(tmp)
+                if len(index) > len(degree):
+                    degree = np.concatenate([degree, np.zeros(max(len(degree), len(index)), dtype=np.int64)])
+                degree[:len(index)] += np.bincount(chunk["src"], minlength=len(index))
+                costs = chunk["w"]
+                all_int = all_int and bool(costs.min() >= 0) and not np.any(np.mod(costs, 1) != 0)
+                max_cost = max(max_cost, int(costs.max()) if all_int else 0)
+                del s[:], d[:], w[:]
+
+            for row in rows:
+                if not row or row[0].startswith("#"):
+                    continue
+                u = index.setdefault(row[0].strip(), len(index))
+                v = index.setdefault(row[1].strip(), len(index))
+                cost = float(row[2]) if len(row) > 2 and row[2].strip() else 1.0
+                s.append(u)
+                d.append(v)
+                w.append(cost)
+                if not directed:
+                    s.append(v)
+                    d.append(u)
+                    w.append(cost)
+                if len(s) >= chunk_edges:
+                    spill()
+            spill()
+
+        n = len(index)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degree[:n], out=indptr[1:])
+        edges = np.memmap(tmp_path, dtype=_EDGE, mode="r") if indptr[-1] else np.empty(0, dtype=_EDGE)
+
+        def fill(indices: np.ndarray, weights: np.ndarray) -> None:
+            cursor = indptr[:-1].copy()
+            for lo in range(0, len(edges), chunk_edges):
+                chunk = np.asarray(edges[lo:lo + chunk_edges])
+                order = np.argsort(chunk["src"], kind="stable")
+                src_sorted = chunk["src"][order]
+                starts = np.flatnonzero(np.r_[True, src_sorted[1:] != src_sorted[:-1]])
+                rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+                pos = cursor[src_sorted] + rank
+                indices[pos] = chunk["dst"][order]
+                weights[pos] = chunk["w"][order]
+                cursor += np.bincount(chunk["src"], minlength=n)
+
+        _write(out_path, list(index), indptr, fill, max_cost if all_int else -1)
+        del edges
+        return {"nodes": n, "edges": int(indptr[-1])}
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
@@ -0,0 +1,205 @@
+# ai_searches/node_pool.py
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ai_searches.frontiers import BucketQueue, IndexedHeap, make_frontier
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import SearchStats, instrumented
+
+"""
+Array-backed node store.
+
+Instead of one Node object per generated node (each holding its parent
+alive), nodes are rows in five typed columns:
+    state id | parent index | action id | depth | g
+States and actions are interned once, so a row costs 4 * 8 + 8 bytes and
+no Python object is created per node. The frontier is keyed by state id
+and stores only the row index of the best node for that state.
+The search returns a PoolNode handle that rebuilds Node objects on demand.
+"""
+
+NO_PARENT = -1
+
+# ==========================
+# Columns
+# ==========================
+class NodePool:
+    """Columnar storage for search nodes plus state/action interning tables."""
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, capacity)
+        self.state_id = array('q', bytes(8 * capacity))
+        self.parent = array('q', bytes(8 * capacity))
+        self.action_id = array('q', bytes(8 * capacity))
+        self.depth = array('q', bytes(8 * capacity))
+        self.g = array('d', bytes(8 * capacity))
+        self.size = 0
+
+        self.states: List[Any] = []          # id -> state
+        self.state_index: Dict[Any, int] = {}  # state -> id
+        self.actions: List[Any] = []
+        self.action_index: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def intern_state(self, state: Any) -> int:
+        sid = self.state_index.get(state)
+        if sid is None:
+            sid = len(self.states)
+            self.state_index[state] = sid
+            self.states.append(state)
+        return sid
+
+    def intern_action(self, action: Any) -> int:
+        aid = self.action_index.get(action)
+        if aid is None:
+            aid = len(self.actions)
+            self.action_index[action] = aid
+            self.actions.append(action)
+        return aid
+
+    def _grow(self) -> None:
+        extra = len(self.g)  # double the capacity
+        zeros = bytes(8 * extra)
+        self.state_id.frombytes(zeros)
+        self.parent.frombytes(zeros)
+        self.action_id.frombytes(zeros)
+        self.depth.frombytes(zeros)
+        self.g.frombytes(zeros)
+
+    def add(self, state_id: int, parent: int, action_id: int, g: float) -> int:
+        i = self.size
+        if i == len(self.g):
+            self._grow()
+        self.state_id[i] = state_id
+        self.parent[i] = parent
+        self.action_id[i] = action_id
+        self.depth[i] = 0 if parent == NO_PARENT else self.depth[parent] + 1
+        self.g[i] = g
+        self.size = i + 1
+        return i
+
+    def handle(self, index: int) -> "PoolNode":
+        return PoolNode(self, index)
+
+    def nbytes(self) -> int:
+        """Bytes held by the five columns (excluding interning tables)."""
+        columns = (self.state_id, self.parent, self.action_id, self.depth, self.g)
+        return sum(col.itemsize * len(col) for col in columns)
+
+
+# ==========================
+# Lightweight handle
+# ==========================
+class PoolNode:
+    """
+    Read-only view of one pool row with the same attributes as Node
+    (state, parent, action, path_cost, depth, path()).
+    """
+    __slots__ = ("pool", "index")
+
+    def __init__(self, pool: NodePool, index: int):
+        self.pool = pool
+        self.index = index
+
+    @property
+    def state(self) -> Any:
+        return self.pool.states[self.pool.state_id[self.index]]
+
+    @property
+    def parent(self) -> Optional["PoolNode"]:
+        p = self.pool.parent[self.index]
+        return None if p == NO_PARENT else PoolNode(self.pool, p)
+
+    @property
+    def action(self) -> Optional[Any]:
+        aid = self.pool.action_id[self.index]
+        return None if aid == NO_PARENT else self.pool.actions[aid]
+
+    @property
+    def path_cost(self) -> float:
+        return self.pool.g[self.index]
+
+    @property
+    def depth(self) -> int:
+        return self.pool.depth[self.index]
+
+    def to_node(self) -> Node:
+        """Materialise the root..self chain as linked Node objects and return the tail."""
+        pool = self.pool
+        rows = []
+        i = self.index
+        while i != NO_PARENT:
+            rows.append(i)
+            i = pool.parent[i]
+        node: Optional[Node] = None
+        for depth, i in enumerate(reversed(rows)):
+            aid = pool.action_id[i]
+            node = Node(pool.states[pool.state_id[i]], node,
+                        None if aid == NO_PARENT else pool.actions[aid],
+                        pool.g[i], depth)
+        return node
+
+    def path(self) -> List[Node]:
+        return self.to_node().path()
+
+    def __repr__(self) -> str:
+        return f"PoolNode(index={self.index}, state={self.state!r}, path_cost={self.path_cost!r})"
+
+
+# ==========================
+# Best-first search over the pool
+# ==========================
+@instrumented(heuristics=("priority", "node_f"))
+def pooled_best_first_search(problem: Problem,
+                             priority: Optional[Callable[[Any, float], float]] = None,
+                             node_f: Optional[Callable[[PoolNode], float]] = None,
+                             capacity: int = 1024,
+                             frontier: Optional[Union[IndexedHeap, BucketQueue]] = None,
+                             stats: Optional[SearchStats] = None) -> Optional[PoolNode]:
+    """
+    Best-first search that stores nodes in a NodePool; same reached/re-push
+    rule as best_first_search. Give either priority(state, g) -> f, or
+    node_f(handle) -> f for evaluation functions written against Node.
+    stats: an optional search_stats.SearchStats.
+    """
+    if (priority is None) == (node_f is None):
+        raise ValueError("pass exactly one of priority or node_f")
+    pool = NodePool(capacity)
+    best_g = array('d')  # per state id: cheapest g pushed so far
+
+    sid = pool.intern_state(problem.initial)
+    best_g.append(0.0)
+    start = pool.add(sid, NO_PARENT, NO_PARENT, 0.0)
+    f0 = priority(problem.initial, 0.0) if priority is not None else node_f(PoolNode(pool, start))
+    if frontier is None:
+        frontier = make_frontier(problem)
+    frontier.push(sid, f0, start)
+
+    states, state_index = pool.states, pool.state_index
+    state_id_col, g_col = pool.state_id, pool.g
+    intern_action = pool.intern_action
+
+    while frontier:
+        _, _, i = frontier.pop()
+        s = states[state_id_col[i]]
+        if problem.is_goal(s):
+            return PoolNode(pool, i)
+
+        g = g_col[i]
+        for action, s2, step in problem.successors(s):
+            g2 = g + step
+            sid2 = state_index.get(s2)
+            if sid2 is None:
+                sid2 = pool.intern_state(s2)
+                best_g.append(g2)
+            elif g2 < best_g[sid2]:
+                best_g[sid2] = g2
+            else:
+                continue
+            j = pool.add(sid2, i, intern_action(action), g2)
+            f2 = priority(s2, g2) if priority is not None else node_f(PoolNode(pool, j))
+            frontier.push(sid2, f2, j)
+    return None  # failure
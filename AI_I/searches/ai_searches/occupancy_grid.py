@@ -0,0 +1,138 @@
+# ai_searches/occupancy_grid.py
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ai_searches.search_core import Problem
+
+"""
+Occupancy-grid problem for large 4-neighbour maps.
+
+Walls live in a NumPy boolean array and states are flat cell ids
+(row * cols + col) instead of (row, col) tuples. Which moves are legal
+from every cell is computed once, vectorised, into a 4-bit mask per cell,
+so actions() is a table lookup and result() is one integer addition.
+Works with every Problem-based search (A*, best-first, BIBF, RBFS).
+"""
+
+Coord = Tuple[int, int]
+
+# action, d_row, d_col (same action names as the GridProblem family)
+MOVES_4: Tuple[Tuple[str, int, int], ...] = (
+    ('U', -1, 0),
+    ('D', 1, 0),
+    ('L', 0, -1),
+    ('R', 0, 1),
+)
+REVERSE_4: Dict[str, str] = {'U': 'D', 'D': 'U', 'L': 'R', 'R': 'L'}
+
+class OccupancyGridProblem(Problem):
+    """
+    walls: bool array of shape (rows, cols), True = blocked.
+    State: flat cell id. Action: 'U','D','L','R'. Move cost: 1.
+    """
+    def __init__(self, walls: np.ndarray, start: Union[Coord, int], goal: Union[Coord, int]):
+        self.blocked = np.ascontiguousarray(walls, dtype=bool)
+        self.rows, self.cols = self.blocked.shape
+        super().__init__(self.cell_id(start), self.cell_id(goal))
+
+        self.moves = MOVES_4
+        self.offset: Dict[str, int] = {a: dr * self.cols + dc for a, dr, dc in self.moves}
+        mask = self._move_masks()
+        self.move_mask = mask.tobytes()  # bytes indexing is much faster than ndarray indexing
+        self._actions_by_mask: List[Tuple[str, ...]] = [
+            tuple(a for k, (a, _, _) in enumerate(self.moves) if m >> k & 1)
+            for m in range(1 << len(self.moves))
+        ]
+        self._offsets_by_mask: List[Tuple[Tuple[str, int], ...]] = [
+            tuple((a, self.offset[a]) for a in actions) for actions in self._actions_by_mask
+        ]
+
+    @classmethod
+    def from_walls(cls, rows: int, cols: int, walls: Iterable[Coord],
+                   start: Coord, goal: Coord) -> "OccupancyGridProblem":
+        """Build from the (rows, cols, walls, start, goal) arguments GridProblem takes."""
+        grid = np.zeros((rows, cols), dtype=bool)
+        cells = np.array(list(walls), dtype=np.int64).reshape(-1, 2)
+        if len(cells):
+            grid[cells[:, 0], cells[:, 1]] = True
+        return cls(grid, start, goal)
+
+    def _move_masks(self) -> np.ndarray:
+        """Bit k of mask[cell] is set when move k leads to an in-bounds free cell."""
+        free = ~self.blocked
+        mask = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for k, (_, dr, dc) in enumerate(self.moves):
+            ok = np.zeros_like(free)
+            src_r = slice(max(0, -dr), self.rows - max(0, dr))
+            src_c = slice(max(0, -dc), self.cols - max(0, dc))
+            dst_r = slice(max(0, dr), self.rows - max(0, -dr))
+            dst_c = slice(max(0, dc), self.cols - max(0, -dc))
+            ok[src_r, src_c] = free[src_r, src_c] & free[dst_r, dst_c]
+            mask |= ok.astype(np.uint8) << k
+        return mask.ravel()
+
+    # ---------- ids <-> coordinates ----------
+    def cell_id(self, cell: Union[Coord, int]) -> int:
+        if isinstance(cell, (int, np.integer)):
+            return int(cell)
+        r, c = cell
+        return r * self.cols + c
+
+    def coord(self, state: int) -> Coord:
+        return divmod(state, self.cols)
+
+    def passable(self, state: int) -> bool:
+        r, c = divmod(state, self.cols)
+        return not self.blocked[r, c]
+
+    # ---------- Problem interface ----------
+    def actions(self, state: int) -> Sequence[str]:
+        return self._actions_by_mask[self.move_mask[state]]
+
+    def result(self, state: int, action: str) -> int:
+        return state + self.offset[action]
+
+    def action_cost(self, state: int, action: str, state2: int) -> float:
+        return 1.0
+
+    def successors(self, state: int) -> List[Tuple[str, int, float]]:
+        return [(a, state + d, 1.0) for a, d in self._offsets_by_mask[self.move_mask[state]]]
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return 1
+
+    def predecessors(self, state: int) -> List[Tuple[str, int]]:
+        """(action, previous cell) pairs for bidirectional_implicit; moves are reversible."""
+        offset, back = self.offset, REVERSE_4
+        return [(back[a], state + offset[a]) for a in self.actions(state)]
+
+    # ---------- helpers ----------
+    def reversed(self) -> "OccupancyGridProblem":
+        """Same map (arrays shared) with start and goal swapped, for backward search."""
+        twin = object.__new__(type(self))
+        twin.__dict__.update(self.__dict__)
+        twin.initial, twin.goal = self.goal, self.initial
+        return twin
+
+    def manhattan_heuristic(self, target: Optional[int] = None) -> Callable[[int], float]:
+        """h(state) = Manhattan distance to target (default: the goal)."""
+        gr, gc = divmod(self.goal if target is None else target, self.cols)
+        cols = self.cols
+
+        def h(state: int) -> float:
+            r, c = divmod(state, cols)
+            return float(abs(r - gr) + abs(c - gc))
+        return h
+
+    def neighbour_table(self) -> np.ndarray:
+        """(rows*cols, len(moves)) int64 array of successor ids, -1 where the move is illegal."""
+        n = self.rows * self.cols
+        ids = np.arange(n, dtype=np.int64)
+        mask = np.frombuffer(self.move_mask, dtype=np.uint8)
+        table = np.full((n, len(self.moves)), -1, dtype=np.int64)
+        for k, a in enumerate(a for a, _, _ in self.moves):
+            ok = (mask >> k & 1).astype(bool)
+            table[ok, k] = ids[ok] + self.offset[a]
+        return table
@@ -0,0 +1,40 @@
+# ai_searches/occupancy_grid_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search, print_solution
+from ai_searches.best_first_search import best_first_search
+from ai_searches.bidirectional_search import bibf_search
+from ai_searches.distance_field import distance_field
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.recursive_best_first_search import recursive_best_first_search
+
+# ---------- Demo runner used by main ----------
+def run_occupancy_grid_demo() -> None:
+    problem = OccupancyGridProblem.from_walls(4, 4, [(1, 1), (1, 2), (2, 1)], start=(0, 0), goal=(3, 3))
+    h = problem.manhattan_heuristic()
+
+    print_solution("A* on 4x4 occupancy grid", a_star_search(problem, h))
+    print_solution("Best-First (A*) on 4x4 occupancy grid",
+                   best_first_search(problem, lambda n: n.path_cost + h(n.state)))
+    print_solution("RBFS on 4x4 occupancy grid", recursive_best_first_search(problem, h))
+
+    backward = problem.reversed()
+    hb = backward.manhattan_heuristic()
+    node = bibf_search(problem, lambda n: n.path_cost + h(n.state),
+                       backward, lambda n: n.path_cost + hb(n.state))
+    print_solution("BIBF on 4x4 occupancy grid", node)
+
+def run_distance_field_demo() -> None:
+    problem = OccupancyGridProblem.from_walls(4, 4, [(1, 1), (1, 2), (2, 1)], start=(0, 0), goal=(3, 3))
+    field = distance_field(problem)  # cost-to-go from every cell to the goal
+
+    print("\n== Distance field to goal (3, 3) ==")
+    for row in field.as_array():
+        print(" ".join("  #" if d == float("inf") else f"{int(d):3d}" for d in row))
+
+    # the field is the perfect heuristic: A* walks straight down the gradient
+    print_solution("A* with distance-field heuristic", a_star_search(problem, field))
+
+    # a wall row cuts the goal off: the field is inf at the start and A* finds no path
+    cut = OccupancyGridProblem.from_walls(4, 4, [(2, c) for c in range(4)], start=(0, 0), goal=(3, 3))
+    print_solution("A* with distance-field heuristic, goal walled off", a_star_search(cut, distance_field(cut)))
@@ -2,11 +2,13 @@
 from __future__ import annotations
 from typing import Iterable, List, Tuple
 
-from ai_searches.recursive_best_first_search import Problem, recursive_best_first_search, print_solution, Node
+from ai_searches.grid_problem import UnitGridProblem
+from ai_searches.heuristics import manhattan
+from ai_searches.recursive_best_first_search import recursive_best_first_search, print_solution, Node
 
 Coord = Tuple[int, int]
 
-class GridProblem(Problem):
+class GridProblem(UnitGridProblem):
     """
     4-邻接网格；动作 U/D/L/R；可以设置墙（不可通行）
     State: (row, col)
@@ -44,10 +46,6 @@ class GridProblem(Problem):
         if action == 'R': return (r, c + 1)
         return state  # shouldn't happen
 
-# ---------- Heuristic ----------
-def manhattan(a: Coord, b: Coord) -> int:
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
 # ---------- Demo for main ----------
 def run_rbfs_demo() -> None:
     walls = [(1, 1), (1, 2), (2, 1)]  # 障碍
@@ -1,55 +1,16 @@
 # ai_searches/rbfs.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Callable, List, Tuple
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Optional, Callable, Iterator, List, Set, Tuple
+import heapq
 
-# ==========================
-# Core node & problem types
-# ==========================
-@dataclass
-class Node:
-    state: Any
-    parent: Optional["Node"] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0  # g(n)
-    depth: int = 0
-    f: float = 0.0          # f(n) = g(n) + h(n); RBFS会更新
-
-    def path(self) -> List["Node"]:
-        n, acc = self, []
-        while n:
-            acc.append(n)
-            n = n.parent
-        return list(reversed(acc))
-
-class Problem:
-    def __init__(self, initial: Any, goal: Any):
-        self.initial = initial
-        self.goal = goal
-
-    def is_goal(self, state: Any) -> bool:
-        return state == self.goal
-
-    def actions(self, state: Any) -> Iterable[Any]:
-        raise NotImplementedError
-
-    def result(self, state: Any, action: Any) -> Any:
-        raise NotImplementedError
-
-    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
-        return 1.0
+from ai_searches.search_core import Node, Problem, expand
+from ai_searches.search_stats import SearchStats, instrumented
 
 # ==========================
 # Utilities
 # ==========================
-def expand(problem: Problem, node: Node) -> Iterable[Node]:
-    """Generate successors with updated (g, depth). f由RBFS计算/更新。"""
-    s = node.state
-    for action in problem.actions(s):
-        s2 = problem.result(s, action)
-        g2 = node.path_cost + problem.action_cost(s, action, s2)
-        yield Node(state=s2, parent=node, action=action, path_cost=g2, depth=node.depth + 1)
-
 def is_cycle(node: Node) -> bool:
     """Detect cycles along the current path (工程里常见做法，避免陷入环)."""
     s, p = node.state, node.parent
@@ -109,7 +70,8 @@ def _rbfs(problem: Problem,
         alternative = successors[1].f if len(successors) > 1 else float("inf")
 
         # 超过当前允许上限，回溯，并把 best 的 f 作为新的限制反馈
-        if best.f > f_limit:
+        # best.f 为 inf 时所有分支都无解（根节点的 f_limit 也是 inf，否则会死循环）
+        if best.f > f_limit or best.f == float("inf"):
             return None, best.f
 
         # 递归向下，但限制为当前层可选的更小上界
@@ -119,12 +81,180 @@ def _rbfs(problem: Problem,
         # 否则继续循环，等价于考虑下一个更好的分支（best.f 已被“备份”更新）
         # 循环会重新排序 successors（best 的 f 可能增大，从而被 alternative 超过）
 
+@instrumented(heuristics=("h",))
 def recursive_best_first_search(problem: Problem,
-                                h: Callable[[Any], float]) -> Optional[Node]:
+                                h: Callable[[Any], float],
+                                stats: Optional[SearchStats] = None) -> Optional[Node]:
     """
     RBFS 外层封装：初始化根节点 f，并调用递归。
     """
     start = Node(state=problem.initial, path_cost=0.0, depth=0)
     start.f = h(start.state)
     solution, _ = _rbfs(problem, start, float("inf"), h)
-    return solution
\ No newline at end of file
+    return solution
+
+
+# ==========================
+# RBFS with transposition table, on-path set and top-two selection
+# ==========================
+class TranspositionTable:
+    """
+    Bounded map state -> learned h (an admissible lower bound on the cost to
+    the goal). When full, the least recently used entry is evicted.
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._h: "OrderedDict[Any, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._h)
+
+    def get(self, state: Any, default: float) -> float:
+        value = self._h.get(state)
+        if value is None:
+            return default
+        self._h.move_to_end(state)
+        return value
+
+    def store(self, state: Any, h: float) -> None:
+        table = self._h
+        if state in table:
+            table.move_to_end(state)
+            if h <= table[state]:
+                return
+        table[state] = h
+        if len(table) > self.max_size:
+            table.popitem(last=False)
+
+# successor entry: [f, tie-break, state, action, g, lb]; the list is a heap on (f, tie-break).
+# f is RBFS's backed-up value; lb is a path-independent lower bound on the cost of a
+# solution through the successor (used only for the transposition table).
+Successor = List[Any]
+
+def _successors(problem: Problem, node: Node, h: Callable[[Any], float], on_path: Set[Any],
+                table: Optional[TranspositionTable], tie: Iterator[int]) -> Tuple[List[Successor], float]:
+    """Successor heap, plus min g + h over the successors skipped because they are on the path."""
+    succ = []
+    cycle_lb = float("inf")
+    for action, s2, step in problem.successors(node.state):
+        g2 = node.path_cost + step
+        h2 = h(s2)
+        if table is not None:
+            h2 = max(h2, table.get(s2, h2))
+        if s2 in on_path:  # O(1) cycle check instead of walking the parent chain
+            cycle_lb = min(cycle_lb, g2 + h2)
+            continue
+        succ.append([max(g2 + h2, node.f), next(tie), s2, action, g2, g2 + h2])
+    heapq.heapify(succ)
+    return succ, cycle_lb
+
+def _alternative(succ: List[Successor]) -> float:
+    """Second-smallest f of a heap: the smaller of the root's two children."""
+    if len(succ) == 1:
+        return float("inf")
+    if len(succ) == 2:
+        return succ[1][0]
+    return min(succ[1][0], succ[2][0])
+
+def _learn(table: Optional[TranspositionTable], node: Node, succ: List[Successor], cycle_lb: float) -> float:
+    """
+    Lower bound for node from its successors, stored as learned h. On-path
+    successors count too, which keeps the bound valid along any other path.
+    """
+    lb = min(cycle_lb, min((e[5] for e in succ), default=float("inf")))
+    if table is not None:
+        table.store(node.state, lb - node.path_cost)
+    return lb
+
+def _make_table(table_size: Optional[int]) -> Optional[TranspositionTable]:
+    return TranspositionTable(table_size) if table_size else None
+
+def _rbfs_tt(problem: Problem, node: Node, f_limit: float, h: Callable[[Any], float],
+             on_path: Set[Any], table: Optional[TranspositionTable],
+             tie: Iterator[int]) -> Tuple[Optional[Node], float, float]:
+    """Returns (solution or None, backed-up f, lower bound through node)."""
+    if problem.is_goal(node.state):
+        return node, node.f, node.path_cost
+    on_path.add(node.state)
+    try:
+        succ, cycle_lb = _successors(problem, node, h, on_path, table, tie)
+        while True:
+            f = succ[0][0] if succ else float("inf")
+            if f > f_limit or f == float("inf"):  # inf: every branch is a dead end, even at the root
+                return None, f, _learn(table, node, succ, cycle_lb)
+            best = succ[0]
+            child = Node(best[2], node, best[3], best[4], node.depth + 1, best[0])
+            result, best[0], lb = _rbfs_tt(problem, child, min(f_limit, _alternative(succ)),
+                                           h, on_path, table, tie)
+            if result is not None:
+                return result, best[0], lb
+            best[5] = max(best[5], lb)
+            heapq.heapreplace(succ, best)  # re-sift the updated best: O(log b), no full sort
+    finally:
+        on_path.discard(node.state)
+
+@instrumented(heuristics=("h",))
+def recursive_best_first_search_tt(problem: Problem,
+                                   h: Callable[[Any], float],
+                                   table_size: Optional[int] = None,
+                                   stats: Optional[SearchStats] = None) -> Optional[Node]:
+    """
+    RBFS with an O(1) on-path set for cycle checks and a successor heap with
+    top-two selection instead of re-sorting the list on every iteration.
+
+    table_size enables a bounded transposition table. When RBFS backs out
+    of a subtree, the lower bound it learned there (minus g) is stored as a
+    better h for that state. Re-descending into the state, from here or
+    along another path, then starts from the learned value instead of
+    rediscovering it. The stored bound also covers successors pruned as
+    on-path, so it stays admissible and the result stays optimal.
+    """
+    start = Node(state=problem.initial, path_cost=0.0, depth=0)
+    start.f = h(start.state)
+    solution, _, _ = _rbfs_tt(problem, start, float("inf"), h, set(), _make_table(table_size), count())
+    return solution
+
+@instrumented(heuristics=("h",))
+def iterative_recursive_best_first_search(problem: Problem,
+                                          h: Callable[[Any], float],
+                                          table_size: Optional[int] = None,
+                                          stats: Optional[SearchStats] = None) -> Optional[Node]:
+    """
+    recursive_best_first_search_tt with an explicit stack of
+    [node, f_limit, successors, cycle_lb] frames instead of Python recursion,
+    so the solution depth is not bounded by sys.getrecursionlimit().
+    """
+    table = _make_table(table_size)
+    tie = count()
+    on_path: Set[Any] = set()
+    root = Node(state=problem.initial, path_cost=0.0, depth=0)
+    root.f = h(root.state)
+    stack: List[List[Any]] = [[root, float("inf"), None, 0.0]]
+    returned: Optional[Tuple[float, float]] = None  # (backed-up f, lb) of the frame just popped
+
+    while stack:
+        frame = stack[-1]
+        node, f_limit, succ, cycle_lb = frame
+        if succ is None:
+            if problem.is_goal(node.state):
+                return node
+            on_path.add(node.state)
+            succ, cycle_lb = frame[2], frame[3] = _successors(problem, node, h, on_path, table, tie)
+        elif returned is not None:
+            best = succ[0]
+            best[0] = returned[0]
+            best[5] = max(best[5], returned[1])
+            heapq.heapreplace(succ, best)
+            returned = None
+
+        f = succ[0][0] if succ else float("inf")
+        if f > f_limit or f == float("inf"):  # inf: every branch is a dead end, even at the root
+            returned = (f, _learn(table, node, succ, cycle_lb))
+            on_path.discard(node.state)
+            stack.pop()
+            continue
+
+        best = succ[0]
+        child = Node(best[2], node, best[3], best[4], node.depth + 1, best[0])
+        stack.append([child, min(f_limit, _alternative(succ)), None, 0.0])
+    return None
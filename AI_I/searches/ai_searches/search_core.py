@@ -0,0 +1,117 @@
+# ai_searches/search_core.py
+from __future__ import annotations
+from typing import Any, Iterable, List, Optional, Tuple
+
+"""
+Shared search core used by every algorithm in ai_searches.
+
+Node and PrioritizedItem use __slots__ instead of a per-instance __dict__,
+so a generated node costs a fixed handful of pointer-sized fields.
+On large frontiers this is the dominant memory cost of a search.
+"""
+
+# ==========================
+# Node
+# ==========================
+class Node:
+    """
+    A search-tree node.
+    path_cost = g(n); depth is the number of actions from the root;
+    f is only used by algorithms that back up f-values (RBFS).
+    """
+    __slots__ = ("state", "parent", "action", "path_cost", "depth", "f")
+
+    def __init__(self,
+                 state: Any,
+                 parent: Optional["Node"] = None,
+                 action: Optional[Any] = None,
+                 path_cost: float = 0.0,
+                 depth: int = 0,
+                 f: float = 0.0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.depth = depth
+        self.f = f
+
+    def path(self) -> List["Node"]:
+        n, acc = self, []
+        while n:
+            acc.append(n)
+            n = n.parent
+        return list(reversed(acc))
+
+    def __repr__(self) -> str:
+        return (f"Node(state={self.state!r}, action={self.action!r}, "
+                f"path_cost={self.path_cost!r}, depth={self.depth!r})")
+
+
+# ==========================
+# Priority queue entry
+# ==========================
+class PrioritizedItem:
+    """Heap entry ordered by (priority, count); the node never takes part in comparisons."""
+    __slots__ = ("priority", "count", "node")
+
+    def __init__(self, priority: float, count: int, node: Node):
+        self.priority = priority
+        self.count = count
+        self.node = node
+
+    def __lt__(self, other: "PrioritizedItem") -> bool:
+        if self.priority != other.priority:
+            return self.priority < other.priority
+        return self.count < other.count
+
+
+# ==========================
+# Problem interface
+# ==========================
+class Problem:
+    def __init__(self, initial: Any, goal: Any):
+        self.initial = initial
+        self.goal = goal
+
+    def is_goal(self, state: Any) -> bool:
+        return state == self.goal
+
+    def actions(self, state: Any) -> Iterable[Any]:
+        raise NotImplementedError
+
+    def result(self, state: Any, action: Any) -> Any:
+        raise NotImplementedError
+
+    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
+        return 1.0  # default unit cost
+
+    def successors(self, state: Any) -> Iterable[Tuple[Any, Any, float]]:
+        """
+        (action, next state, step cost) for every action in state. Every
+        search loop calls this instead of actions/result/action_cost.
+        The default combines those three, so existing problems work unchanged.
+        Override it when the next state is computed anyway while listing the
+        actions (grids, CSR edge slices): one call per expansion then
+        replaces three calls per successor.
+        """
+        for action in self.actions(state):
+            s2 = self.result(state, action)
+            yield action, s2, self.action_cost(state, action, s2)
+
+    def integer_cost_bound(self) -> Optional[int]:
+        """
+        Largest action cost if every action_cost is a non-negative integer,
+        else None. Searches use it to pick an integer bucket frontier.
+        """
+        return None
+
+
+# ==========================
+# Expand
+# ==========================
+def expand(problem: Problem, node: Node) -> Iterable[Node]:
+    """Generate successors with updated (g, depth)."""
+    g = node.path_cost
+    depth = node.depth + 1
+    for action, s2, step in problem.successors(node.state):
+        yield Node(s2, node, action, g + step, depth)
@@ -0,0 +1,298 @@
+# ai_searches/search_stats.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import functools
+import inspect
+import json
+import time
+
+from ai_searches.search_core import Problem
+
+"""
+Opt-in search statistics shared by every algorithm in ai_searches.
+
+    stats = SearchStats()
+    node = a_star_search(problem, h, stats=stats)
+    stats.to_dict()   /   stats.to_json()
+
+A search decorated with @instrumented checks one thing per call: is its
+stats argument a SearchStats? If not (None, or the plain dicts some
+searches already fill), the undecorated function runs directly and the
+hot loops are untouched. If it is, the search runs with observed stand-ins:
+  * the problem (ObservedProblem) counts expansions (successors calls),
+    generated successors, re-expanded states and goal tests, and times
+    successors(). on_expand(state), if given, is called for each expansion;
+  * the heuristic / evaluation function counts calls and times them;
+  * frontiers from make_frontier (or passed in, or watched explicitly by a
+    search) count pushes / pops / decrease-keys, track the peak size and
+    time every operation. Searches with a plain list or deque frontier
+    (BFS, DLS, BIBF) report their peak size through frontier_tracker.
+Searches that run their own loops over raw arrays or dicts instead of a
+Problem (JPS, the csr_* loops, dfs) add their counts with record_counts
+and, when the result is not a Node, set found / cost / depth themselves.
+The search's own counters (iterations, meetings, layers, ...) go into the
+SearchStats itself, which is a dict, exactly as they went into a plain dict.
+
+timing=False keeps the counters but skips the perf_counter calls.
+"""
+
+COUNTERS = ("expanded", "generated", "reexpanded", "goal_tests", "h_calls",
+            "frontier_pushes", "frontier_pops", "frontier_updates", "peak_frontier")
+TIMINGS = ("successors_seconds", "h_seconds", "frontier_seconds")
+
+class SearchStats(dict):
+    """
+    Counters and timings of one search run (reusable: each run resets it).
+    The dict part holds the algorithm's own counters.
+    """
+    def __init__(self, timing: bool = True, on_expand: Optional[Callable[[Any], None]] = None):
+        super().__init__()
+        self.timing = timing
+        self.on_expand = on_expand
+        self.algorithm: Optional[str] = None
+        self.found = False
+        self.cost: Optional[float] = None
+        self.depth: Optional[int] = None
+        self.seconds = 0.0
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.timings: Dict[str, float] = dict.fromkeys(TIMINGS, 0.0)
+        self._active = False
+
+    def reset(self) -> None:
+        self.clear()
+        self.algorithm, self.found, self.cost, self.depth, self.seconds = None, False, None, None, 0.0
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timings = dict.fromkeys(TIMINGS, 0.0)
+
+    def frontier_size(self, size: int) -> None:
+        if size > self.counters["peak_frontier"]:
+            self.counters["peak_frontier"] = size
+
+    # ---------- export ----------
+    def to_dict(self) -> Dict[str, Any]:
+        return {"algorithm": self.algorithm, "found": self.found, "cost": self.cost, "depth": self.depth,
+                "seconds": self.seconds, **self.counters, **self.timings, "extra": dict(self)}
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), default=str, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"SearchStats({self.to_dict()!r})"
+
+# ==========================
+# Observed stand-ins
+# ==========================
+class ObservedProblem(Problem):
+    """
+    Delegates to the wrapped problem and records into stats. Re-expansions
+    are counted per problem, so the two sides of a bidirectional search
+    meeting on a state do not count as one side re-expanding it.
+    """
+    def __init__(self, inner: Problem, stats: SearchStats):
+        super().__init__(inner.initial, inner.goal)
+        self.inner = inner
+        self.stats = stats
+        self.expanded_states: set = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    def is_goal(self, state: Any) -> bool:
+        self.stats.counters["goal_tests"] += 1
+        return self.inner.is_goal(state)
+
+    def actions(self, state: Any) -> Iterable[Any]:
+        return self.inner.actions(state)
+
+    def result(self, state: Any, action: Any) -> Any:
+        return self.inner.result(state, action)
+
+    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
+        return self.inner.action_cost(state, action, state2)
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return self.inner.integer_cost_bound()
+
+    def successors(self, state: Any) -> List[Tuple[Any, Any, float]]:
+        stats = self.stats
+        counters = stats.counters
+        counters["expanded"] += 1
+        seen = self.expanded_states
+        if state in seen:
+            counters["reexpanded"] += 1
+        else:
+            seen.add(state)
+        if stats.on_expand is not None:
+            stats.on_expand(state)
+        if stats.timing:
+            t0 = time.perf_counter()
+            succ = list(self.inner.successors(state))
+            stats.timings["successors_seconds"] += time.perf_counter() - t0
+        else:
+            succ = list(self.inner.successors(state))
+        counters["generated"] += len(succ)
+        return succ
+
+class ObservedFrontier:
+    """Frontier wrapper (IndexedHeap / BucketQueue interface) with counters, peak size and timings."""
+    def __init__(self, inner: Any, stats: SearchStats):
+        self.inner = inner
+        self.stats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    def __len__(self) -> int:
+        return len(self.inner)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.inner
+
+    def _timed(self, op: Callable[..., Any], *args: Any) -> Any:
+        if not self.stats.timing:
+            return op(*args)
+        t0 = time.perf_counter()
+        try:
+            return op(*args)
+        finally:
+            self.stats.timings["frontier_seconds"] += time.perf_counter() - t0
+
+    def push(self, key: Any, priority: float, item: Any = None) -> None:
+        counters = self.stats.counters
+        counters["frontier_updates" if key in self.inner else "frontier_pushes"] += 1
+        self._timed(self.inner.push, key, priority, item)
+        self.stats.frontier_size(len(self.inner))
+
+    def pop(self) -> Tuple[Any, float, Any]:
+        self.stats.counters["frontier_pops"] += 1
+        return self._timed(self.inner.pop)
+
+    def peek(self) -> Tuple[Any, float, Any]:
+        return self._timed(self.inner.peek)
+
+    def remove(self, key: Any) -> Any:
+        return self._timed(self.inner.remove, key)
+
+    def priority_of(self, key: Any) -> float:
+        return self.inner.priority_of(key)
+
+def _observed_expansion(fn: Callable[[Any], Iterable[Any]], stats: SearchStats) -> Callable[[Any], List[Any]]:
+    """A neighbour function other than successors (e.g. predecessors) counted as expansions."""
+    counters, timings = stats.counters, stats.timings
+    seen: set = set()
+
+    def observed(state: Any) -> List[Any]:
+        counters["expanded"] += 1
+        if state in seen:
+            counters["reexpanded"] += 1
+        else:
+            seen.add(state)
+        if stats.on_expand is not None:
+            stats.on_expand(state)
+        t0 = time.perf_counter() if stats.timing else 0.0
+        out = list(fn(state))
+        if stats.timing:
+            timings["successors_seconds"] += time.perf_counter() - t0
+        counters["generated"] += len(out)
+        return out
+    return observed
+
+def _observed_function(fn: Callable[..., float], stats: SearchStats) -> Callable[..., float]:
+    counters, timings = stats.counters, stats.timings
+    if not stats.timing:
+        def counted(*args: Any) -> float:
+            counters["h_calls"] += 1
+            return fn(*args)
+        return counted
+
+    def timed(*args: Any) -> float:
+        counters["h_calls"] += 1
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings["h_seconds"] += time.perf_counter() - t0
+    return timed
+
+# ==========================
+# Hooks used by the searches
+# ==========================
+def watch_frontier(problem: Any, frontier: Any) -> Any:
+    """Wrap frontier when the search runs on an ObservedProblem; otherwise return it unchanged."""
+    if isinstance(problem, ObservedProblem):
+        return ObservedFrontier(frontier, problem.stats)
+    return frontier
+
+def frontier_tracker(problem: Any) -> Optional[Callable[[int], None]]:
+    """For list / deque frontiers: a size callback when observed, else None."""
+    if isinstance(problem, ObservedProblem):
+        return problem.stats.frontier_size
+    return None
+
+def record_counts(stats: Optional[Dict[str, Any]], **counts: int) -> None:
+    """
+    Add counts (names from COUNTERS) for a search with its own loop: to the
+    counters of a SearchStats, or as keys of a plain dict. peak_frontier is
+    kept as a maximum, the others are summed.
+    """
+    if stats is None:
+        return
+    target = stats.counters if isinstance(stats, SearchStats) else stats
+    for name, value in counts.items():
+        old = target.get(name, 0)
+        target[name] = max(old, value) if name == "peak_frontier" else old + value
+
+def _solution(result: Any) -> Any:
+    if isinstance(result, tuple):       # ("success", node) from depth_limited_search
+        result = result[-1]
+    return result if hasattr(result, "path_cost") else None
+
+def instrumented(problems: Sequence[str] = ("problem",), heuristics: Sequence[str] = (),
+                 frontiers: Sequence[str] = ("frontier",),
+                 expansions: Sequence[str] = ()) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator for a search with a `stats` parameter. With a SearchStats it
+    wraps the named problem, heuristic / evaluation function, neighbour
+    function (expansions, e.g. predecessors) and (when passed) frontier
+    arguments, and records the outcome and the total time.
+    """
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        sig = inspect.signature(fn)
+        names = list(sig.parameters)
+        stats_pos = names.index("stats")
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            stats = kwargs.get("stats") if len(args) <= stats_pos else args[stats_pos]
+            if not isinstance(stats, SearchStats) or stats._active:
+                return fn(*args, **kwargs)     # disabled, or a nested call of an observed search
+            bound = sig.bind(*args, **kwargs)
+            arguments = bound.arguments
+            stats.reset()
+            stats.algorithm = fn.__name__
+            for name in problems:
+                if arguments.get(name) is not None:
+                    arguments[name] = ObservedProblem(arguments[name], stats)
+            for name in heuristics:
+                if arguments.get(name) is not None:
+                    arguments[name] = _observed_function(arguments[name], stats)
+            for name in expansions:
+                if arguments.get(name) is not None:
+                    arguments[name] = _observed_expansion(arguments[name], stats)
+            for name in frontiers:
+                if arguments.get(name) is not None:
+                    arguments[name] = ObservedFrontier(arguments[name], stats)
+            stats._active = True
+            t0 = time.perf_counter()
+            try:
+                result = fn(*bound.args, **bound.kwargs)
+            finally:
+                stats.seconds = time.perf_counter() - t0
+                stats._active = False
+            node = _solution(result)
+            if node is not None:        # else keep what a search with its own result type set
+                stats.found = True
+                stats.cost, stats.depth = node.path_cost, node.depth
+            return result
+        return wrapper
+    return decorate
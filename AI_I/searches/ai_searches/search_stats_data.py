@@ -0,0 +1,33 @@
+# ai_searches/search_stats_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.breadth_first_search import breadth_first_search
+from ai_searches.heuristics import manhattan
+from ai_searches.ida_star import ida_star_search
+from ai_searches.recursive_best_first_search import recursive_best_first_search
+from ai_searches.search_stats import SearchStats
+
+# ---------- Demo runner used by main ----------
+def run_search_stats_demo() -> None:
+    walls = [(1, 1), (1, 2), (2, 1), (3, 4), (4, 4), (5, 2)]
+    start, goal = (0, 0), (7, 7)
+
+    def h(s):
+        return manhattan(s, goal)
+
+    runs = [
+        ("BFS", lambda p, st: breadth_first_search(p, stats=st)),
+        ("A*", lambda p, st: a_star_search(p, h, stats=st)),
+        ("IDA*", lambda p, st: ida_star_search(p, h, stats=st)),
+        ("RBFS", lambda p, st: recursive_best_first_search(p, h, stats=st)),
+    ]
+    print("\n== SearchStats on 8x8 grid ==")
+    print(f"{'algorithm':<6} {'cost':>5} {'expanded':>9} {'generated':>10} {'h_calls':>8} {'peak':>5}")
+    stats = SearchStats()
+    for label, run in runs:
+        run(GridProblem(8, 8, walls, start, goal), stats)
+        print(f"{label:<6} {stats.cost:>5g} {stats.counters['expanded']:>9} {stats.counters['generated']:>10} "
+              f"{stats.counters['h_calls']:>8} {stats.counters['peak_frontier']:>5}")
+    print("last run as JSON:", stats.to_json())
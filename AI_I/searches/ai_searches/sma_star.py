@@ -0,0 +1,198 @@
+# ai_searches/sma_star.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ai_searches.frontiers import IndexedHeap
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import instrumented, watch_frontier
+
+"""
+SMA* (simplified memory-bounded A*): A* that never holds more than
+max_nodes nodes.
+
+Like A* it always works on the lowest-f frontier entry (deepest first on
+ties), but it generates one successor at a time. When memory is full it
+forgets the worst leaf (highest f, shallowest on ties) and backs that
+leaf's f-value up into its parent, which remembers it for the forgotten
+successor. The parent goes back on the frontier, so the subtree can be
+regenerated later if everything else turns out to be worse.
+
+Every node's f is a lower bound on the cost of a solution below it:
+    f(n) = max(f when n was generated, min over n's successors of their f)
+with a successor's f taken from the child in memory, the backed-up value
+of a forgotten child, or g + h for one never generated (pathmax).
+
+A successor is dropped (its f set to inf) when a node for the same state
+with g no larger is already in memory: that cheaper path stays
+represented, in memory or as a backed-up f in one of its ancestors, so
+nothing is lost, and it stops the tree search from enumerating every
+path to every state on graphs such as grids.
+
+With an admissible h the result is optimal whenever the optimal path
+(depth + 1 nodes) fits in max_nodes; otherwise the best solution that
+fits, or None. Same Problem / h_provider interface as a_star_search and
+the returned node is a search_core.Node (path(), path_cost, depth).
+"""
+
+INF = float("inf")
+
+class SMANode(Node):
+    """Node plus SMA* bookkeeping (successor table, children in memory)."""
+    __slots__ = ("uid", "floor", "succ", "bounds", "kids", "n_kids", "slot")
+
+    def __init__(self, state: Any, parent: Optional["SMANode"], action: Any, path_cost: float,
+                 depth: int, f: float, uid: int, slot: int):
+        super().__init__(state, parent, action, path_cost, depth, f)
+        self.uid = uid
+        self.floor = f                       # f when generated (includes a backed-up value)
+        self.succ: Optional[List[Tuple[Any, Any, float]]] = None  # (action, state, g) once expanded
+        self.bounds: List[float] = []        # f of each successor
+        self.kids: List[Optional["SMANode"]] = []  # successor nodes in memory, None if not
+        self.n_kids = 0
+        self.slot = slot                     # index in parent's succ
+
+
+@instrumented(heuristics=("h_provider",))
+def sma_star_search(problem: Problem,
+                    h_provider: Callable[[Any], float],
+                    max_nodes: int = 10_000,
+                    stats: Optional[Dict[str, int]] = None) -> Optional[Node]:
+    """
+    stats (optional dict) is filled with generated / forgotten / pruned / peak_nodes.
+    """
+    if max_nodes < 1:
+        raise ValueError("max_nodes must be at least 1")
+    uid = 0
+    root = SMANode(problem.initial, None, None, 0.0, 0, h_provider(problem.initial), uid, -1)
+    open_: IndexedHeap = watch_frontier(problem, IndexedHeap())    # uid -> node, priority (f of best pending successor, -depth)
+    leaves: IndexedHeap = IndexedHeap()   # uid -> node, priority (-f, depth): worst leaf first
+    open_.push(root.uid, (root.f, 0), root)
+    leaves.push(root.uid, (-root.f, 0), root)
+    in_memory: Dict[Any, List[SMANode]] = {root.state: [root]}
+    used = peak = 1
+    generated = forgotten = pruned = 0
+
+    def pending_bound(n: SMANode) -> float:
+        """Lowest f among successors not in memory (inf when all are, or none exist)."""
+        return min((b for b, kid in zip(n.bounds, n.kids) if kid is None), default=INF)
+
+    def requeue(n: SMANode) -> None:
+        if n.succ is None:
+            open_.push(n.uid, (n.f, -n.depth), n)
+            return
+        b = pending_bound(n)
+        if b < INF:
+            open_.push(n.uid, (b, -n.depth), n)
+        elif n.uid in open_:
+            open_.remove(n.uid)
+
+    def backup(n: SMANode) -> None:
+        """Recompute f(n) from its successors and push changes up the path."""
+        while n is not None:
+            new_f = max(n.floor, min(n.bounds, default=INF)) if n.succ is not None else n.f
+            changed = new_f != n.f
+            n.f = new_f
+            requeue(n)
+            if not changed:
+                return
+            if n.uid in leaves:
+                leaves.push(n.uid, (-n.f, n.depth), n)
+            p = n.parent
+            if p is not None:
+                p.bounds[n.slot] = n.f
+            n = p
+
+    def on_path(n: SMANode, s: Any) -> bool:
+        while n is not None:
+            if n.state == s:
+                return True
+            n = n.parent
+        return False
+
+    def forget(keep: SMANode) -> bool:
+        """Drop the worst leaf other than keep / the root; False if there is none."""
+        nonlocal used, forgotten
+        skipped = []
+        victim = None
+        while leaves:
+            _, _, leaf = leaves.pop()
+            if leaf is keep or leaf is root:
+                skipped.append(leaf)
+                continue
+            victim = leaf
+            break
+        for n in skipped:
+            leaves.push(n.uid, (-n.f, n.depth), n)
+        if victim is None:
+            return False
+        if victim.uid in open_:
+            open_.remove(victim.uid)
+        same = in_memory[victim.state]
+        same.remove(victim)
+        if not same:
+            del in_memory[victim.state]
+        parent = victim.parent
+        parent.kids[victim.slot] = None
+        parent.n_kids -= 1
+        parent.bounds[victim.slot] = victim.f
+        if not parent.n_kids:
+            leaves.push(parent.uid, (-parent.f, parent.depth), parent)
+        used -= 1
+        forgotten += 1
+        backup(parent)
+        return True
+
+    try:
+        while open_:
+            _, (f_best, _), best = open_.peek()
+            if f_best == INF:
+                return None
+
+            if best.succ is None:
+                # a leaf: goal test, then compute successor bounds (pathmax)
+                if problem.is_goal(best.state):
+                    return best
+                succ, bounds = [], []
+                for action, s2, step in problem.successors(best.state):
+                    if on_path(best, s2):
+                        continue
+                    g2 = best.path_cost + step
+                    succ.append((action, s2, g2))
+                    bounds.append(max(g2 + h_provider(s2), best.floor))
+                best.succ, best.bounds, best.kids = succ, bounds, [None] * len(succ)
+                backup(best)
+                continue
+
+            # generate the best successor that is not in memory
+            i = min((k for k, kid in enumerate(best.kids) if kid is None), key=best.bounds.__getitem__)
+            action, s2, g2 = best.succ[i]
+            if any(m.path_cost <= g2 for m in in_memory.get(s2, ())):
+                best.bounds[i] = INF           # dominated by a path already in memory
+                pruned += 1
+                backup(best)
+                continue
+            if used >= max_nodes and not forget(best):
+                best.bounds[i] = INF           # no room at all: this branch is out of reach
+                backup(best)
+                continue
+            f2 = best.bounds[i]
+            if best.depth + 2 >= max_nodes and not problem.is_goal(s2):
+                f2 = INF                       # the path alone fills memory: s2 can never be expanded
+            uid += 1
+            child = SMANode(s2, best, action, g2, best.depth + 1, f2, uid, i)
+            best.kids[i] = child
+            best.n_kids += 1
+            in_memory.setdefault(s2, []).append(child)
+            best.bounds[i] = f2
+            if best.uid in leaves:
+                leaves.remove(best.uid)
+            used += 1
+            generated += 1
+            peak = max(peak, used)
+            leaves.push(child.uid, (-child.f, child.depth), child)
+            open_.push(child.uid, (child.f, -child.depth), child)
+            backup(best)
+        return None
+    finally:
+        if stats is not None:
+            stats.update(generated=generated, forgotten=forgotten, pruned=pruned, peak_nodes=peak)
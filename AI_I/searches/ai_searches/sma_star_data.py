@@ -0,0 +1,23 @@
+# ai_searches/sma_star_data.py
+from __future__ import annotations
+
+from ai_searches.a_star import a_star_search, print_solution
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import manhattan
+from ai_searches.sma_star import sma_star_search
+
+# ---------- Demo runner used by main ----------
+def run_sma_star_demo() -> None:
+    walls = [(1, 1), (1, 2), (2, 1)]
+    start, goal = (0, 0), (3, 3)
+    problem = GridProblem(grid_rows=4, grid_cols=4, walls=walls, start=start, goal=goal)
+
+    def h(state) -> float:
+        return float(manhattan(state, goal))
+
+    print_solution("A* on 4x4 Grid", a_star_search(problem, h))
+    for max_nodes in (100, 10, 7, 6):
+        stats = {}
+        node = sma_star_search(problem, h, max_nodes=max_nodes, stats=stats)
+        print_solution(f"SMA* on 4x4 Grid, max_nodes={max_nodes}", node)
+        print(f"generated={stats['generated']} forgotten={stats['forgotten']} peak_nodes={stats['peak_nodes']}")
@@ -1,6 +1,6 @@
 # ai_searches/ucs_data.py
 from __future__ import annotations
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .uninformed_cost_search import Problem, uniform_cost_search, extract_actions, extract_states
 
@@ -9,6 +9,9 @@ class SimpleGraphProblem(Problem):
     def __init__(self, graph: Dict[str, Dict[str, int]], start: str, goal: str):
         super().__init__(start, goal)
         self.graph = graph
+        weights = [w for nbrs in graph.values() for w in nbrs.values()]
+        self._cost_bound: Optional[int] = (int(max(weights)) if weights and all(
+            w >= 0 and float(w).is_integer() for w in weights) else None)
 
     def actions(self, state: str) -> Iterable[str]:
         return self.graph.get(state, {}).keys()
@@ -19,6 +22,12 @@ class SimpleGraphProblem(Problem):
     def action_cost(self, state: str, action: str, state2: str) -> float:
         return float(self.graph[state][state2])
 
+    def successors(self, state: str) -> List[Tuple[str, str, float]]:
+        return [(s2, s2, float(w)) for s2, w in self.graph.get(state, {}).items()]
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return self._cost_bound  # computed once in __init__
+
 def build_sample_graph() -> Dict[str, Dict[str, int]]:
     """
       A --1-- B --2-- D --1-- G
@@ -1,8 +1,11 @@
 # ai_searches/ucs.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Dict, List, Callable
-import heapq
+from typing import Any, Optional, Dict, List, Union
+
+from ai_searches.frontiers import BucketQueue, IndexedHeap, make_frontier
+from ai_searches.node_pool import PoolNode, pooled_best_first_search
+from ai_searches.search_core import Node, Problem, expand
+from ai_searches.search_stats import SearchStats, instrumented
 
 """
 UCS also called (Dijkstra Algorithm)
@@ -10,69 +13,31 @@ Uninformed cost is picking the path with lowest cost without knowing the remain
 g(n)
 """
 
-# --------------------------
-# Core data structures
-# --------------------------
-@dataclass
-class Node:
-    state: Any
-    parent: Optional["Node"] = None
-    action: Optional[Any] = None
-    path_cost: float = 0.0
-
-    def path(self) -> List["Node"]:
-        n, acc = self, []
-        while n:
-            acc.append(n)
-            n = n.parent
-        return list(reversed(acc))
-
-class Problem:
-    def __init__(self, initial: Any, goal: Any):
-        self.initial = initial
-        self.goal = goal
-
-    def is_goal(self, state: Any) -> bool:
-        return state == self.goal
-
-    def actions(self, state: Any) -> Iterable[Any]:
-        raise NotImplementedError
-
-    def result(self, state: Any, action: Any) -> Any:
-        raise NotImplementedError
-
-    def action_cost(self, state: Any, action: Any, state2: Any) -> float:
-        return 1.0
-
-# --------------------------
-# Expand
-# --------------------------
-def expand(problem: Problem, node: Node) -> Iterable[Node]:
-    s = node.state
-    for action in problem.actions(s):
-        s2 = problem.result(s, action)
-        cost = node.path_cost + problem.action_cost(s, action, s2)
-        yield Node(state=s2, parent=node, action=action, path_cost=cost)
-
 # --------------------------
 # UCS (Dijkstra)
 # --------------------------
-@dataclass(order=True)
-class PrioritizedItem:
-    priority: float
-    count: int
-    node: Node
+@instrumented()
+def uniform_cost_search(problem: Problem,
+                        node_store: bool = False,
+                        frontier: Optional[Union[IndexedHeap, BucketQueue]] = None,
+                        stats: Optional[SearchStats] = None) -> Optional[Union[Node, PoolNode]]:
+    """
+    Uniform-cost search == best-first with f(n) = g(n) = path_cost.
+    The frontier holds one entry per state and is re-prioritised in place.
+    node_store=True keeps nodes in a columnar NodePool and returns a PoolNode.
+    stats: an optional search_stats.SearchStats.
+    """
+    if frontier is None:
+        frontier = make_frontier(problem)
+    if node_store:
+        return pooled_best_first_search(problem, lambda s, g: g, frontier=frontier)
 
-def uniform_cost_search(problem: Problem) -> Optional[Node]:
-    """Uniform-cost search == best-first with f(n) = g(n) = path_cost."""
     start = Node(problem.initial)
-    frontier: List[PrioritizedItem] = []
-    counter = 0
-    heapq.heappush(frontier, PrioritizedItem(start.path_cost, counter, start))
+    frontier.push(problem.initial, start.path_cost, start)
     reached: Dict[Any, Node] = {problem.initial: start}
 
     while frontier:
-        current = heapq.heappop(frontier).node
+        _, _, current = frontier.pop()
         if problem.is_goal(current.state):
             return current
 
@@ -80,8 +45,7 @@ def uniform_cost_search(problem: Problem) -> Optional[Node]:
             s = child.state
             if s not in reached or child.path_cost < reached[s].path_cost:
                 reached[s] = child
-                counter += 1
-                heapq.heappush(frontier, PrioritizedItem(child.path_cost, counter, child))
+                frontier.push(s, child.path_cost, child)
     return None
 
 # --------------------------
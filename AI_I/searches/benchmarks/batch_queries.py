@@ -0,0 +1,59 @@
+# benchmarks/batch_queries.py
+from __future__ import annotations
+import os
+import random
+import time
+
+import numpy as np
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.batch_queries import intern_problem, run_batch
+from ai_searches.heuristics import manhattan
+from ai_searches.uninformed_cost_search import uniform_cost_search
+from benchmarks.generators import random_grid_problem
+
+"""
+Many-to-many queries on one map: a fresh GridProblem + a_star_search /
+uniform_cost_search per query versus run_batch over a map interned once.
+
+Run from the searches directory:
+    python -m benchmarks.batch_queries
+"""
+
+def _free_pairs(graph, count: int, starts: int, seed: int):
+    """count (start, goal) pairs drawn from `starts` distinct starts (several goals per start)."""
+    rng = random.Random(seed + 1)
+    cells = list(graph.labels)
+    sources = [rng.choice(cells) for _ in range(starts)]
+    return [(rng.choice(sources), rng.choice(cells)) for _ in range(count)]
+
+def run_batch_queries_benchmark(side: int = 200, queries: int = 500, starts: int = 50, seed: int = 2) -> None:
+    base = random_grid_problem(side, side, density=0.2, seed=seed)
+    t = time.perf_counter()
+    graph = intern_problem(base)
+    coords = np.asarray(graph.labels, dtype=np.float64)
+    print(f"\n== {side}x{side} grid, {queries} queries from {starts} starts ==")
+    print(f"intern_problem {time.perf_counter() - t:6.2f}s  ({graph.n_nodes} cells, {graph.n_edges} moves)")
+    pairs = _free_pairs(graph, queries, starts, seed)
+
+    def one_by_one(search):
+        total = 0.0
+        for a, b in pairs:
+            problem = GridProblem(side, side, base.walls, a, b)
+            total += search(problem, b).path_cost
+        return total
+
+    for label, run in (("a_star_search per query", lambda: one_by_one(lambda p, b: a_star_search(p, lambda s: manhattan(s, b)))),
+                       ("run_batch A*", lambda: run_batch(graph, pairs, coords=coords).cost.sum()),
+                       ("uniform_cost_search per query", lambda: one_by_one(lambda p, b: uniform_cost_search(p))),
+                       ("run_batch Dijkstra", lambda: run_batch(graph, pairs).cost.sum()),
+                       (f"run_batch A*, {os.cpu_count()} workers",
+                        lambda: run_batch(graph, pairs, coords=coords, workers=os.cpu_count() or 1, chunk_size=64).cost.sum())):
+        t = time.perf_counter()
+        total = run()
+        print(f"{label:<32} {time.perf_counter() - t:7.2f}s  (sum of costs {total:g})")
+
+
+if __name__ == "__main__":
+    run_batch_queries_benchmark()
@@ -0,0 +1,74 @@
+# benchmarks/bidirectional.py
+from __future__ import annotations
+from typing import Any, Iterable
+import time
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.bidirectional_search import bibf_search, bidirectional_a_star_search
+from ai_searches.heuristics import manhattan
+from ai_searches.search_core import Problem
+from ai_searches.search_stats import SearchStats
+from benchmarks.generators import random_grid_problem, random_weighted_grid_problem
+
+"""
+Expansions and time: bibf_search (runs until both frontiers are empty)
+versus bidirectional_a_star_search (MM stopping rule), with one-way A*
+for reference, on unit-cost and weighted grids.
+
+Run from the searches directory:
+    python -m benchmarks.bidirectional
+"""
+
+REVERSE = {'U': 'D', 'D': 'U', 'L': 'R', 'R': 'L'}
+
+class ReversedGridProblem(Problem):
+    """Goal -> start over reversed moves; a step costs what the forward move costs."""
+    def __init__(self, forward: GridProblem):
+        super().__init__(forward.goal, forward.initial)
+        self.forward = forward
+
+    def actions(self, state: Any) -> Iterable[str]:
+        return self.forward.actions(state)
+
+    def result(self, state: Any, action: str) -> Any:
+        return self.forward.result(state, action)
+
+    def action_cost(self, state: Any, action: str, state2: Any) -> float:
+        return self.forward.action_cost(state2, REVERSE[action], state)
+
+def compare(title: str, problem: GridProblem) -> None:
+    print(f"\n== {title} ==")
+    start, goal = problem.initial, problem.goal
+
+    def hF(s: Any) -> float:
+        return float(manhattan(s, goal))
+
+    def hB(s: Any) -> float:
+        return float(manhattan(s, start))
+
+    backward = ReversedGridProblem(problem)
+
+    def run(label: str, search) -> None:
+        stats = SearchStats(timing=False)
+        t0 = time.perf_counter()
+        node = search(stats)
+        secs = time.perf_counter() - t0
+        cost = node.path_cost if node is not None else float("inf")
+        print(f"{label:<16} cost={cost:<7g} expanded={stats.counters['expanded']:<9} {secs:7.3f}s")
+
+    run("A*", lambda st: a_star_search(problem, hF, stats=st))
+    run("bibf_search", lambda st: bibf_search(problem, lambda n: n.path_cost + hF(n.state),
+                                              backward, lambda n: n.path_cost + hB(n.state), stats=st))
+    run("bidirectional A*", lambda st: bidirectional_a_star_search(problem, hF, backward, hB, epsilon=1.0,
+                                                                   reverse_action=REVERSE.get, stats=st))
+
+def run_bidirectional_benchmark() -> None:
+    compare("unit-cost grid 60x60, 25% walls", random_grid_problem(60, 60, density=0.25, seed=1))
+    compare("unit-cost grid 200x200, 20% walls", random_grid_problem(200, 200, density=0.2, seed=2))
+    compare("weighted grid 60x60 (1..9)", random_weighted_grid_problem(60, 60, seed=1))
+    compare("weighted grid 200x200 (1..9)", random_weighted_grid_problem(200, 200, seed=2))
+
+
+if __name__ == "__main__":
+    run_bidirectional_benchmark()
@@ -0,0 +1,57 @@
+# benchmarks/bidirectional_implicit.py
+from __future__ import annotations
+from typing import Callable, Optional
+import time
+import tracemalloc
+
+import numpy as np
+
+from ai_searches.bidirectional_implicit import bidirectional_bfs, bidirectional_ucs
+from ai_searches.bidirectional_implicit_data import NumberProblem
+from ai_searches.breadth_first_search import breadth_first_search, uniform_cost_search
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.search_core import Node
+
+"""
+One-way BFS / UCS versus front-to-front bidirectional search with a
+predecessors() callback, hashed and on integer ids: time and peak traced
+memory on a large occupancy grid and on the "+1 / *2" number puzzle.
+
+Run from the searches directory:
+    python -m benchmarks.bidirectional_implicit
+"""
+
+def _row(label: str, run: Callable[[], Optional[Node]]) -> None:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    node = run()
+    secs = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cost = node.path_cost if node is not None else float("inf")
+    print(f"{label:<28} cost={cost:<8g} peak={peak / 2**20:8.1f} MiB {secs:7.2f}s")
+
+def run_bidirectional_implicit_benchmark(side: int = 1000, target: int = 1_000_000) -> None:
+    walls = np.random.default_rng(2).random((side, side)) < 0.2
+    walls[0, 0] = walls[-1, -1] = False
+    grid = OccupancyGridProblem(walls, (0, 0), (side - 1, side - 1))
+    n = side * side
+    print(f"\n== occupancy grid {side}x{side}, 20% walls ==")
+    _row("BFS", lambda: breadth_first_search(grid))
+    _row("bidirectional BFS", lambda: bidirectional_bfs(grid, grid.predecessors))
+    _row("bidirectional BFS, int ids", lambda: bidirectional_bfs(grid, grid.predecessors,
+                                                                 state_id=int, id_state=int, n_states=n))
+
+    print(f"\n== 1 -> {target} with +1 / *2 ==")
+    numbers = NumberProblem(1, target, limit=2 * target)
+    _row("BFS", lambda: breadth_first_search(numbers))
+    _row("bidirectional BFS", lambda: bidirectional_bfs(numbers, numbers.predecessors))
+    _row("bidirectional BFS, int ids", lambda: bidirectional_bfs(numbers, numbers.predecessors, state_id=int,
+                                                                 id_state=int, n_states=numbers.limit + 1))
+    weighted = NumberProblem(1, target, limit=2 * target, double_cost=5.0)
+    _row("UCS, '*2' costs 5", lambda: uniform_cost_search(weighted))
+    _row("bidirectional UCS", lambda: bidirectional_ucs(weighted, weighted.predecessors))
+
+
+if __name__ == "__main__":
+    run_bidirectional_implicit_benchmark()
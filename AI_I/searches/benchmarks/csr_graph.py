@@ -0,0 +1,112 @@
+# benchmarks/csr_graph.py
+from __future__ import annotations
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from ai_searches.a_star import a_star_search
+from ai_searches.csr_graph import CSRGraph, csr_a_star, csr_bfs, csr_ucs, load_edge_list
+from ai_searches.breadth_first_search import breadth_first_search
+from ai_searches.ucs_data import SimpleGraphProblem
+from ai_searches.uninformed_cost_search import uniform_cost_search
+from benchmarks.generators import random_weighted_graph
+
+"""
+Dict-of-dicts SimpleGraphProblem + the generic searches versus the CSR
+backend and its specialised loops: memory, build/load time and query time,
+up to 10^7 edges.
+
+Run from the searches directory:
+    python -m benchmarks.csr_graph
+"""
+
+def _traced(build):
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current / 2**20
+
+def compare_with_dicts(n: int = 100_000, queries: int = 20, seed: int = 0) -> None:
+    print(f"\n== random weighted graph, {n} nodes, avg degree 4 ==")
+    graph, dict_mb = _traced(lambda: random_weighted_graph(n, avg_degree=4, seed=seed))
+    t = time.perf_counter()
+    csr, csr_mb = _traced(lambda: CSRGraph.from_dict(graph))
+    print(f"dict-of-dicts {dict_mb:7.1f} MiB   CSR {csr_mb:7.1f} MiB (build {time.perf_counter() - t:.2f}s)")
+
+    rng = random.Random(seed + 1)  # not the generator's own sequence
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    for label, run in (("UCS SimpleGraphProblem", lambda a, b: uniform_cost_search(SimpleGraphProblem(graph, a, b)).path_cost),
+                       ("csr_ucs", lambda a, b: csr_ucs(csr, a, b).cost),
+                       ("BFS SimpleGraphProblem", lambda a, b: breadth_first_search(SimpleGraphProblem(graph, a, b)).depth),
+                       ("csr_bfs", lambda a, b: len(csr_bfs(csr, a, b).labels) - 1)):
+        t = time.perf_counter()
+        total = sum(run(a, b) for a, b in pairs)
+        print(f"{label:<24} {queries} queries {time.perf_counter() - t:7.2f}s  (sum {total:g})")
+
+def grid_a_star(side: int = 300, seed: int = 0) -> None:
+    """A* with a coordinate heuristic: labels are (r, c) and h is built from them."""
+    print(f"\n== weighted {side}x{side} grid graph, labels (r, c) ==")
+    rng = random.Random(seed)
+    cost = {(r, c): rng.randint(1, 9) for r in range(side) for c in range(side)}
+    edges = [((r, c), (r + dr, c + dc), cost[(r + dr, c + dc)])
+             for r in range(side) for c in range(side) for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+             if 0 <= r + dr < side and 0 <= c + dc < side]
+    csr = CSRGraph.from_edges(edges)
+    goal = (side - 1, side - 1)
+    h = np.array([abs(r - goal[0]) + abs(c - goal[1]) for r, c in csr.labels], dtype=np.float64)
+    nested = {}
+    for u, v, w in edges:
+        nested.setdefault(u, {})[v] = w
+    problem = SimpleGraphProblem(nested, (0, 0), goal)
+    t = time.perf_counter()
+    node = a_star_search(problem, lambda s: abs(s[0] - goal[0]) + abs(s[1] - goal[1]))
+    print(f"a_star_search SimpleGraphProblem {time.perf_counter() - t:6.2f}s  cost={node.path_cost:g}")
+    t = time.perf_counter()
+    result = csr_a_star(csr, (0, 0), goal, h)
+    print(f"csr_a_star                       {time.perf_counter() - t:6.2f}s  cost={result.cost:g}")
+
+def large_graph(n: int = 2_500_000, degree: int = 4, seed: int = 0) -> None:
+    """n * degree directed edges straight from NumPy arrays (a ring keeps it connected)."""
+    print(f"\n== {n} nodes, {n * degree} edges ==")
+    rng = np.random.default_rng(seed)
+    t = time.perf_counter()
+    src = np.concatenate([np.arange(n), rng.integers(0, n, n * (degree - 1))])
+    dst = np.concatenate([(np.arange(n) + 1) % n, rng.integers(0, n, n * (degree - 1))])
+    w = rng.integers(1, 20, len(src)).astype(np.float64)
+    csr = CSRGraph.from_arrays(range(n), src, dst, w)
+    nbytes = csr.indptr.nbytes + csr.indices.nbytes + csr.weights.nbytes
+    print(f"build {time.perf_counter() - t:6.2f}s   arrays {nbytes / 2**20:7.1f} MiB")
+    for label, run in (("csr_bfs", csr_bfs), ("csr_ucs", csr_ucs)):
+        t = time.perf_counter()
+        result = run(csr, 0, n // 2)
+        print(f"{label:<8} {time.perf_counter() - t:6.2f}s  cost={result.cost:g} expanded={result.expanded}")
+
+def edge_list_load(n_edges: int = 1_000_000, seed: int = 0) -> None:
+    print(f"\n== edge-list file, {n_edges} lines ==")
+    rng = np.random.default_rng(seed)
+    edges = np.column_stack([rng.integers(0, n_edges // 4, n_edges), rng.integers(0, n_edges // 4, n_edges),
+                             rng.integers(1, 20, n_edges)])
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w") as f:
+            np.savetxt(f, edges, fmt="%d")
+        t = time.perf_counter()
+        csr = load_edge_list(path, directed=True, label_type=int)
+        print(f"load_edge_list {time.perf_counter() - t:6.2f}s  ({csr.n_nodes} nodes, {csr.n_edges} edges)")
+    finally:
+        os.unlink(path)
+
+def run_csr_graph_benchmark() -> None:
+    compare_with_dicts()
+    grid_a_star()
+    large_graph()
+    edge_list_load()
+
+
+if __name__ == "__main__":
+    run_csr_graph_benchmark()
@@ -0,0 +1,50 @@
+# benchmarks/distance_fields.py
+from __future__ import annotations
+import random
+import time
+
+from ai_searches.a_star import a_star_search
+from ai_searches.distance_field import distance_field
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.search_stats import SearchStats
+from ai_searches.uninformed_cost_search import uniform_cost_search
+from benchmarks.generators import random_walls
+
+"""
+Many starts, one goal: one uniform_cost_search per start versus a single
+distance field, and A* expansions with Manhattan versus the field as h.
+Starts are drawn from the cells that can reach the goal (finite field).
+
+Run from the searches directory:
+    python -m benchmarks.distance_fields
+"""
+
+def run_distance_field_benchmark(size: int = 500, starts: int = 20, seed: int = 0) -> None:
+    goal = (size - 1, size - 1)
+    walls = random_walls(size, size, 0.25, seed, keep_free=(goal,))
+    grid = OccupancyGridProblem.from_walls(size, size, walls, start=(0, 0), goal=goal)
+    print(f"\n== {starts} starts -> one goal on {size}x{size} grid ==")
+
+    t = time.perf_counter()
+    field = distance_field(grid)
+    field_seconds = time.perf_counter() - t
+    rng = random.Random(seed)
+    connected = [s for s in range(size * size) if grid.passable(s) and field(s) < float("inf")]
+    picks = rng.sample(connected, starts)
+
+    t = time.perf_counter()
+    for s in picks:
+        uniform_cost_search(OccupancyGridProblem(grid.blocked, s, goal))
+    print(f"UCS per start        {time.perf_counter() - t:6.2f}s")
+    print(f"one distance field   {field_seconds:6.2f}s")
+
+    for label, h in (("Manhattan", grid.manhattan_heuristic()), ("distance field", field)):
+        expanded = 0
+        stats = SearchStats(timing=False)
+        for s in picks:
+            a_star_search(OccupancyGridProblem(grid.blocked, s, goal), h, stats=stats)
+            expanded += stats.counters["expanded"]
+        print(f"A* expansions, h = {label:<15} {expanded}")
+
+if __name__ == "__main__":
+    run_distance_field_benchmark()
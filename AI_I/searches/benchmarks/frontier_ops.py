@@ -0,0 +1,115 @@
+# benchmarks/frontier_ops.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional
+import heapq
+import time
+
+from ai_searches.a_star import a_star_search
+from ai_searches.frontiers import BucketQueue, IndexedHeap
+from ai_searches.heuristics import manhattan
+from ai_searches.search_core import Node, PrioritizedItem, Problem, expand
+from ai_searches.search_stats import SearchStats, instrumented, record_counts
+from ai_searches.ucs_data import SimpleGraphProblem
+from ai_searches.uninformed_cost_search import uniform_cost_search
+from benchmarks.generators import random_grid_problem, random_weighted_graph, random_weighted_grid_problem
+
+"""
+Frontier operations with the old push-a-duplicate heapq frontier versus the
+IndexedHeap (decrease-key, one entry per state) now used by A* and UCS,
+and IndexedHeap versus the BucketQueue picked for integer-cost problems.
+
+Run from the searches directory:
+    python -m benchmarks.frontier_ops
+"""
+
+# ==========================
+# Previous frontier (kept here only for comparison)
+# ==========================
+@instrumented(frontiers=())
+def legacy_best_first_search(problem: Problem, f: Callable[[Node], float],
+                             stats: Optional[SearchStats] = None) -> Optional[Node]:
+    start = Node(problem.initial)
+    frontier: List[PrioritizedItem] = []
+    counter = pops = 0
+    heapq.heappush(frontier, PrioritizedItem(f(start), counter, start))
+    reached: Dict[Any, Node] = {problem.initial: start}
+
+    try:
+        while frontier:
+            current = heapq.heappop(frontier).node
+            pops += 1
+            if problem.is_goal(current.state):
+                return current
+            for child in expand(problem, current):
+                s = child.state
+                if s not in reached or child.path_cost < reached[s].path_cost:
+                    reached[s] = child
+                    counter += 1
+                    heapq.heappush(frontier, PrioritizedItem(f(child), counter, child))
+        return None
+    finally:
+        record_counts(stats, frontier_pushes=counter + 1, frontier_pops=pops)
+
+# ==========================
+# Runner
+# ==========================
+def _row(label: str, run: Callable[[Optional[SearchStats]], Optional[Node]]) -> SearchStats:
+    # counted in one run, timed in a second one without the observed wrappers
+    stats = SearchStats(timing=False)
+    run(stats)
+    t = time.perf_counter()
+    run(None)
+    secs = time.perf_counter() - t
+    c = stats.counters
+    print(f"{label:<10} cost={stats.cost:<8g} pushes={c['frontier_pushes'] + c['frontier_updates']:<9} "
+          f"pops={c['frontier_pops']:<9} expanded={c['expanded']:<9} re-expanded={c['reexpanded']:<8} {secs:6.2f}s")
+    return stats
+
+def compare(title: str, problem_factory: Callable[[], Problem], h: Callable[[Any], float]) -> None:
+    """h == 0 everywhere makes both runs uniform-cost search."""
+    print(f"\n== {title} ==")
+    _row("heapq", lambda st: legacy_best_first_search(problem_factory(), lambda n: n.path_cost + h(n.state),
+                                                      stats=st))
+    stats = _row("indexed", lambda st: a_star_search(problem_factory(), h, frontier=IndexedHeap(), stats=st))
+    print(f"{'':<10} in-place updates (decrease-key) = {stats.counters['frontier_updates']}")
+
+def run_frontier_benchmark(size: int = 300, seed: int = 0) -> None:
+    goal = (size - 1, size - 1)
+
+    def h(s: Any) -> float:
+        return float(manhattan(s, goal))
+
+    compare(f"A* on {size}x{size} unit grid, 25% walls",
+            lambda: random_grid_problem(size, size, 0.25, seed), h)
+    compare(f"A* on {size}x{size} weighted grid (1..9)",
+            lambda: random_weighted_grid_problem(size, size, 0.2, 9, seed), h)
+    n = size * size
+    graph = random_weighted_graph(n, avg_degree=6, max_weight=20, seed=seed)
+    compare(f"UCS on random graph ({n} nodes, weights 1..20)",
+            lambda: SimpleGraphProblem(graph, start=0, goal=n - 1), lambda s: 0.0)
+
+def _timed(search: Callable[[Any], Optional[Node]], frontier: Any) -> None:
+    t = time.perf_counter()
+    node = search(frontier)
+    secs = time.perf_counter() - t
+    print(f"{type(frontier).__name__:<12} cost={node.path_cost:<8g} pops={frontier.pops:<9} {secs:6.2f}s")
+
+def run_bucket_benchmark(size: int = 500, seed: int = 0) -> None:
+    goal = (size - 1, size - 1)
+
+    def h(s: Any) -> float:
+        return float(manhattan(s, goal))
+
+    unit = random_grid_problem(size, size, 0.25, seed)
+    weighted = random_weighted_grid_problem(size, size, 0.2, 9, seed)
+    for title, search in (
+            (f"A* on {size}x{size} unit grid", lambda fr: a_star_search(unit, h, frontier=fr)),
+            (f"UCS on {size}x{size} unit grid", lambda fr: uniform_cost_search(unit, frontier=fr)),
+            (f"UCS on {size}x{size} weighted grid (1..9)", lambda fr: uniform_cost_search(weighted, frontier=fr))):
+        print(f"\n== {title} ==")
+        _timed(search, IndexedHeap())
+        _timed(search, BucketQueue())
+
+if __name__ == "__main__":
+    run_frontier_benchmark()
+    run_bucket_benchmark()
@@ -0,0 +1,225 @@
+# benchmarks/generators.py
+from __future__ import annotations
+import random
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ai_searches.a_star_data import GridProblem
+from ai_searches.csr_graph import CSRGraph, CSRProblem
+from ai_searches.occupancy_grid import OccupancyGridProblem
+
+"""
+Seeded workload generators. Same seed -> same map, so runs are comparable.
+
+The GridProblem / dict-of-dicts builders suit maps up to ~10^5 states. For
+10^6 - 10^7 states, the *_grid functions return a NumPy wall array (for
+OccupancyGridProblem) and random_csr_graph builds the CSR arrays directly.
+"""
+
+Coord = Tuple[int, int]
+
+def random_walls(rows: int, cols: int, density: float, seed: int,
+                 keep_free: Tuple[Coord, ...] = ()) -> List[Coord]:
+    """Each cell is a wall with probability `density` (cells in keep_free never are)."""
+    rng = random.Random(seed)
+    free = set(keep_free)
+    return [(r, c) for r in range(rows) for c in range(cols)
+            if rng.random() < density and (r, c) not in free]
+
+def random_grid_problem(rows: int, cols: int, density: float = 0.25, seed: int = 0) -> GridProblem:
+    """4-neighbour unit-cost grid from the top-left to the bottom-right corner."""
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    walls = random_walls(rows, cols, density, seed, keep_free=(start, goal))
+    return GridProblem(rows, cols, walls, start, goal)
+
+class WeightedGridProblem(GridProblem):
+    """GridProblem where entering a cell costs that cell's weight (1..max_weight)."""
+    def __init__(self, rows: int, cols: int, walls: List[Coord], start: Coord, goal: Coord,
+                 max_weight: int = 9, seed: int = 0):
+        super().__init__(rows, cols, walls, start, goal)
+        rng = random.Random(seed)
+        self.weights = [[rng.randint(1, max_weight) for _ in range(cols)] for _ in range(rows)]
+
+    def action_cost(self, state: Coord, action: str, state2: Coord) -> float:
+        return float(self.weights[state2[0]][state2[1]])
+
+    def successors(self, state: Coord) -> List[Tuple[str, Coord, float]]:
+        weights = self.weights
+        return [(a, s2, float(weights[s2[0]][s2[1]])) for a, s2, _ in super().successors(state)]
+
+    def integer_cost_bound(self) -> Optional[int]:
+        return max(max(row) for row in self.weights)
+
+def maze_walls(rows: int, cols: int, seed: int = 0) -> List[Coord]:
+    """
+    Perfect maze (one path between any two open cells), carved by a
+    randomised depth-first search. Passages lie on even (row, col); a row or
+    column left over by an even size stays wall.
+    """
+    open_ = _carve_maze(rows, cols, seed)
+    return [divmod(i, cols) for i in range(rows * cols) if not open_[i]]
+
+def _carve_maze(rows: int, cols: int, seed: int) -> bytearray:
+    """Open cells (1) of the maze_walls maze, row-major."""
+    rng = random.Random(seed)
+    open_ = bytearray(rows * cols)
+    open_[0] = 1
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, dr // 2, dc // 2) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 <= r + dr < rows and 0 <= c + dc < cols and not open_[(r + dr) * cols + c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        r2, c2, hr, hc = rng.choice(options)
+        open_[(r + hr) * cols + c + hc] = 1
+        open_[r2 * cols + c2] = 1
+        stack.append((r2, c2))
+    return open_
+
+def random_weighted_grid_problem(rows: int, cols: int, density: float = 0.2,
+                                 max_weight: int = 9, seed: int = 0) -> WeightedGridProblem:
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    walls = random_walls(rows, cols, density, seed, keep_free=(start, goal))
+    return WeightedGridProblem(rows, cols, walls, start, goal, max_weight, seed)
+
+def random_weighted_graph(n: int, avg_degree: int = 4, max_weight: int = 20,
+                          seed: int = 0) -> Dict[int, Dict[int, int]]:
+    """
+    Undirected connected graph in the ucs_data dict-of-dicts layout: a random
+    spanning path plus random chords, integer weights in 1..max_weight.
+    """
+    rng = random.Random(seed)
+    graph: Dict[int, Dict[int, int]] = {v: {} for v in range(n)}
+    order = list(range(n))
+    rng.shuffle(order)
+
+    def link(u: int, v: int) -> None:
+        if u != v and v not in graph[u]:
+            w = rng.randint(1, max_weight)
+            graph[u][v] = w
+            graph[v][u] = w
+
+    for u, v in zip(order, order[1:]):
+        link(u, v)
+    for _ in range(max(0, n * avg_degree // 2 - (n - 1))):
+        link(rng.randrange(n), rng.randrange(n))
+    return graph
+
+# ==========================
+# Large maps (NumPy)
+# ==========================
+def corner_cells(rows: int, cols: int) -> Tuple[Coord, Coord]:
+    """Top-left and bottom-right corners, the start and goal of the grid workloads."""
+    return (0, 0), (rows - 1, cols - 1)
+
+def random_grid(rows: int, cols: int, density: float = 0.25, seed: int = 0) -> np.ndarray:
+    """Bool wall array: each cell is a wall with probability density; the corners and their neighbours are free."""
+    walls = np.random.default_rng(seed).random((rows, cols)) < density
+    walls[:2, :2] = False
+    walls[-2:, -2:] = False
+    return walls
+
+def maze_grid(rows: int, cols: int, seed: int = 0) -> np.ndarray:
+    """
+    The maze_walls maze as a bool wall array. With an even size the
+    bottom-right corner is wall, so a short corridor joins it to the last passage.
+    """
+    walls = np.frombuffer(_carve_maze(rows, cols, seed), dtype=np.uint8).reshape(rows, cols) == 0
+    r, c = (rows - 1) // 2 * 2, (cols - 1) // 2 * 2
+    walls[r:, c] = False
+    walls[rows - 1, c:] = False
+    return walls
+
+def rooms_grid(rows: int, cols: int, room: int = 16, seed: int = 0) -> np.ndarray:
+    """
+    Rooms of room x room cells separated by one-cell walls, with one door at
+    a random place in every wall segment between two neighbouring rooms, so
+    every room is reachable. The corners are kept free.
+    """
+    rng = random.Random(seed)
+    walls = np.zeros((rows, cols), dtype=bool)
+    row_lines, col_lines = list(range(room, rows, room + 1)), list(range(room, cols, room + 1))
+    walls[row_lines, :] = True
+    walls[:, col_lines] = True
+
+    def spans(lines: List[int], size: int) -> List[Tuple[int, int]]:
+        bounds = [-1] + lines + [size]
+        return [(a + 1, b) for a, b in zip(bounds, bounds[1:]) if a + 1 < b]
+
+    for r in row_lines:
+        for lo, hi in spans(col_lines, cols):
+            walls[r, rng.randrange(lo, hi)] = False
+    for c in col_lines:
+        for lo, hi in spans(row_lines, rows):
+            walls[rng.randrange(lo, hi), c] = False
+    start, goal = corner_cells(rows, cols)
+    walls[start] = walls[goal] = False
+    return walls
+
+def grid_problem(walls: np.ndarray) -> OccupancyGridProblem:
+    """Corner-to-corner OccupancyGridProblem over a wall array."""
+    return OccupancyGridProblem(walls, *corner_cells(*walls.shape))
+
+class UndirectedCSRProblem(CSRProblem):
+    """
+    CSRProblem over an undirected graph. twin[e] is the reverse edge of e,
+    so predecessors (for bidirectional_implicit) and reversed backward
+    actions come from the same arrays.
+    """
+    def __init__(self, graph: CSRGraph, start: int, goal: int, twin: np.ndarray):
+        super().__init__(graph, start, goal)
+        self.twin = twin
+        self._twin = memoryview(twin)
+
+    def predecessors(self, state: int) -> List[Tuple[int, int]]:
+        lo, hi = self._indptr[state], self._indptr[state + 1]
+        return list(zip(self._twin[lo:hi], self._indices[lo:hi]))
+
+    def reversed(self) -> "UndirectedCSRProblem":
+        return UndirectedCSRProblem(self.graph, self.goal, self.initial, self.twin)
+
+def random_csr_graph(n: int, avg_degree: int = 4, max_weight: int = 20,
+                     seed: int = 0) -> Tuple[CSRGraph, np.ndarray]:
+    """
+    The random_weighted_graph model (random spanning path plus random
+    chords, integer weights in 1..max_weight, no loops or parallel edges)
+    built with NumPy, labels range(n). Returns the graph and its twin array.
+    """
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(n)
+    chords = max(0, n * avg_degree // 2 - (n - 1))
+    u = np.concatenate([order[:-1], rng.integers(0, n, chords)])
+    v = np.concatenate([order[1:], rng.integers(0, n, chords)])
+    lo, hi = np.minimum(u, v), np.maximum(u, v)
+    _, first = np.unique(lo * n + hi, return_index=True)
+    first = np.sort(first[lo[first] != hi[first]])        # keep generation order: the path comes first
+    u, v = u[first], v[first]
+    w = rng.integers(1, max_weight + 1, len(u)).astype(np.float64)
+    m = len(u)
+    # the CSRGraph.from_arrays layout, built here so the sort order also gives the twins
+    index_type = np.int32 if n < 2**31 else np.int64
+    src = np.concatenate([u, v]).astype(index_type)
+    dst = np.concatenate([v, u]).astype(index_type)
+    del u, v, lo, hi, first
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    del src
+    indices = dst[order]
+    del dst
+    weights = np.concatenate([w, w])[order]
+    pos = np.empty(2 * m, dtype=np.int64)        # edge k (k < m: u -> v, else v -> u) is at pos[k]
+    pos[order] = np.arange(2 * m)
+    del order
+    twin = np.empty(2 * m, dtype=np.int64)
+    twin[pos] = np.concatenate([pos[m:], pos[:m]])
+    return CSRGraph(range(n), indptr, indices, weights), twin
+
+def graph_problem(graph: CSRGraph, twin: np.ndarray, seed: int = 0) -> UndirectedCSRProblem:
+    """Query between two random nodes (the seed + 1 stream, so the map seed picks the map only)."""
+    rng = random.Random(seed + 1)
+    n = graph.n_nodes
+    return UndirectedCSRProblem(graph, rng.randrange(n), rng.randrange(n), twin)
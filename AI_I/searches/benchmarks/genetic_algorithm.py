@@ -0,0 +1,123 @@
+# benchmarks/genetic_algorithm.py
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import time
+
+import numpy as np
+
+from run_individually.ga_engine import (genetic_algorithm_cached, make_tuple_mutate,
+                                        queens_fitness_batch, random_queens_population,
+                                        vectorized_genetic_algorithm)
+from run_individually.genetic_algorithm import genetic_algorithm, queens_fitness
+from run_individually.island_ga import island_genetic_algorithm
+from run_individually.queens_board import QueensBoard, mutate_board, queens_genetic_algorithm, reproduce_boards
+
+"""
+N-queens GA throughput: the original genetic_algorithm versus the cached,
+process-pool and vectorised engines in run_individually.ga_engine.
+Reported as microseconds per individual per generation, since the
+original is too slow to run at the full population size.
+run_large_n_benchmark() compares single operations for N in the
+thousands: pairwise queens_fitness versus the QueensBoard counters.
+run_island_benchmark() measures island-model throughput (individual
+evaluations per second) for 1..cpu_count islands of fixed size.
+
+Run from the searches directory:
+    python -m benchmarks.genetic_algorithm
+"""
+
+def _per_individual(label: str, secs: float, pop_size: int, generations: int) -> float:
+    us = secs / (pop_size * generations) * 1e6
+    print(f"{label:<34} pop={pop_size:<7} gens={generations:<4} {secs:7.2f}s  {us:9.2f} us/ind/gen")
+    return us
+
+def run_ga_benchmark(n: int = 64, pop_size: int = 10_000, generations: int = 20,
+                     baseline_pop: int = 1000, baseline_generations: int = 1, seed: int = 0) -> None:
+    print(f"\n== N-queens GA, N={n} ==")
+    population = [tuple(row) for row in random_queens_population(pop_size, n, seed=seed).tolist()]
+
+    # mutation_rate=0: the original mutate() only knows string genes 1..8
+    random.seed(seed)
+    t0 = time.perf_counter()
+    genetic_algorithm(population[:baseline_pop], queens_fitness, max_generations=baseline_generations,
+                      mutation_rate=0.0)
+    base = _per_individual("genetic_algorithm (original)", time.perf_counter() - t0,
+                           baseline_pop, baseline_generations)
+
+    t0 = time.perf_counter()
+    rng = random.Random(seed)
+    genetic_algorithm_cached(population, queens_fitness, max_generations=2, mutate_fn=make_tuple_mutate(n, rng),
+                             rng=rng)
+    _per_individual("cached, serial", time.perf_counter() - t0, pop_size, 2)
+
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        t0 = time.perf_counter()
+        rng = random.Random(seed)
+        genetic_algorithm_cached(population, queens_fitness, max_generations=2, mutate_fn=make_tuple_mutate(n, rng),
+                                 executor=pool, rng=rng)
+        _per_individual(f"cached, {workers} processes", time.perf_counter() - t0, pop_size, 2)
+
+    matrix = random_queens_population(pop_size, n, seed=seed)
+    t0 = time.perf_counter()
+    vectorized_genetic_algorithm(matrix, queens_fitness_batch, max_generations=generations,
+                                 rng=np.random.default_rng(seed))
+    vec = _per_individual("vectorised NumPy population", time.perf_counter() - t0, pop_size, generations)
+    print(f"vectorised speed-up over the original: {base / vec:.0f}x")
+
+
+def run_large_n_benchmark(sizes=(1000, 4000), reps: int = 200, pop_size: int = 200,
+                          generations: int = 20, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        print(f"\n== N-queens operations, N={n} ==")
+        a, b = QueensBoard.random(n, rng), QueensBoard.random(n, rng)
+
+        t0 = time.perf_counter()
+        queens_fitness(a.queens)
+        pairwise = time.perf_counter() - t0
+        print(f"{'queens_fitness (pairwise)':<30} {pairwise * 1e6:12.1f} us/call")
+
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            mutate_board(a, rng)
+        print(f"{'mutate_board + fitness':<30} {(time.perf_counter() - t0) / reps * 1e6:12.1f} us/call")
+
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            reproduce_boards(a, b, rng)
+        cross = (time.perf_counter() - t0) / reps
+        print(f"{'reproduce_boards + fitness':<30} {cross * 1e6:12.1f} us/call")
+
+        matrix = random_queens_population(pop_size, n, seed=seed)
+        t0 = time.perf_counter()
+        queens_fitness_batch(matrix)
+        print(f"{'queens_fitness_batch':<30} {(time.perf_counter() - t0) / pop_size * 1e6:12.1f} us/individual")
+
+        t0 = time.perf_counter()
+        queens_genetic_algorithm(n, pop_size=pop_size, max_generations=generations, rng=rng)
+        secs = time.perf_counter() - t0
+        print(f"queens_genetic_algorithm: pop={pop_size} gens={generations} {secs:.2f}s "
+              f"(pairwise fitness alone would take ~{pairwise * pop_size * generations:.0f}s)")
+
+
+def run_island_benchmark(n: int = 64, pop_size: int = 5000, generations: int = 50, seed: int = 0) -> None:
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cpus} if cpus > 1 else {1, 2})
+    print(f"\n== Island GA throughput, N={n}, {pop_size} per island, {generations} generations, {cpus} CPUs ==")
+    base = None
+    for k in counts:
+        populations = np.stack([random_queens_population(pop_size, n, seed=seed + i) for i in range(k)])
+        result = island_genetic_algorithm(populations, queens_fitness_batch, max_generations=generations,
+                                          migration_interval=10, seed=seed)
+        rate = result["evaluations"] / result["seconds"]
+        base = base or rate
+        print(f"islands={k:<3} {result['seconds']:6.2f}s  {rate:12.0f} evals/s  x{rate / base:.2f}")
+
+
+if __name__ == "__main__":
+    run_ga_benchmark()
+    run_large_n_benchmark()
+    run_island_benchmark()
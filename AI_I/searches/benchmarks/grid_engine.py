@@ -0,0 +1,42 @@
+# benchmarks/grid_engine.py
+from __future__ import annotations
+import time
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import manhattan
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.uninformed_cost_search import uniform_cost_search
+from benchmarks.generators import random_walls
+
+"""
+A* and UCS on the same large random map with the tuple-state GridProblem
+and the NumPy-backed OccupancyGridProblem.
+
+Run from the searches directory:
+    python -m benchmarks.grid_engine
+"""
+
+def run_grid_engine_benchmark(size: int = 1000, density: float = 0.25, seed: int = 0) -> None:
+    start, goal = (0, 0), (size - 1, size - 1)
+    walls = random_walls(size, size, density, seed, keep_free=(start, goal))
+    print(f"\n== {size}x{size} grid, {density:.0%} walls ==")
+
+    t = time.perf_counter()
+    grid = GridProblem(size, size, walls, start, goal)
+    print(f"GridProblem          build {time.perf_counter() - t:6.2f}s")
+    t = time.perf_counter()
+    occ = OccupancyGridProblem.from_walls(size, size, walls, start, goal)
+    print(f"OccupancyGridProblem build {time.perf_counter() - t:6.2f}s")
+
+    for label, problem, h in (("GridProblem", grid, lambda s: float(manhattan(s, goal))),
+                              ("OccupancyGridProblem", occ, occ.manhattan_heuristic())):
+        t = time.perf_counter()
+        node = a_star_search(problem, h)
+        print(f"{label:<20} A*  {time.perf_counter() - t:6.2f}s  cost={node.path_cost:g}")
+        t = time.perf_counter()
+        node = uniform_cost_search(problem)
+        print(f"{label:<20} UCS {time.perf_counter() - t:6.2f}s  cost={node.path_cost:g}")
+
+if __name__ == "__main__":
+    run_grid_engine_benchmark()
@@ -0,0 +1,79 @@
+# benchmarks/iterative_deepening.py
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional
+import contextlib
+import io
+import time
+
+from ai_searches.a_star import a_star_search
+from ai_searches.heuristics import manhattan
+from ai_searches.ida_star import ida_star_search
+from ai_searches.iterative_deepening_search import iterative_deepening_path_search, iterative_deepening_search
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import SearchStats
+from benchmarks.generators import random_grid_problem, random_weighted_grid_problem
+
+"""
+Iterative deepening: the DLS-restarting iterative_deepening_search (with
+and without its per-iteration prints) versus the incremental-path engine,
+and IDA* versus A*.
+
+Run from the searches directory:
+    python -m benchmarks.iterative_deepening
+"""
+
+class TreeProblem(Problem):
+    """
+    Complete `branching`-ary tree of integers (root 0); the goal is the
+    middle leaf at `depth`, so neither child order reaches it first.
+    """
+    def __init__(self, branching: int, depth: int):
+        goal = 0
+        for _ in range(depth):
+            goal = goal * branching + (branching + 1) // 2
+        super().__init__(0, goal)
+        self.branching = branching
+
+    def actions(self, state: int) -> Iterable[int]:
+        return range(1, self.branching + 1)
+
+    def result(self, state: int, action: int) -> int:
+        return state * self.branching + action
+
+def _row(label: str, run: Callable[[Problem, SearchStats], Optional[Node]], problem: Problem,
+         stats: Optional[SearchStats] = None) -> None:
+    stats = stats if stats is not None else SearchStats(timing=False)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        node = run(problem, stats)
+    secs = time.perf_counter() - t0
+    outcome = f"cost={node.path_cost:g}" if node is not None else "no solution"
+    print(f"{label:<28} {outcome:<12} generated={stats.counters['generated']:<9} {secs:7.3f}s")
+
+def run_iterative_deepening_benchmark() -> None:
+    print("\n== IDS, 3-ary tree of depth 11 ==")
+    tree = TreeProblem(3, 11)
+    _row("IDS (DLS restarts, verbose)", lambda p, st: iterative_deepening_search(p, verbose=True, stats=st), tree)
+    _row("IDS (DLS restarts)", lambda p, st: iterative_deepening_search(p, stats=st), tree)
+    _row("IDS incremental path", lambda p, st: iterative_deepening_path_search(p, stats=st), tree)
+
+    print("\n== IDS, unit-cost grid 5x5, 20% walls ==")
+    grid = random_grid_problem(5, 5, density=0.2, seed=2)
+    _row("IDS (DLS restarts)", lambda p, st: iterative_deepening_search(p, max_depth=30, stats=st), grid)
+    _row("IDS incremental path", lambda p, st: iterative_deepening_path_search(p, max_depth=30, stats=st), grid)
+
+    for title, problem in (("unit-cost grid 8x8, 25% walls", random_grid_problem(8, 8, seed=1)),
+                           ("weighted grid 5x5 (1..9)", random_weighted_grid_problem(5, 5, seed=1))):
+        print(f"\n== IDA* vs A*, {title} ==")
+        goal = problem.goal
+
+        def h(s: Any) -> float:
+            return float(manhattan(s, goal))
+        _row("A*", lambda p, st: a_star_search(p, h, stats=st), problem)
+        stats = SearchStats(timing=False)
+        _row("IDA*", lambda p, st: ida_star_search(p, h, stats=st), problem, stats)
+        print(f"IDA* iterations={stats['iterations']}")
+
+
+if __name__ == "__main__":
+    run_iterative_deepening_benchmark()
@@ -0,0 +1,101 @@
+# benchmarks/landmarks.py
+from __future__ import annotations
+from typing import Any, Callable, List
+import os
+import random
+import tempfile
+import time
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.heuristics import manhattan
+from ai_searches.landmarks import LandmarkTable
+from ai_searches.search_core import Problem
+from ai_searches.search_stats import SearchStats
+from ai_searches.ucs_data import SimpleGraphProblem
+from benchmarks.generators import random_walls, random_weighted_graph
+
+"""
+A* expansions with Manhattan distance versus ALT landmark heuristics on a
+walled grid, and with h = 0 versus ALT on a random weighted graph (where
+there is no geometric heuristic at all). Also the preprocessing cost and
+the save / load time of the tables.
+
+Run from the searches directory:
+    python -m benchmarks.landmarks
+"""
+
+def serpentine_walls(side: int, gap: int = 10, seed: int = 0) -> List[tuple]:
+    """Wall rows every `gap` rows with one opening, alternating ends, plus 10% random walls."""
+    walls = set(random_walls(side, side, 0.1, seed, keep_free=((0, 0), (side - 1, side - 1))))
+    for k, r in enumerate(range(gap, side - 1, gap)):
+        opening = side - 1 if k % 2 == 0 else 0
+        walls.update((r, c) for c in range(side) if c != opening)
+        walls.difference_update({(r - 1, opening), (r, opening), (r + 1, opening)})
+    return sorted(walls)
+
+def _table(problem: Problem, k: int) -> LandmarkTable:
+    t = time.perf_counter()
+    table = LandmarkTable.build(problem, k)
+    build = time.perf_counter() - t
+    fd, path = tempfile.mkstemp(suffix=".npz")
+    os.close(fd)
+    try:
+        t = time.perf_counter()
+        table.save(path)
+        save = time.perf_counter() - t
+        t = time.perf_counter()
+        table = LandmarkTable.load(path)
+        print(f"k={k}: build {build:6.2f}s  save {save:5.2f}s  load {time.perf_counter() - t:5.2f}s  "
+              f"tables {table.nbytes / 2**20:6.1f} MiB  file {os.path.getsize(path) / 2**20:6.1f} MiB")
+    finally:
+        os.unlink(path)
+    return table
+
+def _compare(queries: List[Problem], heuristics: List[tuple]) -> None:
+    for label, make_h in heuristics:
+        expanded, secs, total = 0, 0.0, 0.0
+        stats = SearchStats(timing=False)
+        for problem in queries:
+            t = time.perf_counter()
+            h = make_h(problem.goal)
+            node = a_star_search(problem, h, stats=stats)
+            secs += time.perf_counter() - t
+            expanded += stats.counters["expanded"]
+            total += node.path_cost
+        print(f"{label:<28} expanded={expanded:<9} {secs:7.2f}s  (sum of costs {total:g})")
+
+def walled_grid(side: int = 200, queries: int = 20, seed: int = 0) -> None:
+    walls = serpentine_walls(side, seed=seed)
+    base = GridProblem(side, side, walls, (0, 0), (side - 1, side - 1))
+    print(f"\n== {side}x{side} serpentine grid, {queries} queries ==")
+    table = _table(base, k=8)
+    rng = random.Random(seed + 1)
+    cells = list(table.states)
+    problems = [GridProblem(side, side, walls, rng.choice(cells), rng.choice(cells)) for _ in range(queries)]
+
+    def manhattan_h(goal: Any) -> Callable[[Any], float]:
+        return lambda s: float(manhattan(s, goal))
+
+    def combined_h(goal: Any) -> Callable[[Any], float]:
+        alt = table.heuristic(goal)
+        return lambda s: max(alt(s), float(manhattan(s, goal)))
+
+    _compare(problems, [("A* manhattan", manhattan_h), ("A* landmarks", table.heuristic),
+                        ("A* max(manhattan, landmarks)", combined_h)])
+
+def weighted_graph(n: int = 50_000, queries: int = 20, seed: int = 0) -> None:
+    graph = random_weighted_graph(n, avg_degree=4, seed=seed)
+    print(f"\n== random weighted graph, {n} nodes, {queries} queries ==")
+    table = _table(SimpleGraphProblem(graph, 0, 1), k=8)
+    rng = random.Random(seed + 1)
+    problems = [SimpleGraphProblem(graph, rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    _compare(problems, [("A* h = 0 (Dijkstra)", lambda goal: lambda s: 0.0), ("A* landmarks", table.heuristic)])
+
+def run_landmarks_benchmark() -> None:
+    walled_grid()
+    weighted_graph()
+
+
+if __name__ == "__main__":
+    run_landmarks_benchmark()
@@ -0,0 +1,81 @@
+# benchmarks/memory_bounded.py
+from __future__ import annotations
+from typing import Any, Callable, Optional
+import time
+import tracemalloc
+
+from ai_searches.a_star import a_star_search
+from ai_searches.heuristics import manhattan
+from ai_searches.recursive_best_first_search import recursive_best_first_search
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import SearchStats
+from ai_searches.sma_star import sma_star_search
+from benchmarks.generators import random_grid_problem, random_weighted_grid_problem
+
+"""
+Peak memory and node generation: A* versus SMA* at several max_nodes
+budgets (fractions of what A* kept) versus RBFS. "kept" is the number of
+nodes the algorithm holds at its peak (for RBFS an upper bound).
+
+Run from the searches directory:
+    python -m benchmarks.memory_bounded
+"""
+
+def _measure(label: str, run: Callable[[Problem, SearchStats], Optional[Node]], problem: Problem,
+             kept: Callable[[SearchStats], int]) -> Optional[Node]:
+    stats = SearchStats(timing=False)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    node = run(problem, stats)
+    secs = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cost = node.path_cost if node is not None else float("inf")
+    print(f"{label:<22} cost={cost:<7g} generated={stats.counters['generated']:<9} kept={kept(stats):<8} "
+          f"peak={peak / 1024:9.1f} KiB {secs:7.2f}s")
+    return node
+
+def compare(title: str, problem: Problem, budgets=(0.5, 0.25, 0.1), rbfs: bool = True) -> None:
+    print(f"\n== {title} ==")
+    goal = problem.goal
+
+    def h(s: Any) -> float:
+        return float(manhattan(s, goal))
+
+    # A* keeps every generated node reachable (frontier or reached); RBFS keeps
+    # one successor list per level, at most depth * branching nodes
+    def a_star_kept(st: SearchStats) -> int:
+        return st.counters["generated"] + 1
+
+    a_star_kept_nodes = [0]
+
+    def run_a_star(p: Problem, st: SearchStats) -> Optional[Node]:
+        node = a_star_search(p, h, stats=st)
+        a_star_kept_nodes[0] = a_star_kept(st)
+        return node
+
+    _measure("A*", run_a_star, problem, a_star_kept)
+    for share in budgets:
+        max_nodes = max(2, int(a_star_kept_nodes[0] * share))
+        _measure(f"SMA* max_nodes={max_nodes}", lambda p, st: sma_star_search(p, h, max_nodes=max_nodes, stats=st),
+                 problem, lambda st: st["peak_nodes"])
+    if rbfs:
+        depth = [0]
+
+        def run_rbfs(p: Problem, st: SearchStats) -> Optional[Node]:
+            node = recursive_best_first_search(p, h, stats=st)
+            depth[0] = node.depth if node is not None else 0
+            return node
+        _measure("RBFS", run_rbfs, problem, lambda st: 4 * depth[0] + 1)
+
+def run_memory_bounded_benchmark() -> None:
+    compare("unit-cost grid 14x14, 25% walls", random_grid_problem(14, 14, density=0.25, seed=1),
+            budgets=(0.5, 0.2))
+    compare("unit-cost grid 100x100, 25% walls", random_grid_problem(100, 100, density=0.25, seed=1),
+            budgets=(0.5, 0.25, 0.125), rbfs=False)
+    compare("weighted grid 14x14 (1..9)", random_weighted_grid_problem(14, 14, seed=1), budgets=(0.5, 0.25),
+            rbfs=False)  # plain RBFS re-expands exponentially on weighted grids
+
+
+if __name__ == "__main__":
+    run_memory_bounded_benchmark()
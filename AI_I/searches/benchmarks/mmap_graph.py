@@ -0,0 +1,71 @@
+# benchmarks/mmap_graph.py
+from __future__ import annotations
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from ai_searches.csr_graph import csr_ucs, load_edge_list
+from ai_searches.mmap_graph import MmapGraph, MmapGraphProblem, convert_csv
+from ai_searches.uninformed_cost_search import uniform_cost_search
+
+"""
+On-disk graph file versus parsing the edge list on every start: CSV ->
+file conversion time, open time, traced Python memory, and query time on
+the mapping versus in memory.
+
+Run from the searches directory:
+    python -m benchmarks.mmap_graph
+"""
+
+def _write_csv(path: str, n: int, m: int, seed: int, chunk: int = 1_000_000) -> None:
+    """m random undirected edges plus a ring 0-1-...-(n-1), written in chunks."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w") as f:
+        ring = np.arange(n)
+        np.savetxt(f, np.column_stack([ring, (ring + 1) % n, rng.integers(1, 20, n)]), fmt="%d", delimiter=",")
+        for lo in range(0, m - n, chunk):
+            k = min(chunk, m - n - lo)
+            np.savetxt(f, np.column_stack([rng.integers(0, n, k), rng.integers(0, n, k), rng.integers(1, 20, k)]),
+                       fmt="%d", delimiter=",")
+
+def _timed(label: str, run):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = run()
+    secs = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {secs:7.2f}s   traced now {current / 2**20:7.1f} MiB, peak {peak / 2**20:7.1f} MiB")
+    return value
+
+def run_mmap_graph_benchmark(n: int = 500_000, m: int = 2_000_000, seed: int = 0) -> None:
+    print(f"\n== {n} nodes, {m} undirected edges ==")
+    tmp = tempfile.mkdtemp()
+    csv_path, graph_path = os.path.join(tmp, "edges.csv"), os.path.join(tmp, "graph.bin")
+    try:
+        _write_csv(csv_path, n, m, seed)
+        _timed("convert_csv (streaming)", lambda: convert_csv(csv_path, graph_path, chunk_edges=1 << 18))
+        print(f"file size {os.path.getsize(graph_path) / 2**20:.1f} MiB")
+
+        in_memory = _timed("load_edge_list (parse CSV)", lambda: load_edge_list(csv_path, delimiter=","))
+        mapped = _timed("MmapGraph.open", lambda: MmapGraph.open(graph_path))
+
+        start, goal = "0", str(n // 2)
+        a = _timed("csr_ucs in memory", lambda: csr_ucs(in_memory, start, goal))
+        b = _timed("csr_ucs on the mapping", lambda: csr_ucs(mapped, start, goal))
+        problem = MmapGraphProblem(mapped, start, goal)
+        node = _timed("uniform_cost_search (mapped)", lambda: uniform_cost_search(problem))
+        print(f"costs {a.cost:g} / {b.cost:g} / {node.path_cost:g}")
+        del problem, node
+        mapped.close()
+    finally:
+        for name in os.listdir(tmp):
+            os.unlink(os.path.join(tmp, name))
+        os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    run_mmap_graph_benchmark()
@@ -0,0 +1,71 @@
+# benchmarks/node_memory.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+import tracemalloc
+
+from ai_searches.search_core import Node, PrioritizedItem
+
+"""
+Bytes per generated node: the per-module @dataclass Node/PrioritizedItem
+that every search used to define (one __dict__ per instance) versus the
+__slots__ versions in ai_searches.search_core.
+
+Run from the searches directory:
+    python -m benchmarks.node_memory
+"""
+
+# ==========================
+# Previous layout (kept here only for comparison)
+# ==========================
+@dataclass
+class DictNode:
+    state: Any
+    parent: Optional["DictNode"] = None
+    action: Optional[Any] = None
+    path_cost: float = 0.0
+
+@dataclass(order=True)
+class DictPrioritizedItem:
+    priority: float
+    count: int
+    node: DictNode
+
+# ==========================
+# Measurement
+# ==========================
+def bytes_per_node(make_node: Callable[[Any, Any, int], Any],
+                   make_item: Callable[[float, int, Any], Any],
+                   n: int) -> float:
+    """
+    Build a chain of n nodes (each on the frontier as a heap entry) and
+    return the traced bytes per node. States are shared tuples so only the
+    node/entry overhead is measured.
+    """
+    states = [(i // 1000, i % 1000) for i in range(n)]
+    keep: List[Any] = []
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    parent = None
+    for i in range(n):
+        node = make_node(states[i], parent, i)
+        keep.append(make_item(float(i), i, node))
+        parent = node
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - base) / n
+
+def run_node_memory_benchmark(n: int = 200_000) -> None:
+    before = bytes_per_node(
+        lambda s, p, i: DictNode(state=s, parent=p, action='R', path_cost=float(i)),
+        DictPrioritizedItem, n)
+    after = bytes_per_node(
+        lambda s, p, i: Node(s, p, 'R', float(i), i),
+        PrioritizedItem, n)
+    print(f"\n== Bytes per generated node (n={n}) ==")
+    print(f"dataclass Node + PrioritizedItem : {before:8.1f}")
+    print(f"__slots__ Node + PrioritizedItem : {after:8.1f}")
+    print(f"saving                           : {100.0 * (1 - after / before):7.1f}%")
+
+if __name__ == "__main__":
+    run_node_memory_benchmark()
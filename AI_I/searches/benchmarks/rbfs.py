@@ -0,0 +1,76 @@
+# benchmarks/rbfs.py
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional
+import sys
+import time
+
+from ai_searches.heuristics import manhattan
+from ai_searches.recursive_best_first_search import (
+    iterative_recursive_best_first_search,
+    recursive_best_first_search,
+    recursive_best_first_search_tt,
+)
+from ai_searches.search_core import Node, Problem
+from ai_searches.search_stats import SearchStats
+from benchmarks.generators import random_grid_problem, random_weighted_grid_problem
+
+"""
+RBFS variants: the original (parent-chain cycle check, full sort per
+iteration) versus the on-path set + successor heap version, with and
+without a transposition table, and its iterative form. Also a corridor
+deeper than sys.getrecursionlimit(), which only the iterative form solves.
+
+Run from the searches directory:
+    python -m benchmarks.rbfs
+"""
+
+class CorridorProblem(Problem):
+    """States 0..length on a line; the goal is the far end."""
+    def __init__(self, length: int):
+        super().__init__(0, length)
+
+    def actions(self, state: int) -> Iterable[int]:
+        return [d for d in (1, -1) if 0 <= state + d <= self.goal]
+
+    def result(self, state: int, action: int) -> int:
+        return state + action
+
+def _row(label: str, run: Callable[[Problem, SearchStats], Optional[Node]], problem: Problem) -> None:
+    stats = SearchStats(timing=False)
+    t0 = time.perf_counter()
+    try:
+        node = run(problem, stats)
+        outcome = f"cost={node.path_cost:g}" if node is not None else "no solution"
+    except RecursionError:
+        outcome = "RecursionError"
+    secs = time.perf_counter() - t0
+    print(f"{label:<24} {outcome:<16} generated={stats.counters['generated']:<9} {secs:7.3f}s")
+
+def compare(title: str, problem: Problem, original: bool = True, table_size: int = 100_000) -> None:
+    print(f"\n== {title} ==")
+    goal = problem.goal
+
+    def h(s: Any) -> float:
+        return float(manhattan(s, goal))
+
+    if original:
+        _row("RBFS", lambda p, st: recursive_best_first_search(p, h, stats=st), problem)
+    _row("RBFS on-path + heap", lambda p, st: recursive_best_first_search_tt(p, h, stats=st), problem)
+    _row("RBFS + table", lambda p, st: recursive_best_first_search_tt(p, h, table_size, stats=st), problem)
+    _row("iterative RBFS + table", lambda p, st: iterative_recursive_best_first_search(p, h, table_size, stats=st), problem)
+
+def run_rbfs_benchmark() -> None:
+    compare("unit-cost grid 12x12, 25% walls", random_grid_problem(12, 12, density=0.25, seed=1))
+    compare("weighted grid 6x6 (1..9)", random_weighted_grid_problem(6, 6, seed=3))
+    compare("weighted grid 9x9 (1..9)", random_weighted_grid_problem(9, 9, seed=3), original=False)
+
+    length = 2 * sys.getrecursionlimit()
+    corridor = CorridorProblem(length)
+    print(f"\n== corridor of {length} states ==")
+    h = lambda s: float(length - s)
+    _row("RBFS on-path + heap", lambda p, st: recursive_best_first_search_tt(p, h, stats=st), corridor)
+    _row("iterative RBFS", lambda p, st: iterative_recursive_best_first_search(p, h, stats=st), corridor)
+
+
+if __name__ == "__main__":
+    run_rbfs_benchmark()
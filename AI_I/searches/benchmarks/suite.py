@@ -0,0 +1,471 @@
+# benchmarks/suite.py
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.batch_queries import intern_problem, run_batch
+from ai_searches.best_first_search import best_first_search
+from ai_searches.bidirectional_implicit import bidirectional_bfs, bidirectional_ucs
+from ai_searches.bidirectional_search import bibf_search, bidirectional_a_star_search
+from ai_searches.breadth_first_search import breadth_first_search
+from ai_searches.csr_graph import GraphPath, csr_a_star, csr_bfs, csr_ucs
+from ai_searches.depth_limited_search import depth_limited_search
+from ai_searches.ida_star import ida_star_search
+from ai_searches.iterative_deepening_search import iterative_deepening_path_search, iterative_deepening_search
+from ai_searches.jump_point_search import jump_point_search
+from ai_searches.landmarks import LandmarkTable
+from ai_searches.mmap_graph import MmapGraph, write_graph
+from ai_searches.occupancy_grid import REVERSE_4
+from ai_searches.recursive_best_first_search import (iterative_recursive_best_first_search,
+                                                     recursive_best_first_search,
+                                                     recursive_best_first_search_tt)
+from ai_searches.search_core import Problem
+from ai_searches.search_stats import SearchStats
+from ai_searches.sma_star import sma_star_search
+from ai_searches.uninformed_cost_search import uniform_cost_search
+from benchmarks.generators import (graph_problem, grid_problem, maze_grid, random_csr_graph,
+                                   random_grid, rooms_grid)
+
+"""
+Reproducible benchmark suite: every search in ai_searches on seeded
+generated workloads of 10^3 - 10^7 states.
+
+Workloads (one query each, all from benchmarks.generators):
+    random   grid with 25% random walls, corner to corner
+    maze     perfect maze, corner to corner
+    rooms    16x16 rooms joined by one door per wall
+    graph    random undirected graph, average degree 4, weights 1..20,
+             between two random nodes
+Grids are OccupancyGridProblems (flat cell ids), so 10^7 cells fit in
+memory. The map is built once per workload. Every algorithm then runs in
+a forked child process (Linux / macOS), so a crash, a timeout or a
+memory blow-up stays isolated, and each child starts with the same RSS.
+
+In each child, the algorithm's own setup (landmark tables, interning,
+GridProblem for JPS, the graph file for mmap_ucs, the BFS depth that
+dls uses as its limit) is done first and left out of the figures. Then:
+  1. a plain run (stats=None) gives the wall time (best of --repeat) and
+     the RSS growth (ru_maxrss after the run minus RSS before it);
+  2. a run with a SearchStats under tracemalloc gives expanded /
+     generated / peak frontier and the peak traced allocation.
+Run 2 is slower (tracing), so it is not timed. RSS growth only shows
+memory beyond what the setup freed; the traced peak is the exact figure.
+Algorithms whose search space or running time blows up (IDS and DLS on
+grids, IDA* / RBFS / SMA* on large maps, recursive RBFS past the
+recursion limit) have a size limit per workload family. Larger
+workloads are recorded as "skipped", and runs longer than --timeout as
+"timeout". Algorithms marked optimal must all agree on the cost of a
+workload; a disagreement is reported as a failure.
+
+    python -m benchmarks.suite                          # 10^3, 10^4, 10^5
+    python -m benchmarks.suite --sizes 1e3,1e4 --save base.json
+    python -m benchmarks.suite --sizes 1e3,1e4 --baseline base.json
+    python -m benchmarks.suite --sizes 1e6,1e7 --workloads random,graph
+
+With --baseline, each result is compared against the saved one: a
+changed cost or status, more expansions, or time / memory beyond the
+tolerances is a regression, and the exit status is 1. Expansions,
+costs and traced memory are deterministic. Wall time and RSS depend on
+the machine, so only compare baselines saved on the same one.
+"""
+
+WORKLOADS = ("random", "maze", "rooms", "graph")
+DEFAULT_SIZES = (10**3, 10**4, 10**5)
+
+# ==========================
+# Workloads
+# ==========================
+@dataclass
+class Workload:
+    kind: str
+    size: int
+    seed: int
+    problem: Problem
+    states: int
+    h: Callable[[Any], float]           # admissible heuristic to the goal
+    h_back: Callable[[Any], float]      # ... to the start, for the backward side
+    reverse_action: Callable[[Any], Any]
+    walls: Optional[np.ndarray] = None  # grids only
+    graph: Any = None                   # CSRGraph, graph workload only
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}-{self.size}"
+
+    @property
+    def family(self) -> str:
+        return "graph" if self.kind == "graph" else "grid"
+
+def make_workload(kind: str, size: int, seed: int = 0) -> Workload:
+    if kind == "graph":
+        graph, twin = random_csr_graph(size, seed=seed)
+        problem = graph_problem(graph, twin, seed)
+
+        def zero(state: Any) -> float:
+            return 0.0
+        return Workload(kind, size, seed, problem, graph.n_nodes, zero, zero, twin.__getitem__, graph=graph)
+    side = max(2, math.isqrt(size - 1) + 1)      # smallest square grid with >= size cells
+    build = {"random": random_grid, "maze": maze_grid, "rooms": rooms_grid}[kind]
+    walls = build(side, side, seed=seed)
+    problem = grid_problem(walls)
+    return Workload(kind, size, seed, problem, side * side, problem.manhattan_heuristic(),
+                    problem.manhattan_heuristic(problem.initial), REVERSE_4.get, walls=walls)
+
+# ==========================
+# Algorithms
+# ==========================
+@dataclass
+class Algorithm:
+    """
+    setup(workload) -> run(stats) is called in the child; only run is measured.
+    limits: largest workload size per family ("grid" / "graph"); absent = no limit.
+    """
+    name: str
+    setup: Callable[[Workload], Callable[[Optional[SearchStats]], Any]]
+    optimal: bool = True
+    limits: Dict[str, int] = field(default_factory=dict)
+
+def _simple(search: Callable[..., Any], with_h: bool = False) -> Callable[[Workload], Callable]:
+    def setup(w: Workload) -> Callable[[Optional[SearchStats]], Any]:
+        if with_h:
+            return lambda stats: search(w.problem, w.h, stats=stats)
+        return lambda stats: search(w.problem, stats=stats)
+    return setup
+
+def _a_star_pool(w: Workload):
+    return lambda stats: a_star_search(w.problem, w.h, node_store=True, stats=stats)
+
+def _greedy(w: Workload):
+    h = w.h
+    return lambda stats: best_first_search(w.problem, lambda n: h(n.state), stats=stats)
+
+def _sma_star(w: Workload):
+    # half the states: enough memory for a solution, small enough to forget nodes on open maps
+    return lambda stats: sma_star_search(w.problem, w.h, max_nodes=max(64, w.states // 2), stats=stats)
+
+def _ids(search: Callable[..., Any]) -> Callable[[Workload], Callable]:
+    def setup(w: Workload):
+        return lambda stats: search(w.problem, max_depth=64, stats=stats)
+    return setup
+
+def _dls(w: Workload):
+    # limit = depth of the shallowest solution, so one DLS pass finds a goal
+    limit = breadth_first_search(w.problem).depth
+    return lambda stats: depth_limited_search(w.problem, limit, stats=stats)
+
+def _rbfs_tt(search: Callable[..., Any]) -> Callable[[Workload], Callable]:
+    def setup(w: Workload):
+        return lambda stats: search(w.problem, w.h, table_size=w.states, stats=stats)
+    return setup
+
+def _bibf(w: Workload):
+    back = w.problem.reversed()
+    h, h_back = w.h, w.h_back
+    return lambda stats: bibf_search(w.problem, lambda n: n.path_cost + h(n.state),
+                                     back, lambda n: n.path_cost + h_back(n.state), stats=stats)
+
+def _bi_a_star(w: Workload):
+    back = w.problem.reversed()
+    return lambda stats: bidirectional_a_star_search(w.problem, w.h, back, w.h_back,
+                                                     reverse_action=w.reverse_action, stats=stats)
+
+def _bi_implicit(search: Callable[..., Any]) -> Callable[[Workload], Callable]:
+    def setup(w: Workload):
+        return lambda stats: search(w.problem, w.problem.predecessors, stats=stats)
+    return setup
+
+def _alt(w: Workload):
+    table = (LandmarkTable.from_graph(w.graph, k=8) if w.graph is not None
+             else LandmarkTable.build(w.problem, k=8))
+    h = table.heuristic(w.problem.goal)
+    return lambda stats: a_star_search(w.problem, h, stats=stats)
+
+def _jps(w: Workload):
+    rows, cols = w.walls.shape
+    p = w.problem
+    walls = [tuple(cell) for cell in np.argwhere(w.walls).tolist()]
+    grid = GridProblem(rows, cols, walls, p.coord(p.initial), p.coord(p.goal))
+    return lambda stats: jump_point_search(grid, stats=stats)
+
+def _csr_graph(w: Workload):
+    return w.graph if w.graph is not None else intern_problem(w.problem)
+
+def _csr(search: Callable[..., Any], with_h: bool = False) -> Callable[[Workload], Callable]:
+    def setup(w: Workload):
+        p = w.problem
+        graph = _csr_graph(w)
+        if with_h:
+            labels, h = graph.labels, w.h
+            hv = [h(labels[i]) for i in range(graph.n_nodes)]
+            return lambda stats: search(graph, p.initial, p.goal, hv, stats=stats)
+        return lambda stats: search(graph, p.initial, p.goal, stats=stats)
+    return setup
+
+def _mmap_ucs(w: Workload):
+    p = w.problem
+    fd, path = tempfile.mkstemp(suffix=".csr")
+    os.close(fd)
+    try:
+        write_graph(_csr_graph(w), path)
+        graph = MmapGraph.open(path)
+    finally:
+        os.unlink(path)      # the mapping stays valid until the child exits
+    return lambda stats: csr_ucs(graph, p.initial, p.goal, stats=stats)
+
+def _batch(w: Workload):
+    p = w.problem
+    graph = _csr_graph(w)
+
+    def run(stats: Optional[SearchStats]) -> GraphPath:
+        result = run_batch(graph, [(p.initial, p.goal)])
+        return GraphPath(result.path(0), float(result.cost[0]), int(result.expanded[0]))
+    return run
+
+ALGORITHMS: List[Algorithm] = [
+    Algorithm("bfs", _simple(breadth_first_search), optimal=False),
+    Algorithm("ucs", _simple(uniform_cost_search)),
+    Algorithm("greedy", _greedy, optimal=False, limits={"graph": 0}),     # h = 0 there: arbitrary order
+    Algorithm("a_star", _simple(a_star_search, with_h=True)),
+    Algorithm("a_star_pool", _a_star_pool),
+    Algorithm("a_star_alt", _alt, limits={"grid": 10**5, "graph": 10**5}),
+    Algorithm("ida_star", _simple(ida_star_search, with_h=True), limits={"grid": 10**3, "graph": 10**3}),
+    Algorithm("rbfs", _simple(recursive_best_first_search, with_h=True), limits={"grid": 10**3, "graph": 10**3}),
+    Algorithm("rbfs_tt", _rbfs_tt(recursive_best_first_search_tt), limits={"grid": 10**3, "graph": 10**3}),
+    Algorithm("rbfs_iter", _rbfs_tt(iterative_recursive_best_first_search), limits={"grid": 10**4, "graph": 10**5}),
+    Algorithm("sma_star", _sma_star, limits={"grid": 10**4, "graph": 10**4}),
+    Algorithm("ids", _ids(iterative_deepening_search), optimal=False, limits={"grid": 0, "graph": 10**3}),
+    Algorithm("ids_path", _ids(iterative_deepening_path_search), optimal=False, limits={"grid": 0}),
+    Algorithm("dls", _dls, optimal=False, limits={"grid": 0}),
+    Algorithm("bibf", _bibf),
+    Algorithm("bi_a_star", _bi_a_star),
+    Algorithm("bi_bfs", _bi_implicit(bidirectional_bfs), optimal=False),
+    Algorithm("bi_ucs", _bi_implicit(bidirectional_ucs)),
+    Algorithm("jps", _jps, limits={"grid": 10**6, "graph": 0}),
+    Algorithm("csr_bfs", _csr(csr_bfs), optimal=False, limits={"grid": 10**6}),
+    Algorithm("csr_ucs", _csr(csr_ucs), limits={"grid": 10**6}),
+    Algorithm("csr_a_star", _csr(csr_a_star, with_h=True), limits={"grid": 10**6}),
+    Algorithm("mmap_ucs", _mmap_ucs, limits={"grid": 10**6, "graph": 10**6}),
+    Algorithm("batch_ucs", _batch, limits={"grid": 10**6}),
+]
+
+# ==========================
+# Measuring
+# ==========================
+def _cost(result: Any) -> Optional[float]:
+    if isinstance(result, tuple):                 # ("success", node)
+        result = result[-1]
+    for attr in ("path_cost", "cost"):            # Node / PoolNode, GraphPath
+        if hasattr(result, attr):
+            return float(getattr(result, attr))
+    return None
+
+def _expanded(stats: SearchStats, result: Any) -> int:
+    # BatchSearcher keeps no SearchStats: fall back to the GraphPath count
+    if stats.counters["expanded"]:
+        return stats.counters["expanded"]
+    return int(getattr(result, "expanded", 0))
+
+def _max_rss() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024     # bytes on macOS, KiB on Linux
+
+def _measure(algorithm: Algorithm, workload: Workload, repeat: int, conn: Any) -> None:
+    """Child process: send the timed figures, then the traced ones."""
+    try:
+        run = algorithm.setup(workload)
+        best = float("inf")
+        rss0 = _max_rss()
+        for _ in range(repeat):
+            gc.collect()
+            t0 = time.perf_counter()
+            result = run(None)
+            best = min(best, time.perf_counter() - t0)
+            cost = _cost(result)
+            del result
+        conn.send({"status": "ok", "cost": cost, "seconds": best, "rss_bytes": max(0, _max_rss() - rss0)})
+
+        stats = SearchStats(timing=False)
+        gc.collect()
+        tracemalloc.start()
+        result = run(stats)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        conn.send({"expanded": _expanded(stats, result), "generated": stats.counters["generated"],
+                   "peak_frontier": stats.counters["peak_frontier"], "traced_bytes": peak})
+    except Exception as exc:       # reported as the case's status
+        conn.send({"status": f"error: {type(exc).__name__}: {exc}"})
+    finally:
+        conn.close()
+
+def run_case(algorithm: Algorithm, workload: Workload, timeout: float, repeat: int = 1) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"workload": workload.name, "kind": workload.kind, "size": workload.size,
+                           "states": workload.states, "algorithm": algorithm.name, "status": "skipped"}
+    if workload.size > algorithm.limits.get(workload.family, workload.size):
+        return row
+    row["status"] = "timeout"           # until the child reports
+    ctx = multiprocessing.get_context("fork")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure, args=(algorithm, workload, repeat, child))
+    proc.start()
+    child.close()
+    try:
+        # timed part, then traced part, each within the timeout; a late traced
+        # part only leaves its figures out
+        for _ in range(2):
+            if not parent.poll(timeout):
+                break
+            try:
+                row.update(parent.recv())
+            except EOFError:               # killed (e.g. out of memory) without a word
+                if "seconds" not in row:
+                    proc.join(1)
+                    row["status"] = f"crashed (exit code {proc.exitcode})"
+                break
+            if row["status"] != "ok":
+                break
+    finally:
+        proc.kill()
+        proc.join()
+        parent.close()
+    return row
+
+# ==========================
+# Baselines
+# ==========================
+TOLERANCES = {"seconds": 0.25, "rss_bytes": 0.25, "traced_bytes": 0.10, "expanded": 0.0}
+FLOORS = {"seconds": 0.05, "rss_bytes": 4 << 20, "traced_bytes": 64 << 10, "expanded": 0}   # ignore smaller changes
+
+def save_baseline(path: str, rows: List[Dict[str, Any]], meta: Dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": rows}, f, indent=1)
+
+def compare(rows: List[Dict[str, Any]], path: str,
+            tolerances: Optional[Dict[str, float]] = None) -> List[str]:
+    """Regression messages for rows against the baseline file (improvements are printed, not returned)."""
+    tolerances = {**TOLERANCES, **(tolerances or {})}
+    with open(path) as f:
+        base = {(r["workload"], r["algorithm"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for row in rows:
+        old = base.get((row["workload"], row["algorithm"]))
+        if old is None or row["status"] == old["status"] == "skipped":
+            continue
+        key = f"{row['workload']:<16} {row['algorithm']:<12}"
+        if row["status"] != old["status"]:
+            regressions.append(f"{key} status {old['status']} -> {row['status']}")
+            continue
+        if row["status"] != "ok":
+            continue
+        if row.get("cost") != old.get("cost"):
+            regressions.append(f"{key} cost {old.get('cost')} -> {row.get('cost')}")
+        for metric, tol in tolerances.items():
+            a, b = old.get(metric), row.get(metric)
+            if a is None or b is None or abs(b - a) <= FLOORS[metric]:
+                continue
+            if b > a * (1 + tol):
+                regressions.append(f"{key} {metric} {a:.6g} -> {b:.6g} (+{(b / a - 1) * 100 if a else math.inf:.0f}%)")
+            elif b < a * (1 - tol):
+                print(f"  improved: {key} {metric} {a:.6g} -> {b:.6g}")
+    return regressions
+
+def cost_mismatches(rows: List[Dict[str, Any]]) -> List[str]:
+    """Optimal algorithms that disagree with the others on a workload's cost."""
+    optimal = {a.name for a in ALGORITHMS if a.optimal}
+    costs: Dict[str, Dict[str, float]] = {}
+    for row in rows:
+        if row["algorithm"] in optimal and row["status"] == "ok":
+            costs.setdefault(row["workload"], {})[row["algorithm"]] = row["cost"]
+    out = []
+    for workload, by_alg in costs.items():
+        if len(set(by_alg.values())) > 1:
+            out.append(f"{workload}: optimal costs disagree {by_alg}")
+    return out
+
+# ==========================
+# Runner
+# ==========================
+def _fmt(row: Dict[str, Any]) -> str:
+    head = f"{row['workload']:<16} {row['algorithm']:<12}"
+    if row["status"] != "ok":
+        return f"{head} {row['status']}"
+    cost = row["cost"] if row["cost"] is not None else math.inf
+    traced = f"{row['traced_bytes'] / 2**20:9.1f}" if "traced_bytes" in row else f"{'-':>9}"
+    expanded = row.get("expanded", "-")
+    return (f"{head} cost={cost:<10.6g} expanded={expanded:<9} {row['seconds']:8.3f}s "
+            f"traced={traced} MiB rss=+{row['rss_bytes'] / 2**20:.1f} MiB")
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, workloads: Sequence[str] = WORKLOADS,
+              algorithms: Optional[Sequence[str]] = None, seed: int = 0, timeout: float = 60.0,
+              repeat: int = 1) -> List[Dict[str, Any]]:
+    chosen = [a for a in ALGORITHMS if algorithms is None or a.name in algorithms]
+    rows = []
+    for size in sizes:
+        for kind in workloads:
+            t0 = time.perf_counter()
+            workload = make_workload(kind, size, seed)
+            built = time.perf_counter() - t0
+            print(f"\n== {workload.name}: {workload.states} states, built in {built:.1f}s ==", flush=True)
+            for algorithm in chosen:
+                row = run_case(algorithm, workload, timeout, repeat)
+                rows.append(row)
+                print(_fmt(row), flush=True)
+            del workload
+            gc.collect()
+    return rows
+
+def _meta(args: argparse.Namespace) -> Dict[str, Any]:
+    return {"python": platform.python_version(), "machine": platform.machine(), "platform": platform.platform(),
+            "numpy": np.__version__, "seed": args.seed, "sizes": args.sizes, "repeat": args.repeat,
+            "timeout": args.timeout, "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite",
+                                     description="Run every search on seeded generated workloads.")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        type=lambda s: [int(float(x)) for x in s.split(",")], help="comma-separated, e.g. 1e3,1e4")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS), type=lambda s: s.split(","))
+    parser.add_argument("--algorithms", default=None, type=lambda s: s.split(","),
+                        help=f"subset of {','.join(a.name for a in ALGORITHMS)}")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds per run")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per case (best is kept)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    args = parser.parse_args(argv)
+    for kind in args.workloads:
+        if kind not in WORKLOADS:
+            parser.error(f"unknown workload {kind!r}")
+
+    rows = run_suite(args.sizes, args.workloads, args.algorithms, args.seed, args.timeout, args.repeat)
+    failures = cost_mismatches(rows)
+    if args.baseline:
+        print(f"\n== compared with {args.baseline} ==")
+        failures += compare(rows, args.baseline)
+    if args.save:
+        save_baseline(args.save, rows, _meta(args))
+        print(f"\nbaseline saved to {args.save}")
+    for line in failures:
+        print("REGRESSION", line)
+    if args.baseline and not failures:
+        print("no regressions")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# run_individually/ga_engine.py
+from __future__ import annotations
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+import random
+
+import numpy as np
+
+"""
+Faster GENETIC-ALGORITHM engines (genetic_algorithm stays as the reference).
+
+genetic_algorithm_cached():
+    same population / fitness_fn / reproduce / mutate model, but
+    - fitness is computed once per distinct individual (dict cache),
+      optionally spread over a concurrent.futures executor
+      (ProcessPoolExecutor: fitness_fn must be a module-level function);
+    - all 2 * len(population) parents are drawn in one random.choices call;
+    - the best individual is tracked from the cached values, not re-scored;
+    - every random draw, including the default reproduce / mutate, comes
+      from rng, so a seeded random.Random makes a run reproducible.
+    The cache holds one entry per distinct individual scored and is
+    cleared whenever it exceeds max_cache entries (None: unbounded).
+
+vectorized_genetic_algorithm():
+    population is an int matrix (one row per individual), fitness is a
+    batch function over the whole matrix, and selection, crossover and
+    mutation are NumPy array operations over all rows at once.
+
+Both stop early when target fitness is reached (e.g. queens_max_fitness for
+N-queens); with target=None they run max_generations like the original.
+"""
+
+Individual = Hashable
+
+# ==========================
+# Cached / parallel fitness, batched selection
+# ==========================
+def evaluate_fitness(population: Sequence[Individual],
+                     fitness_fn: Callable[[Individual], float],
+                     cache: Dict[Individual, float],
+                     executor: Optional[Executor] = None,
+                     chunksize: int = 64) -> List[float]:
+    """Fitness of every individual; only individuals missing from cache are scored."""
+    missing = list({ind for ind in population if ind not in cache})
+    if missing:
+        if executor is None:
+            scores = map(fitness_fn, missing)
+        else:
+            scores = executor.map(fitness_fn, missing, chunksize=chunksize)
+        cache.update(zip(missing, scores))
+    return [cache[ind] for ind in population]
+
+def genetic_algorithm_cached(population: List[Individual],
+                             fitness_fn: Callable[[Individual], float],
+                             max_generations: int = 1000,
+                             mutation_rate: float = 0.01,
+                             target: Optional[float] = None,
+                             reproduce_fn: Optional[Callable[[Any, Any], Individual]] = None,
+                             mutate_fn: Optional[Callable[[Any], Individual]] = None,
+                             executor: Optional[Executor] = None,
+                             cache: Optional[Dict[Individual, float]] = None,
+                             max_cache: Optional[int] = 1_000_000,
+                             rng: Optional[random.Random] = None) -> Individual:
+    """
+    reproduce_fn / mutate_fn default to the string operators of
+    genetic_algorithm drawing from rng; pass custom ones built on the same
+    rng (e.g. make_tuple_mutate(n, rng)) to keep the run reproducible.
+    """
+    rng = rng or random.Random()
+    reproduce_fn = reproduce_fn or make_reproduce(rng)
+    mutate_fn = mutate_fn or make_string_mutate(rng)
+    cache = {} if cache is None else cache
+    n = len(population)
+
+    fitness_values = evaluate_fitness(population, fitness_fn, cache, executor)
+    best = max(zip(fitness_values, range(n)))
+    best_fitness, best_individual = best[0], population[best[1]]
+
+    for generation in range(max_generations):
+        if target is not None and best_fitness >= target:
+            break
+        total_fitness = sum(fitness_values)
+        weights = None if total_fitness == 0 else fitness_values  # None = uniform
+
+        parents = rng.choices(population, weights, k=2 * n)
+        new_population = []
+        for k in range(n):
+            child = reproduce_fn(parents[2 * k], parents[2 * k + 1])
+            if rng.random() < mutation_rate:
+                child = mutate_fn(child)
+            new_population.append(child)
+        population = new_population
+
+        if max_cache is not None and len(cache) > max_cache:
+            cache.clear()
+        fitness_values = evaluate_fitness(population, fitness_fn, cache, executor)
+        f, i = max(zip(fitness_values, range(n)))
+        if f > best_fitness:
+            best_fitness, best_individual = f, population[i]
+
+    return best_individual
+
+
+# ==========================
+# NumPy population matrix
+# ==========================
+def next_generation(population: np.ndarray, fitness: np.ndarray, rng: np.random.Generator,
+                    mutation_rate: float, gene_low: int, gene_high: int) -> np.ndarray:
+    """Fitness-proportional selection, one-point crossover and mutation for all rows at once."""
+    P, n = population.shape
+    total = fitness.sum()
+    p = None if total == 0 else fitness / total
+    parents = rng.choice(P, size=(P, 2), p=p)
+
+    # one-point crossover: genes before c from parent1, the rest from parent2
+    c = rng.integers(1, n, size=P) if n > 1 else np.zeros(P, dtype=np.int64)
+    children = np.where(np.arange(n) < c[:, None], population[parents[:, 0]], population[parents[:, 1]])
+
+    # mutation: one random gene of each selected child
+    hit = np.nonzero(rng.random(P) < mutation_rate)[0]
+    if hit.size:
+        children[hit, rng.integers(0, n, size=hit.size)] = rng.integers(gene_low, gene_high + 1, size=hit.size)
+    return children
+
+def vectorized_genetic_algorithm(population: np.ndarray,
+                                 fitness_batch: Callable[[np.ndarray], np.ndarray],
+                                 max_generations: int = 1000,
+                                 mutation_rate: float = 0.01,
+                                 gene_low: int = 1,
+                                 gene_high: Optional[int] = None,
+                                 target: Optional[float] = None,
+                                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    population: (P, n) integer array, genes in [gene_low, gene_high]
+    (default gene_high = n, i.e. N-queens rows 1..n).
+    fitness_batch: (P, n) -> (P,) fitness array.
+    Returns the best row seen.
+    """
+    rng = rng or np.random.default_rng()
+    gene_high = population.shape[1] if gene_high is None else gene_high
+
+    fitness = np.asarray(fitness_batch(population), dtype=np.float64)
+    i = int(fitness.argmax())
+    best_fitness, best_individual = fitness[i], population[i].copy()
+
+    for generation in range(max_generations):
+        if target is not None and best_fitness >= target:
+            break
+        population = next_generation(population, fitness, rng, mutation_rate, gene_low, gene_high)
+        fitness = np.asarray(fitness_batch(population), dtype=np.float64)
+        i = int(fitness.argmax())
+        if fitness[i] > best_fitness:
+            best_fitness, best_individual = fitness[i], population[i].copy()
+
+    return best_individual
+
+
+# ==========================
+# N-queens helpers (same fitness as queens_fitness)
+# ==========================
+def queens_max_fitness(n: int) -> int:
+    """Fitness of a solution under queens_fitness (its max_pairs)."""
+    return n * (n - 1)
+
+def queens_fitness_batch(population: np.ndarray, chunk: Optional[int] = None) -> np.ndarray:
+    """
+    queens_fitness for every row of a (P, n) matrix in O(P * n).
+    Attacking pairs are counted per line instead of per pair: a row or
+    diagonal holding c queens contributes c * (c - 1) / 2 pairs.
+    Rows are scored chunk at a time (default: ~4M counters per chunk).
+    """
+    P, n = population.shape
+    cols = np.arange(n)
+    width = 2 * n + 1                      # values 1..n, diagonals q - i + n and q + i fit in [0, 2n]
+    chunk = chunk or max(1, (1 << 22) // width)
+    out = np.empty(P, dtype=np.int64)
+    for lo in range(0, P, chunk):
+        q = population[lo:lo + chunk].astype(np.int64)
+        m = q.shape[0]
+        base = (np.arange(m) * width)[:, None]
+        attacks = np.zeros(m, dtype=np.int64)
+        for line in (q, q - cols + n, q + cols):
+            c = np.bincount((base + line).ravel(), minlength=m * width).reshape(m, width)
+            attacks += (c * (c - 1) // 2).sum(axis=1)
+        out[lo:lo + chunk] = n * (n - 1) - attacks
+    return out
+
+def random_queens_population(pop_size: int, n: int, seed: Optional[int] = None) -> np.ndarray:
+    return np.random.default_rng(seed).integers(1, n + 1, size=(pop_size, n))
+
+def make_reproduce(rng: Optional[random.Random] = None) -> Callable[[Any, Any], Any]:
+    """genetic_algorithm.reproduce (one-point crossover) drawing from rng."""
+    rng = rng or random
+    def reproduce(parent1: Any, parent2: Any) -> Any:
+        c = rng.randint(1, len(parent1) - 1)
+        return parent1[:c] + parent2[c:]
+    return reproduce
+
+def make_string_mutate(rng: Optional[random.Random] = None) -> Callable[[str], str]:
+    """genetic_algorithm.mutate (one gene set to a row 1..8) drawing from rng."""
+    rng = rng or random
+    def mutate(individual: str) -> str:
+        idx = rng.randint(0, len(individual) - 1)
+        return individual[:idx] + str(rng.randint(1, 8)) + individual[idx + 1:]
+    return mutate
+
+def make_tuple_mutate(n: int, rng: Optional[random.Random] = None) -> Callable[[tuple], tuple]:
+    """mutate() for tuple-of-int queens (rows 1..n); the string mutate only knows 1..8."""
+    rng = rng or random
+    def mutate_tuple(individual: tuple) -> tuple:
+        idx = rng.randint(0, n - 1)
+        return individual[:idx] + (rng.randint(1, n),) + individual[idx + 1:]
+    return mutate_tuple
+
+
+if __name__ == "__main__":
+    n, pop_size = 8, 30
+    rng = random.Random(0)
+    population = ["".join(str(rng.randint(1, 8)) for _ in range(n)) for _ in range(pop_size)]
+    from run_individually.genetic_algorithm import queens_fitness
+    solution = genetic_algorithm_cached(population, queens_fitness, target=queens_max_fitness(n), rng=rng)
+    print("Cached GA solution:", solution, "fitness:", queens_fitness(solution))
+
+    best = vectorized_genetic_algorithm(random_queens_population(1000, n, seed=0), queens_fitness_batch,
+                                        mutation_rate=0.2, target=queens_max_fitness(n),
+                                        rng=np.random.default_rng(0))
+    print("Vectorised GA solution:", best.tolist(), "fitness:", int(queens_fitness_batch(best[None, :])[0]))
@@ -1,6 +1,8 @@
 import random
 
-def genetic_algorithm(population, fitness_fn, max_generations=1000, mutation_rate=0.01):
+def genetic_algorithm(population, fitness_fn, max_generations=1000, mutation_rate=0.01, target=None):
+    # target: stop as soon as an individual reaches this fitness (None = run all generations)
+    # multi-process version: island_ga.island_genetic_algorithm
 
     for generation in range(max_generations):
         # 1 compute fitness weights for weighted random selection
@@ -32,9 +34,10 @@ def genetic_algorithm(population, fitness_fn, max_generations=1000, mutation_rat
         population = new_population
 
         # 6. stop if someone is fit enough
-        best_individual = max(population, key=fitness_fn)
-        if fitness_fn(best_individual) == max(fitness_values):
-            pass
+        if target is not None:
+            best_individual = max(population, key=fitness_fn)
+            if fitness_fn(best_individual) >= target:
+                return best_individual
 
     return max(population, key=fitness_fn)
 
@@ -77,7 +80,7 @@ if __name__ == "__main__":
         individual = "".join(str(random.randint(1, 8)) for _ in range(8))
         population.append(individual)
 
-    solution = genetic_algorithm(population, queens_fitness)
+    solution = genetic_algorithm(population, queens_fitness, target=8 * 7)
 
     print("Solution:", solution)
     print("Fitness:", queens_fitness(solution))
\ No newline at end of file
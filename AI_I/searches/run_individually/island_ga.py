@@ -0,0 +1,152 @@
+# run_individually/island_ga.py
+from __future__ import annotations
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+from typing import Any, Callable, Dict, Optional, Tuple
+import multiprocessing as mp
+import time
+
+import numpy as np
+
+from run_individually.ga_engine import next_generation, queens_fitness_batch, queens_max_fitness, random_queens_population
+
+"""
+Island-model GENETIC-ALGORITHM: K populations evolve in K processes.
+
+All populations live in one shared-memory block of shape (K, P, n), with
+their fitness in a (K, P) block, so migration and the final result need
+no pickling of populations. Each worker runs the vectorised generation
+step from ga_engine on its own slice.
+
+Every `migration_interval` generations the islands meet at a barrier and
+island k copies the `migrants` best individuals of island k-1 (a ring)
+over its own worst ones. When any island reaches `target` it sets a
+shared stop event and aborts the barrier, so every other island stops at
+its next generation instead of running out max_generations.
+
+fitness_batch must be a module-level function (it is sent to the workers).
+"""
+
+def _attach(name: str, shape: Tuple[int, ...], dtype: Any) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _island_worker(k: int, names: Dict[str, str], shape: Tuple[int, int, int],
+                   fitness_batch: Callable[[np.ndarray], np.ndarray],
+                   max_generations: int, mutation_rate: float, gene_low: int, gene_high: int,
+                   migration_interval: int, migrants: int, target: Optional[float], seed: Optional[int],
+                   barrier: Any, stop: Any) -> None:
+    K, P, n = shape
+    shm_pop, pops = _attach(names["population"], shape, np.int64)
+    shm_fit, fits = _attach(names["fitness"], (K, P), np.float64)
+    shm_gen, gens = _attach(names["generations"], (K,), np.int64)
+    rng = np.random.default_rng(None if seed is None else [seed, k])
+    pop, fit = pops[k], fits[k]
+    try:
+        fit[:] = fitness_batch(pop)
+        for generation in range(1, max_generations + 1):
+            if stop.is_set():
+                break
+            pop[:] = next_generation(pop, fit, rng, mutation_rate, gene_low, gene_high)
+            fit[:] = fitness_batch(pop)
+            gens[k] = generation
+            if target is not None and fit.max() >= target:
+                stop.set()
+                barrier.abort()
+                break
+
+            if K > 1 and migrants and generation % migration_interval == 0:
+                barrier.wait()                         # every island has written this generation
+                src = (k - 1) % K
+                top = np.argpartition(fits[src], -migrants)[-migrants:]
+                incoming, incoming_fit = pops[src][top].copy(), fits[src][top].copy()
+                barrier.wait()                         # every island has read its migrants
+                worst = np.argpartition(fit, migrants)[:migrants]
+                pop[worst], fit[worst] = incoming, incoming_fit
+    except BrokenBarrierError:
+        pass                                           # another island hit the target
+    except BaseException:
+        stop.set()                                     # don't leave the other islands at the barrier
+        barrier.abort()
+        raise
+    finally:
+        del pop, fit, pops, fits, gens
+        for shm in (shm_pop, shm_fit, shm_gen):
+            shm.close()
+
+def island_genetic_algorithm(populations: np.ndarray,
+                             fitness_batch: Callable[[np.ndarray], np.ndarray],
+                             max_generations: int = 1000,
+                             mutation_rate: float = 0.01,
+                             migration_interval: int = 10,
+                             migrants: int = 2,
+                             target: Optional[float] = None,
+                             gene_low: int = 1,
+                             gene_high: Optional[int] = None,
+                             seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    populations: (K, P, n) int array, one (P, n) population per island.
+    Returns {"best", "fitness", "island", "generations" (per island),
+             "evaluations", "seconds"}.
+    """
+    K, P, n = populations.shape
+    gene_high = n if gene_high is None else gene_high
+    migrants = min(migrants, P)
+    blocks = {"population": populations.astype(np.int64).nbytes,
+              "fitness": K * P * 8,
+              "generations": K * 8}
+    shms = {key: shared_memory.SharedMemory(create=True, size=max(1, size)) for key, size in blocks.items()}
+    try:
+        pops = np.ndarray((K, P, n), dtype=np.int64, buffer=shms["population"].buf)
+        fits = np.ndarray((K, P), dtype=np.float64, buffer=shms["fitness"].buf)
+        gens = np.ndarray((K,), dtype=np.int64, buffer=shms["generations"].buf)
+        pops[:] = populations
+        fits[:] = -np.inf
+        gens[:] = 0
+
+        names = {key: shm.name for key, shm in shms.items()}
+        barrier, stop = mp.Barrier(K), mp.Event()
+        workers = [mp.Process(target=_island_worker,
+                              args=(k, names, (K, P, n), fitness_batch, max_generations, mutation_rate,
+                                    gene_low, gene_high, migration_interval, migrants, target, seed,
+                                    barrier, stop))
+                   for k in range(K)]
+        t0 = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        seconds = time.perf_counter() - t0
+        failed = [w.exitcode for w in workers if w.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"island worker exited with code {failed[0]}")
+
+        island, row = np.unravel_index(int(fits.argmax()), fits.shape)
+        result = {
+            "best": pops[island, row].copy(),
+            "fitness": float(fits[island, row]),
+            "island": int(island),
+            "generations": gens.tolist(),
+            "evaluations": int((gens + 1).sum()) * P,
+            "seconds": seconds,
+        }
+        del pops, fits, gens
+        return result
+    finally:
+        for shm in shms.values():
+            shm.close()
+            shm.unlink()
+
+
+def run_island_demo(n: int = 8, islands: int = 4, pop_size: int = 200, seed: int = 0) -> None:
+    populations = np.stack([random_queens_population(pop_size, n, seed=seed + k) for k in range(islands)])
+    result = island_genetic_algorithm(populations, queens_fitness_batch, max_generations=2000,
+                                      mutation_rate=0.2, target=queens_max_fitness(n), seed=seed)
+    print(f"Island GA, {n}-queens, {islands} islands x {pop_size}:")
+    print("Solution:", result["best"].tolist())
+    print("Fitness:", result["fitness"], "of", queens_max_fitness(n))
+    print("Generations per island:", result["generations"], f"({result['seconds']:.2f}s)")
+
+
+if __name__ == "__main__":
+    run_island_demo()
@@ -0,0 +1,159 @@
+# run_individually/queens_board.py
+from __future__ import annotations
+from typing import List, Optional, Sequence
+import random
+
+"""
+N-queens individual with O(1) fitness and O(1) incremental updates.
+
+A QueensBoard keeps, next to the genes (queens[i] = row of the queen in
+column i, rows 1..n), how many queens sit on every row and on every
+diagonal, plus the running number of attacking pairs. Moving one queen
+changes three counters on the old lines and three on the new ones, so
+    fitness   O(1)  (same value as queens_fitness: n*(n-1) - attacks)
+    mutate    O(1)  (one gene)
+    reproduce O(min(c, n-c)) gene moves on top of an O(n) counter copy,
+              starting from the parent that contributes more genes.
+This makes the GA practical for N in the thousands, where the pairwise
+queens_fitness is O(n^2) per call. For scoring whole NumPy populations
+see ga_engine.queens_fitness_batch.
+"""
+
+class QueensBoard:
+    __slots__ = ("n", "queens", "rows", "diag", "anti", "attacks")
+
+    def __init__(self, queens: Sequence[int]):
+        n = self.n = len(queens)
+        self.queens: List[int] = [int(q) for q in queens]
+        self.rows = [0] * (n + 1)          # row r in 1..n
+        self.diag = [0] * (2 * n + 1)      # r - i + n
+        self.anti = [0] * (2 * n + 1)      # r + i
+        self.attacks = 0
+        for i, r in enumerate(self.queens):
+            self._add(i, r)
+
+    @classmethod
+    def random(cls, n: int, rng: Optional[random.Random] = None) -> "QueensBoard":
+        rng = rng or random
+        return cls([rng.randint(1, n) for _ in range(n)])
+
+    def copy(self) -> "QueensBoard":
+        twin = object.__new__(QueensBoard)
+        twin.n, twin.attacks = self.n, self.attacks
+        twin.queens, twin.rows = self.queens[:], self.rows[:]
+        twin.diag, twin.anti = self.diag[:], self.anti[:]
+        return twin
+
+    # ---------- counters ----------
+    def _add(self, i: int, r: int) -> None:
+        d, a = r - i + self.n, r + i
+        self.attacks += self.rows[r] + self.diag[d] + self.anti[a]
+        self.rows[r] += 1
+        self.diag[d] += 1
+        self.anti[a] += 1
+
+    def _remove(self, i: int, r: int) -> None:
+        d, a = r - i + self.n, r + i
+        self.rows[r] -= 1
+        self.diag[d] -= 1
+        self.anti[a] -= 1
+        self.attacks -= self.rows[r] + self.diag[d] + self.anti[a]
+
+    def move(self, i: int, r: int) -> int:
+        """Put the queen of column i on row r; returns the fitness delta."""
+        old = self.queens[i]
+        if old == r:
+            return 0
+        before = self.attacks
+        self._remove(i, old)
+        self._add(i, r)
+        self.queens[i] = r
+        return before - self.attacks
+
+    def delta(self, i: int, r: int) -> int:
+        """Fitness change move(i, r) would make, without making it."""
+        old = self.queens[i]
+        if old == r:
+            return 0
+        n = self.n
+        # old and new squares share a column, so they share no row or diagonal
+        gone = (self.rows[old] - 1) + (self.diag[old - i + n] - 1) + (self.anti[old + i] - 1)
+        came = self.rows[r] + self.diag[r - i + n] + self.anti[r + i]
+        return gone - came
+
+    # ---------- fitness ----------
+    @property
+    def fitness(self) -> int:
+        return self.n * (self.n - 1) - self.attacks
+
+    def is_solution(self) -> bool:
+        return self.attacks == 0
+
+    def __str__(self) -> str:
+        return "".join(map(str, self.queens)) if self.n < 10 else str(self.queens)
+
+
+# ==========================
+# GA operators on boards
+# ==========================
+def mutate_board(board: QueensBoard, rng: Optional[random.Random] = None) -> QueensBoard:
+    """mutate(): one random column gets a random row; the input board is updated in place."""
+    rng = rng or random
+    board.move(rng.randrange(board.n), rng.randint(1, board.n))
+    return board
+
+def reproduce_boards(parent1: QueensBoard, parent2: QueensBoard,
+                     rng: Optional[random.Random] = None) -> QueensBoard:
+    """reproduce(): parent1[:c] + parent2[c:], built from the parent that contributes more genes."""
+    rng = rng or random
+    n = parent1.n
+    c = rng.randint(1, n - 1)
+    if c >= n - c:
+        child, donor, cols = parent1.copy(), parent2.queens, range(c, n)
+    else:
+        child, donor, cols = parent2.copy(), parent1.queens, range(c)
+    for i in cols:
+        child.move(i, donor[i])
+    return child
+
+def queens_genetic_algorithm(n: int,
+                             pop_size: int = 100,
+                             max_generations: int = 1000,
+                             mutation_rate: float = 0.01,
+                             target: Optional[int] = None,
+                             rng: Optional[random.Random] = None,
+                             population: Optional[List[QueensBoard]] = None) -> QueensBoard:
+    """
+    GENETIC-ALGORITHM for N-queens on QueensBoards: fitness is read from the
+    counters, parents are drawn in one batch. target defaults to a solution.
+    """
+    rng = rng or random.Random()
+    target = n * (n - 1) if target is None else target
+    if population is None:
+        population = [QueensBoard.random(n, rng) for _ in range(pop_size)]
+    best = max(population, key=lambda b: b.fitness).copy()
+
+    for generation in range(max_generations):
+        if best.fitness >= target:
+            break
+        weights = [b.fitness for b in population]
+        if sum(weights) == 0:
+            weights = None
+        parents = rng.choices(population, weights, k=2 * len(population))
+        new_population = []
+        for k in range(len(population)):
+            child = reproduce_boards(parents[2 * k], parents[2 * k + 1], rng)
+            if rng.random() < mutation_rate:
+                mutate_board(child, rng)
+            new_population.append(child)
+        population = new_population
+        leader = max(population, key=lambda b: b.fitness)
+        if leader.fitness > best.fitness:
+            best = leader.copy()
+    return best
+
+
+if __name__ == "__main__":
+    solution = queens_genetic_algorithm(8, pop_size=100, mutation_rate=0.2, rng=random.Random(0))
+    print("Solution:", solution)
+    print("Fitness:", solution.fitness)
@@ -0,0 +1,17 @@
+# tests/test_batch_queries.py
+from ai_searches.a_star_data import GridProblem
+from ai_searches.batch_queries import BatchSearcher, intern_problem, run_batch
+from ai_searches.csr_graph import csr_ucs
+
+
+def test_batch_shares_the_graph_buffers_with_csr_queries():
+    graph = intern_problem(GridProblem(6, 6, [(1, 1), (2, 3), (4, 2)], (0, 0), (5, 5)))
+    assert BatchSearcher(graph).buffers is graph._buffers()
+    pairs = [((0, 0), (5, 5)), ((0, 0), (3, 3)), ((5, 0), (0, 5))]
+    result = run_batch(graph, pairs)
+    for i, (a, b) in enumerate(pairs):
+        single = csr_ucs(graph, a, b)
+        assert result.cost[i] == single.cost
+        assert result.path(i)[0] == a and result.path(i)[-1] == b and len(result.path(i)) == len(single.labels)
+    buffers = graph._buffers()
+    assert len(buffers.touched) == 0 and not any(buffers.mark)
@@ -0,0 +1,18 @@
+# tests/test_breadth_first_search.py
+from ai_searches import best_first_search as bfs_module, uninformed_cost_search
+from ai_searches.breadth_first_search import best_first_search, uniform_cost_search
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.search_stats import SearchStats
+
+
+def test_ucs_and_best_first_are_the_indexed_heap_versions():
+    assert uniform_cost_search is uninformed_cost_search.uniform_cost_search
+    assert best_first_search is bfs_module.best_first_search
+
+
+def test_ucs_frontier_is_observed():
+    p = OccupancyGridProblem.from_walls(30, 30, [], start=(0, 0), goal=(29, 29))
+    stats = SearchStats(timing=False)
+    assert uniform_cost_search(p, stats=stats).path_cost == 58
+    assert stats.counters["frontier_pushes"] == 900
+    assert stats.counters["reexpanded"] == 0
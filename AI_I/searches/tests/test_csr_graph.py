@@ -0,0 +1,69 @@
+# tests/test_csr_graph.py
+from ai_searches.csr_graph import CSRGraph, CSRProblem, csr_a_star, csr_bfs, csr_dfs, csr_ucs
+from ai_searches.dfs import dfs_iterative, dfs_recursive
+from ai_searches.search_stats import SearchStats
+from ai_searches.ucs_data import SimpleGraphProblem, build_sample_graph
+
+
+def _chain(n):
+    # 0 - 1 - ... - (n-1), plus a costly shortcut 0 -> n-1
+    return CSRGraph.from_edges([(i, i + 1, 1.0) for i in range(n - 1)] + [(0, n - 1, 2 * n)],
+                               labels=range(n))
+
+
+def test_callable_h_is_evaluated_lazily_once_per_node():
+    graph = _chain(1000)
+    calls = []
+
+    def h(v):
+        calls.append(v)
+        return 0.0
+
+    assert csr_a_star(graph, 0, 10, h).cost == 10
+    assert len(calls) == len(set(calls)) < 20
+
+
+def test_buffers_are_reset_between_queries():
+    graph = CSRGraph.from_dict(build_sample_graph())
+    for _ in range(2):
+        assert csr_ucs(graph, "A", "G").labels == ["A", "B", "D", "G"]
+        assert csr_a_star(graph, "A", "G", [0.0] * graph.n_nodes).cost == 4
+        assert csr_bfs(graph, "A", "G").labels == ["A", "B", "D", "G"]
+        assert csr_dfs(graph, "A", "G").labels[-1] == "G"
+        assert csr_ucs(graph, "G", "A").cost == 4
+
+
+def test_integer_cost_bound_is_cached(monkeypatch):
+    graph = CSRGraph.from_dict(build_sample_graph())
+    problem = CSRProblem(graph, "A", "G")
+    assert problem.integer_cost_bound() == 5
+    monkeypatch.setattr(graph, "weights", None)  # a second scan would fail
+    assert problem.integer_cost_bound() == 5
+    assert SimpleGraphProblem(build_sample_graph(), "A", "G").integer_cost_bound() == 5
+
+
+def test_stats_report_the_loop_counts():
+    graph = CSRGraph.from_dict(build_sample_graph())
+    stats = SearchStats()
+    for search in (csr_bfs, csr_dfs, csr_ucs):
+        result = search(graph, "A", "G", stats=stats)
+        assert stats.algorithm == search.__name__
+        assert stats.found and stats.cost == result.cost and stats.depth == len(result.labels) - 1
+        assert stats.counters["expanded"] == result.expanded
+        assert stats.counters["generated"] >= stats.counters["expanded"] > 0
+        assert stats.counters["frontier_pushes"] >= stats.counters["peak_frontier"] > 0
+    plain = {}
+    csr_a_star(graph, "A", "G", lambda v: 0.0, stats=plain)
+    assert plain["expanded"] > 0 and plain["h_calls"] > 0
+
+
+def test_dfs_stats():
+    graph = {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []}
+    for search in (dfs_recursive, dfs_iterative):
+        stats = SearchStats()
+        res = search(graph, "A", "D", stats=stats)
+        assert res["path"] == ["A", "B", "D"]
+        assert stats.found and stats.depth == 2
+        assert stats.counters["expanded"] == 2 and stats.counters["generated"] == 3
+        assert search(graph, "A", "Z", stats=stats)["path"] == ["A"]
+        assert not stats.found and stats.counters["expanded"] == 4
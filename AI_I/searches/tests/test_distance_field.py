@@ -0,0 +1,26 @@
+# tests/test_distance_field.py
+import math
+
+from ai_searches.a_star import a_star_search
+from ai_searches.distance_field import dijkstra_distance_field, distance_field
+from ai_searches.occupancy_grid import OccupancyGridProblem
+
+
+def _walled_off():
+    # row 2 is all wall: (0, 0) cannot reach (3, 3)
+    return OccupancyGridProblem.from_walls(4, 4, [(2, c) for c in range(4)], start=(0, 0), goal=(3, 3))
+
+
+def test_disconnected_field_is_inf_and_a_star_returns_none():
+    p = _walled_off()
+    for field in (distance_field(p), dijkstra_distance_field(p)):
+        assert math.isinf(field(p.initial))
+        assert field.descend(p, p.initial) == []
+        assert a_star_search(p, field) is None
+
+
+def test_connected_field_is_exact():
+    p = OccupancyGridProblem.from_walls(4, 4, [(1, 1), (1, 2), (2, 1)], start=(0, 0), goal=(3, 3))
+    field = distance_field(p)
+    node = a_star_search(p, field)
+    assert node.path_cost == field(p.initial) == 6
@@ -0,0 +1,23 @@
+# tests/test_frontiers.py
+import math
+
+from ai_searches.a_star import a_star_search
+from ai_searches.distance_field import grid_distance_field
+from ai_searches.frontiers import BucketQueue
+from ai_searches.occupancy_grid import OccupancyGridProblem
+
+
+def test_bucket_queue_non_finite_priorities_spill_to_heap():
+    q = BucketQueue()
+    q.push("a", 3)
+    q.push("b", math.inf)
+    q.push("c", 1)
+    assert len(q) == 3 and q.pushes == 3
+    assert [q.pop()[0] for _ in range(3)] == ["c", "a", "b"]
+    assert len(q) == 0
+
+
+def test_a_star_with_infinite_heuristic_returns_none():
+    # a wall row between start and goal: the distance field is inf at the start
+    p = OccupancyGridProblem.from_walls(3, 3, [(1, 0), (1, 1), (1, 2)], start=(0, 0), goal=(2, 2))
+    assert a_star_search(p, grid_distance_field(p)) is None
@@ -0,0 +1,33 @@
+# tests/test_ga_engine.py
+import random
+
+from run_individually.ga_engine import genetic_algorithm_cached, make_tuple_mutate
+from run_individually.genetic_algorithm import queens_fitness
+
+
+def _strings(seed, k=30):
+    rng = random.Random(seed)
+    return ["".join(str(rng.randint(1, 8)) for _ in range(8)) for _ in range(k)]
+
+
+def test_seeded_rng_makes_default_operators_reproducible():
+    runs = [genetic_algorithm_cached(_strings(1), queens_fitness, max_generations=30, mutation_rate=0.5,
+                                     rng=random.Random(7)) for _ in range(2)]
+    assert runs[0] == runs[1]
+
+
+def test_seeded_rng_makes_tuple_mutate_reproducible():
+    population = [tuple(int(c) for c in s) for s in _strings(2)]
+
+    def run():
+        rng = random.Random(7)
+        return genetic_algorithm_cached(population, queens_fitness, max_generations=30, mutation_rate=0.5,
+                                        mutate_fn=make_tuple_mutate(8, rng), rng=rng)
+    assert run() == run()
+
+
+def test_cache_is_cleared_past_max_cache():
+    cache = {}
+    genetic_algorithm_cached(_strings(3), queens_fitness, max_generations=50, mutation_rate=1.0,
+                             cache=cache, max_cache=40, rng=random.Random(0))
+    assert len(cache) <= 40 + 30
@@ -0,0 +1,44 @@
+# tests/test_jump_point_search.py
+import pytest
+
+from ai_searches.a_star import a_star_search
+from ai_searches.a_star_data import GridProblem
+from ai_searches.jump_point_search import OctileGridProblem, jump_point_search
+from ai_searches.search_stats import SearchStats
+
+WALLS = [(1, 1), (1, 2), (2, 1), (3, 3)]
+
+
+def _octile(p):
+    gr, gc = p.goal
+    return lambda s: max(abs(s[0] - gr), abs(s[1] - gc)) + 0.41421356 * min(abs(s[0] - gr), abs(s[1] - gc))
+
+
+def _manhattan(p):
+    gr, gc = p.goal
+    return lambda s: abs(s[0] - gr) + abs(s[1] - gc)
+
+
+@pytest.mark.parametrize("cls, h", [(GridProblem, _manhattan), (OctileGridProblem, _octile)])
+@pytest.mark.parametrize("start, goal", [((0, 0), (4, 4)), ((1, 1), (4, 4)), ((0, 0), (1, 2)),
+                                         ((3, 3), (3, 3)), ((1, 1), (3, 3))])
+def test_walled_endpoints_agree_with_a_star(cls, h, start, goal):
+    p = cls(5, 5, WALLS, start, goal)
+    expected = a_star_search(p, h(p))
+    result = jump_point_search(p)
+    if expected is None:
+        assert result is None
+    else:
+        assert result.path_cost == pytest.approx(expected.path_cost)
+        assert result.path()[0].state == start and result.state == goal
+
+
+def test_search_stats_counters_are_filled():
+    p = GridProblem(20, 20, [(r, 10) for r in range(15)], (0, 0), (19, 19))
+    stats = SearchStats(timing=False)
+    jump_point_search(p, stats=stats)
+    assert stats.found
+    assert stats.counters["expanded"] == stats["expanded"] > 0
+    assert stats.counters["generated"] == stats["scanned"] > 0
+    assert stats.counters["frontier_pushes"] == stats["pushed"] > 0
+    assert stats.counters["peak_frontier"] > 0
@@ -0,0 +1,19 @@
+# tests/test_node_pool.py
+from ai_searches.node_pool import NO_PARENT, NodePool, pooled_best_first_search
+from ai_searches.occupancy_grid import OccupancyGridProblem
+
+
+def test_depth_column_matches_parent_chain():
+    pool = NodePool(capacity=1)  # forces the columns to grow
+    root = pool.add(pool.intern_state("a"), NO_PARENT, NO_PARENT, 0.0)
+    child = pool.add(pool.intern_state("b"), root, pool.intern_action("x"), 1.0)
+    grandchild = pool.add(pool.intern_state("c"), child, pool.intern_action("y"), 2.0)
+    assert [pool.handle(i).depth for i in (root, child, grandchild)] == [0, 1, 2]
+    assert pool.handle(grandchild).to_node().depth == 2
+
+
+def test_pooled_search_depth_is_path_length():
+    p = OccupancyGridProblem.from_walls(4, 4, [(1, 1), (1, 2), (2, 1)], start=(0, 0), goal=(3, 3))
+    h = p.manhattan_heuristic()
+    node = pooled_best_first_search(p, priority=lambda s, g: g + h(s))
+    assert node.depth == len(node.path()) - 1 == 6
@@ -0,0 +1,30 @@
+# tests/test_recursive_best_first_search.py
+import pytest
+
+from ai_searches.occupancy_grid import OccupancyGridProblem
+from ai_searches.recursive_best_first_search import (
+    iterative_recursive_best_first_search,
+    recursive_best_first_search,
+    recursive_best_first_search_tt,
+)
+
+SEARCHES = [
+    lambda p, h: recursive_best_first_search(p, h),
+    lambda p, h: recursive_best_first_search_tt(p, h),
+    lambda p, h: recursive_best_first_search_tt(p, h, table_size=64),
+    lambda p, h: iterative_recursive_best_first_search(p, h),
+    lambda p, h: iterative_recursive_best_first_search(p, h, table_size=64),
+]
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_unsolvable_grid_returns_none(search):
+    # row 2 is all wall: (0, 0) cannot reach (3, 3)
+    p = OccupancyGridProblem.from_walls(4, 4, [(2, c) for c in range(4)], start=(0, 0), goal=(3, 3))
+    assert search(p, p.manhattan_heuristic()) is None
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+def test_solvable_grid_is_optimal(search):
+    p = OccupancyGridProblem.from_walls(4, 4, [(1, 1), (1, 2), (2, 1)], start=(0, 0), goal=(3, 3))
+    assert search(p, p.manhattan_heuristic()).path_cost == 6